@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+
+import argparse
+import importlib
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+# ─── Configuration ────────────────────────────────────────────────────────────
+
+SCALES  = [1000, 10000, 100000]
+SOURCES = ["troves", "usdm", "lending", "lp"]
+
+# Streamed output only: the legacy JSON views would dominate memory at scale
+FORMATS = ["ndjson"]
+
+REPO = os.path.dirname(os.path.abspath(__file__))
+
+# ─── Child Run ────────────────────────────────────────────────────────────────
+#
+# Every measured run is a fresh `bench.py _run` process in an empty working
+# directory, so caches and indexes start cold and its peak RSS is its own.
+
+def run_child(args):
+    """Points every script at the stand-in server, runs snapshot.py and writes the timings."""
+    os.chdir(args.workdir)
+    random.seed(0)  # spot-check samples must repeat for a recorded run to replay
+
+    import lending
+    import snapshot
+    import usdm
+    from utils import instrument
+
+    lending.RPC_URLS = [args.rpc]
+    usdm.RPC_URLS = [args.rpc]
+    if args.start_block is not None:
+        lending.DEPLOY_BLOCK = args.start_block
+        usdm.USDM_START_BLOCK = args.start_block
+    for name in snapshot.LP_MODULES:
+        module = importlib.import_module(name)
+        module.GRAPHQL_URL = args.graphql
+        module.RPC_URLS = [args.rpc]
+        if args.position_manager:
+            module.POSITION_MANAGER_ADDRESS = args.position_manager
+
+    start = time.perf_counter()
+    snapshot.main(args.snapshot_args)
+    wall = time.perf_counter() - start
+
+    report = instrument.METRICS.report()
+    with open(args.result, "w") as f:
+        json.dump({"wall_s": wall, "rpc": report["rpc"], "stages": report["stages"]}, f)
+
+
+def measure(server, snapshot_args, start_block=None, position_manager=None, verbose=False):
+    """Runs snapshot.py with `snapshot_args` against `server`; returns wall time, call counts and peak RSS."""
+    from utils.replay_server import GRAPHQL_ROUTE, RPC_ROUTE
+
+    with tempfile.TemporaryDirectory(prefix="bench-") as workdir:
+        result_path = os.path.join(workdir, "result.json")
+        command = [
+            sys.executable, os.path.join(REPO, "bench.py"), "_run",
+            "--rpc", server.url(RPC_ROUTE), "--graphql", server.url(GRAPHQL_ROUTE),
+            "--workdir", workdir, "--result", result_path,
+        ]
+        if start_block is not None:
+            command += ["--start-block", str(start_block)]
+        if position_manager is not None:
+            command += ["--position-manager", position_manager]
+        command += ["--", *snapshot_args]
+
+        output = None if verbose else subprocess.DEVNULL
+        child = subprocess.Popen(command, stdout=output, stderr=output)
+        _, status, usage = os.wait4(child.pid, 0)
+        child.returncode = os.waitstatus_to_exitcode(status)
+        if child.returncode != 0:
+            raise RuntimeError(f"snapshot run failed with exit code {child.returncode} (rerun with --verbose)")
+
+        with open(result_path) as f:
+            result = json.load(f)
+
+    requests_ = sum(stat["calls"] for stat in result["rpc"].values())
+    calls = sum(stat["items"] for stat in result["rpc"].values())
+    return {
+        "wall_s": round(result["wall_s"], 3),
+        "rpc_requests": requests_,
+        "rpc_calls": calls,
+        "calls_per_s": round(calls / result["wall_s"], 1) if result["wall_s"] else None,
+        "retries": sum(stat["retries"] for stat in result["rpc"].values()),
+        # ru_maxrss is in KiB on Linux
+        "peak_rss_mb": round(usage.ru_maxrss / 1024, 1),
+        "stages": {name: stage["latency"]["total_s"] for name, stage in result["stages"].items()},
+    }
+
+# ─── Commands ─────────────────────────────────────────────────────────────────
+
+def snapshot_args(blocks, sources, extra=()):
+    return [str(block) for block in blocks] + ["--sources", *sources, "--formats", *FORMATS, *extra]
+
+
+def print_row(label, result):
+    print(
+        f"{label:<28} {result['wall_s']:>9.2f} s {result['rpc_calls']:>9} calls "
+        f"{result['calls_per_s'] or 0:>10.1f}/s {result['retries']:>5} retries {result['peak_rss_mb']:>8.1f} MB"
+    )
+
+
+def cmd_record(args):
+    import lending
+    from utils.replay_server import FixtureStore, RecordingBackend, ReplayServer
+
+    graphql_url = importlib.import_module("taraswap-tara").GRAPHQL_URL
+    store = FixtureStore(args.fixture, mode="w")
+    store.add_meta(blocks=args.blocks, sources=args.sources)
+    with ReplayServer(RecordingBackend(store, lending.RPC_URLS[0], graphql_url)) as server:
+        result = measure(server, snapshot_args(args.blocks, args.sources), verbose=args.verbose)
+        print(server.summary(), file=sys.stderr)
+    store.close()
+    print_row("recorded (live)", result)
+    print(f"Recorded {len(store.responses)} responses to {args.fixture}", file=sys.stderr)
+
+
+def cmd_replay(args):
+    from utils.replay_server import FixtureStore, ReplayBackend, ReplayServer
+
+    store = FixtureStore(args.fixture)
+    results = []
+    backend = ReplayBackend(store)
+    with ReplayServer(backend, args.latency, args.jitter, args.error_rate, args.seed) as server:
+        for i in range(args.repeat):
+            result = measure(server, snapshot_args(store.meta["blocks"], store.meta["sources"]), verbose=args.verbose)
+            print_row(f"replay #{i + 1}", result)
+            results.append(result)
+        print(server.summary(), file=sys.stderr)
+    write_results(args.out, {"fixture": args.fixture, "runs": results})
+
+
+def synthetic_addresses():
+    """The scripts' own contract addresses, for a SyntheticChain to serve them at."""
+    import lending
+    import usdm
+
+    lp_modules = [importlib.import_module(name) for name in ["taraswap-tara", "taraswap-usdm"]]
+    return {
+        "trove_manager": usdm.TROVE_MANAGER_ADDRESS,
+        "usdm": usdm.USDM_TOKEN_ADDRESS,
+        "address_provider": lending.CONTRACTS["lendingPoolAddressProvider"],
+        "data_provider": lending.CONTRACTS["protocolDataProvider"],
+        "pools": lp_modules[0].POOL_ADDRESSES,
+        "pool_tokens": [module.TARGET_TOKEN for module in lp_modules],
+    }
+
+
+def cmd_synthetic(args):
+    import lending
+    from utils.replay_server import ReplayServer
+    from utils.synthetic_chain import SyntheticChain
+
+    addresses = synthetic_addresses()
+    results = []
+    for scale in args.scales:
+        print(f"Building synthetic chain with {scale} accounts per source...", file=sys.stderr)
+        chain = SyntheticChain(scale, addresses, start_block=lending.DEPLOY_BLOCK)
+        with ReplayServer(chain, args.latency, args.jitter, args.error_rate, args.seed) as server:
+            for source in args.sources:
+                extra = ["--lp-source", args.lp_source] if source == "lp" else []
+                result = measure(
+                    server, snapshot_args([chain.head], [source], extra),
+                    start_block=chain.start_block, position_manager=chain.position_manager, verbose=args.verbose,
+                )
+                print_row(f"{source} @ {scale}", result)
+                results.append(dict(result, source=source, scale=scale))
+            print(server.summary(), file=sys.stderr)
+    write_results(args.out, {"latency": args.latency, "jitter": args.jitter,
+                             "error_rate": args.error_rate, "runs": results})
+
+
+def cmd_reorg(args):
+    """
+    Follows USDM holders on a synthetic chain through one reorg: blocks with
+    mints are applied, replaced by a branch with different mints, rolled back
+    and re-applied. The followed state must then equal a full load at the new
+    head, which reads it through the transfer ledger instead. With `--gap`,
+    the new branch grows that many blocks beyond the reorg before the next
+    poll, as after a stalled loop, so the reorged blocks are already final.
+    """
+    import lending
+    import usdm
+    import watch
+    from utils.head_follower import HeadFollower
+    from utils.replay_server import RPC_ROUTE, ReplayServer
+    from utils.rpc_cache import close_cache
+    from utils.synthetic_chain import SyntheticChain, synthetic_address
+
+    if args.depth >= args.confirmations:
+        raise SystemExit("--depth must be below --confirmations, or the reorg is too deep to roll back")
+
+    chain = SyntheticChain(args.holders, synthetic_addresses(), start_block=lending.DEPLOY_BLOCK)
+    usdm.USDM_START_BLOCK = chain.start_block
+    old_branch = [chain.accounts[0]] + [synthetic_address("reorg", "old", i) for i in range(args.depth - 1)]
+    new_branch = [chain.accounts[1], synthetic_address("reorg", "new")]
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="bench-") as workdir, ReplayServer(chain) as server:
+        os.chdir(workdir)
+        try:
+            w3 = lending.get_provider([server.url(RPC_ROUTE)])
+            source = watch.HolderWatch(usdm.setup(w3))
+            changes = []
+            follower = HeadFollower(w3, [source], args.confirmations,
+                                    on_change=lambda block, *change: changes.append(block))
+            follower.start(chain.head)
+
+            for account in old_branch:
+                chain.mint_usdm(account, 10**18)
+            applied = follower.poll()
+            print(f"Applied {applied} blocks up to {follower.block}, {len(changes)} changes", file=sys.stderr)
+
+            chain.reorg(args.depth)
+            for account in new_branch:
+                chain.mint_usdm(account, 2 * 10**18)
+            chain.mine(args.depth + args.gap)
+            follower.poll()
+            print(f"Reorg of depth {args.depth}: {follower.rollbacks} rollback(s), followed the new branch "
+                  f"to block {follower.block}", file=sys.stderr)
+
+            expected = source.load(follower.block)
+            # The cache lives in the workdir, so it is closed before that goes
+            close_cache(w3)
+        finally:
+            os.chdir(cwd)
+
+    state = follower.state[source.name]
+    wrong = {account for account in state.keys() | expected.keys() if state.get(account) != expected.get(account)}
+    if follower.rollbacks != 1 or wrong:
+        raise SystemExit(f"FAILED: {follower.rollbacks} rollbacks, {len(wrong)} holders differ from a full load")
+    print(f"OK: followed state of {len(state)} holders matches a full load at block {follower.block}")
+
+
+def write_results(path, results):
+    if not path:
+        return
+    with open(path, "w") as f:
+        json.dump(results, f, indent=4)
+    print(f"Results written to {path}", file=sys.stderr)
+
+# ─── Main ─────────────────────────────────────────────────────────────────────
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Offline benchmarks of the snapshot sources against a local stand-in "
+                    "for the RPC node and the subgraph."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def network_options(command):
+        command.add_argument("--latency", type=float, default=0.0, help="seconds added to every request")
+        command.add_argument("--jitter", type=float, default=0.0, help="up to this many extra seconds per request")
+        command.add_argument("--error-rate", type=float, default=0.0,
+                             help="fraction of RPC requests answered with HTTP 429/503")
+        command.add_argument("--seed", type=int, default=0, help="seed for jitter and injected errors")
+        command.add_argument("--out", help="write the results here as JSON")
+        command.add_argument("--verbose", action="store_true", help="show the snapshot runs' own output")
+
+    record = commands.add_parser("record", help="run snapshot.py against the real endpoints and record every response")
+    record.add_argument("fixture", help="fixture file to write (NDJSON)")
+    record.add_argument("blocks", nargs="+", type=int)
+    record.add_argument("--sources", nargs="+", choices=SOURCES, default=SOURCES)
+    record.add_argument("--verbose", action="store_true", help="show the snapshot run's own output")
+
+    replay = commands.add_parser("replay", help="rerun a recorded snapshot against its fixture")
+    replay.add_argument("fixture")
+    replay.add_argument("--repeat", type=int, default=3)
+    network_options(replay)
+
+    synthetic = commands.add_parser("synthetic", help="benchmark every source against synthetic chains")
+    synthetic.add_argument("--scales", nargs="+", type=int, default=SCALES, help="accounts per source")
+    synthetic.add_argument("--sources", nargs="+", choices=SOURCES, default=SOURCES)
+    synthetic.add_argument(
+        "--lp-source", choices=["subgraph", "onchain"], default="subgraph",
+        help="read LP positions from the stand-in subgraph or from its position manager (default: subgraph)",
+    )
+    network_options(synthetic)
+
+    reorg = commands.add_parser(
+        "reorg", help="check that the watch mode rolls back and re-applies a reorg on a synthetic chain",
+    )
+    reorg.add_argument("--holders", type=int, default=1000, help="USDM holders on the chain")
+    reorg.add_argument("--depth", type=int, default=3, help="blocks replaced by the reorg")
+    reorg.add_argument("--confirmations", type=int, default=12, help="the follower's reorg depth")
+    reorg.add_argument("--gap", type=int, default=0, help="extra blocks mined on the new branch before polling")
+
+    child = commands.add_parser("_run")
+    child.add_argument("--rpc", required=True)
+    child.add_argument("--graphql", required=True)
+    child.add_argument("--workdir", required=True)
+    child.add_argument("--result", required=True)
+    child.add_argument("--start-block", type=int)
+    child.add_argument("--position-manager")
+    child.add_argument("snapshot_args", nargs=argparse.REMAINDER)
+
+    args = parser.parse_args(argv)
+    if args.command == "_run" and args.snapshot_args[:1] == ["--"]:
+        args.snapshot_args = args.snapshot_args[1:]
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    {"record": cmd_record, "replay": cmd_replay, "synthetic": cmd_synthetic, "reorg": cmd_reorg,
+     "_run": run_child}[args.command](args)
+
+
+if __name__ == "__main__":
+    main()
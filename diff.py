@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import sys
+from collections import Counter, defaultdict
+from decimal import Decimal
+
+from utils.snapshot_diff import diff_snapshots
+from utils.snapshot_entries import EXACT_CONTEXT, RUN_SIZE, SOURCES
+
+# ─── Main ─────────────────────────────────────────────────────────────────────
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compare two snapshots of the same source, account by account."
+    )
+    parser.add_argument("old", help="earlier snapshot file (.json or .ndjson)")
+    parser.add_argument("new", help="later snapshot file (.json or .ndjson)")
+    parser.add_argument(
+        "--source", choices=SOURCES,
+        help="snapshot source; detected from the file names unless they are "
+             "trove_snapshot_block_* files, which hold both troves and usdm",
+    )
+    parser.add_argument(
+        "--out", help="write the diff records here as NDJSON (default: stdout)",
+    )
+    parser.add_argument(
+        "--run-size", type=int, default=RUN_SIZE,
+        help=f"entries sorted in memory before spilling to disk (default: {RUN_SIZE})",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    try:
+        records = diff_snapshots(args.old, args.new, source=args.source, run_size=args.run_size)
+        out = open(args.out, "w") if args.out else sys.stdout
+
+        statuses = Counter()
+        net = defaultdict(Decimal)
+        try:
+            for record in records:
+                statuses[record["status"]] += 1
+                for field, change in record["fields"].items():
+                    net[field] = EXACT_CONTEXT.add(net[field], Decimal(change["delta"]))
+                out.write(json.dumps(record) + "\n")
+        finally:
+            if out is not sys.stdout:
+                out.close()
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(
+        f"\n{statuses['added']} added, {statuses['removed']} removed, {statuses['changed']} changed",
+        file=sys.stderr,
+    )
+    for field in sorted(net):
+        print(f"  net {field}: {net[field]:f}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import os
+import sys
+from collections import Counter
+
+from utils.addresses import checksum
+from utils.holder_join import discover, join_sources
+from utils.snapshot_entries import RUN_SIZE
+
+# ─── Main ─────────────────────────────────────────────────────────────────────
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Join every snapshot source of one block into one record per address."
+    )
+    parser.add_argument("block", type=int, help="snapshot block whose outputs are joined")
+    parser.add_argument("--dir", default="json", help="directory holding the snapshot files (default: json)")
+    parser.add_argument("--out", help="output NDJSON file (default: <dir>/holders_block_<block>.ndjson)")
+    parser.add_argument(
+        "--run-size", type=int, default=RUN_SIZE,
+        help=f"entries per input sorted in memory before spilling to disk (default: {RUN_SIZE})",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    inputs = discover(args.dir, args.block)
+    if not inputs:
+        print(f"ERROR: no snapshot files for block {args.block} in {args.dir}", file=sys.stderr)
+        sys.exit(1)
+    for label, path, _ in inputs:
+        print(f"  {label:<12} {path}", file=sys.stderr)
+
+    out_path = args.out or os.path.join(args.dir, f"holders_block_{args.block}.ndjson")
+    per_source = Counter()
+    per_count = Counter()
+    addresses = 0
+
+    with open(out_path + ".tmp", "w") as out:
+        for address, record in join_sources(inputs, run_size=args.run_size):
+            addresses += 1
+            per_source.update(record.keys())
+            per_count[len(record)] += 1
+            # Checksumming costs a keccak, so it is done once per address, here
+            row = {"address": checksum(address)}
+            for label, fields in record.items():
+                row[label] = {field: f"{value:f}" for field, value in fields.items()}
+            out.write(json.dumps(row) + "\n")
+    os.replace(out_path + ".tmp", out_path)
+
+    print(f"\nJoined {addresses} addresses into {out_path}", file=sys.stderr)
+    for label, _, _ in inputs:
+        print(f"  {label}: {per_source[label]} addresses", file=sys.stderr)
+    for n in sorted(per_count):
+        print(f"  in {n} source(s): {per_count[n]}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
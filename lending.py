@@ -1,39 +1,67 @@
+import itertools
 import json
 import os
 import sys
 from hexbytes import HexBytes
-from web3 import Web3, HTTPProvider
+from web3 import Web3
 import config.abis as abis
+from utils import instrument
+from utils.addresses import address_bytes, checksum
+from utils.balance_matrix import AddressTable, BalanceMatrix
+from utils.depositor_index import DepositorIndex
+from utils.logscan import LogScanner
+from utils.multicall import BatchCaller, MULTICALL3_ADDRESS, balance_of_calldata
+from utils.raw_call import RawFunction
+from utils.rpc_cache import RpcCache, close_cache, report
+from utils.rpc_pool import CachingPooledProvider
+from utils.snapshot_writer import DEFAULT_FORMATS, SnapshotWriter
 
 # ------------------------------------------
 # 1. Configuration
 # ------------------------------------------
-RPC_URLS = ["https://rpc.mainnet.taraxa.io"]
+RPC_URLS = ["https://rpc.mainnet.taraxa.io"]  # requests are spread over all of these
+RPC_CONCURRENCY = 8     # in-flight requests per endpoint
+RPC_RATE_LIMIT  = None  # requests per second per endpoint, None for no limit
 
 CONTRACTS = {
     "lendingPoolAddressProvider": "0x0EdbA5d821B9BCc1654aEf00F65188de636951fa",
     "protocolDataProvider":       "0x0208E7B745591f6c2F02B4DcF53B3e1f11c671df",
 }
 
+DEPLOY_BLOCK      = 16710850  # first block with LendingPool events
 BLOCK_INCREMENT   = 10000
+SCAN_WORKERS      = 8                   # concurrent eth_getLogs windows
+MULTICALL_ADDRESS = MULTICALL3_ADDRESS  # set to None to force JSON-RPC batches
+MULTICALL_BATCH   = 500                 # balanceOf reads per round trip
 BALANCE_BLOCK     = 19916232  # <-- scan stops here
 
 OUT_DEPOSITORS    = "json/depositors_all_reserves_taraxa.json"
-OUT_BALANCES      = f"json/lending_depositor_balances_block_{BALANCE_BLOCK}.json"
+OUT_BALANCES      = "json/lending_depositor_balances_block_{block}.json"
+OUT_BALANCE_ROWS  = "json/lending_balances_block_{block}"  # + .ndjson / .arrow / .parquet
+OUT_MATRIX        = "json/lending_balance_matrix_block_{block}.npz"  # None to skip
+OUTPUT_FORMATS    = DEFAULT_FORMATS     # any of json, ndjson, arrow, parquet
+SCAN_CHECKPOINT   = "json/depositor_scan_checkpoint.json"
+DEPOSITOR_INDEX   = "json/depositor_index.sqlite3"
+RPC_CACHE         = "json/rpc_cache.sqlite3"
+RPC_CACHE_BYTES   = 512 * 1024 * 1024
 
 # ------------------------------------------
 # 2. Helpers
 # ------------------------------------------
 def get_provider(rpcs):
-    for rpc in rpcs:
-        try:
-            w3 = Web3(HTTPProvider(rpc))
+    """One Web3 whose requests are spread over every endpoint in `rpcs`, behind the RPC cache."""
+    cache = RpcCache(RPC_CACHE, max_bytes=RPC_CACHE_BYTES)
+    w3 = Web3(CachingPooledProvider(
+        rpcs, cache, max_concurrency=RPC_CONCURRENCY, rate_limit=RPC_RATE_LIMIT
+    ))
+    try:
+        with instrument.stage("provider_connect"):
             _ = w3.eth.block_number
-            print(f"Successfully connected to RPC: {rpc}")
-            return w3
-        except Exception as e:
-            print(f"RPC failed ({rpc}): {e}", file=sys.stderr)
-    raise RuntimeError("All RPC endpoints failed.")
+    except Exception as e:
+        print(f"RPC failed ({', '.join(rpcs)}): {e}", file=sys.stderr)
+        raise RuntimeError("All RPC endpoints failed.") from e
+    print(f"Successfully connected to RPC: {', '.join(rpcs)}")
+    return w3
 
 
 def safe_write_json(data, filepath):
@@ -46,128 +74,255 @@ def safe_write_json(data, filepath):
 # ------------------------------------------
 def fetch_depositors_in_range(w3, contract_address, from_block, to_block):
     deposit_signature = "Deposit(address,address,address,uint256,uint16)"
-    deposit_topic     = w3.keccak(text=deposit_signature).hex()
-    all_depositors    = set()
+    deposit_topic     = Web3.to_hex(w3.keccak(text=deposit_signature))
 
-    for start in range(from_block, to_block + 1, BLOCK_INCREMENT):
-        end = min(start + BLOCK_INCREMENT - 1, to_block)
-        print(f"Scanning logs from {start} to {end}…")
-
-        logs = w3.eth.get_logs({
-            "fromBlock": start,
-            "toBlock":   end,
-            "address":   contract_address,
-        })
+    scanner = LogScanner(
+        w3, contract_address, [deposit_topic],
+        window=BLOCK_INCREMENT, workers=SCAN_WORKERS, checkpoint_path=SCAN_CHECKPOINT,
+    )
+    start, saved = scanner.resume(from_block)
+    # Depositors are kept as 20-byte keys while scanning; checkpoints hold them as hex
+    first_seen = {address_bytes(depositor): block for depositor, block in (saved or {}).items()}
 
+    def collect(logs):
         for log in logs:
-            if not log.get("topics"):
-                continue
-            if log["topics"][0].hex() != deposit_topic:
-                continue
-            if len(log["topics"]) < 3:
+            topics = log["topics"]
+            if len(topics) < 3:
                 continue
 
-            raw = log["topics"][2].hex()
-            depositor = Web3.to_checksum_address("0x" + raw[-40:])
-            all_depositors.add(depositor)
+            depositor = bytes(topics[2])[-20:]
+            if depositor not in first_seen:
+                first_seen[depositor] = log["blockNumber"]
+
+    def checkpoint_state():
+        return {"0x" + depositor.hex(): block for depositor, block in first_seen.items()}
+
+    scanner.scan(start, to_block, collect, get_state=checkpoint_state, checkpoint_from=from_block)
+    scanner.clear_checkpoint()
 
-    return all_depositors
+    # {checksum depositor: block of their first Deposit within the range},
+    # checksummed once per distinct depositor rather than once per log
+    return {checksum(depositor): block for depositor, block in first_seen.items()}
 
 # ------------------------------------------
 # 4. Main Workflow
 # ------------------------------------------
-def main():
-    w3 = get_provider(RPC_URLS)
+def setup(w3=None):
+    """
+    Connects (unless a provider is passed in) and resolves everything that does
+    not depend on the snapshot block: the LendingPool, the reserves, their
+    aToken/debt token contracts and decimals.
+    """
+    if w3 is None:
+        w3 = get_provider(RPC_URLS)
 
-    # Resolve LendingPool address
-    lp_provider = w3.eth.contract(
-        address=CONTRACTS["lendingPoolAddressProvider"],
-        abi=abis.lendingPoolAddressProvider()
-    )
-    lending_pool_addr = lp_provider.functions.getLendingPool().call()
-    print(f"LendingPool address resolved to: {lending_pool_addr}")
+    with instrument.stage("reserve_discovery") as span:
+        # Resolve LendingPool address
+        lp_provider = w3.eth.contract(
+            address=CONTRACTS["lendingPoolAddressProvider"],
+            abi=abis.lendingPoolAddressProvider()
+        )
+        lending_pool_addr = lp_provider.functions.getLendingPool().call()
+        print(f"LendingPool address resolved to: {lending_pool_addr}")
 
-    # 4a) Scan depositors
-    print(f"\nScanning deposit events up to block {BALANCE_BLOCK}...")
-    depositors = fetch_depositors_in_range(
-        w3, lending_pool_addr, 16710850, BALANCE_BLOCK
-    )
-    depositor_list = sorted(depositors)
+        data_provider = w3.eth.contract(
+            address=CONTRACTS["protocolDataProvider"],
+            abi=abis.protocolDataProvider()
+        )
+        erc20_abi = abis.token()
 
-    if not depositor_list:
-        print("No depositors found. Exiting.")
+        # Get all reserves (symbol, underlying)
+        reserves = data_provider.functions.getAllReservesTokens().call()
+        reserve_list = [(symbol, Web3.to_checksum_address(addr)) for symbol, addr in reserves]
+
+        # Prepare token contracts and decimals
+        token_contracts = {}
+        decimals = {}
+        for symbol, underlying in reserve_list:
+            a_token, stable_token, variable_token = data_provider.functions.getReserveTokensAddresses(underlying).call()
+            token_contracts[(symbol, 'a')]        = w3.eth.contract(address=a_token,        abi=erc20_abi)
+            token_contracts[(symbol, 'stable')]   = w3.eth.contract(address=stable_token,   abi=erc20_abi)
+            token_contracts[(symbol, 'variable')] = w3.eth.contract(address=variable_token, abi=erc20_abi)
+            decimals[(symbol, 'a')]        = token_contracts[(symbol, 'a')].functions.decimals().call()
+            decimals[(symbol, 'stable')]   = token_contracts[(symbol, 'stable')].functions.decimals().call()
+            decimals[(symbol, 'variable')] = token_contracts[(symbol, 'variable')].functions.decimals().call()
+        span.items = len(reserve_list)
+
+    return {
+        "w3": w3,
+        "lending_pool": lending_pool_addr,
+        "reserve_list": reserve_list,
+        "token_contracts": token_contracts,
+        "decimals": decimals,
+    }
+
+
+def snapshot_depositors(ctx, block):
+    """Brings the depositor index up to `block` and returns the depositors as of `block`."""
+    w3 = ctx["w3"]
+    lending_pool_addr = ctx["lending_pool"]
+
+    # Scan depositors, only over blocks the index has not seen yet
+    index = DepositorIndex(DEPOSITOR_INDEX)
+    scanned_up_to = index.scanned_up_to(lending_pool_addr)
+    from_block = DEPLOY_BLOCK if scanned_up_to is None else scanned_up_to + 1
+
+    if from_block <= block:
+        print(f"\nScanning deposit events from block {from_block} up to block {block}...")
+        first_seen = fetch_depositors_in_range(
+            w3, lending_pool_addr, from_block, block
+        )
+        index.record(lending_pool_addr, first_seen, block)
+    else:
+        print(f"\nDepositor index already covers block {block} (scanned up to {scanned_up_to})")
+
+    depositor_list = index.depositors(lending_pool_addr, up_to_block=block)
+    index.close()
+
+    if depositor_list:
+        # Save depositors list
+        safe_write_json({
+            "block_scanned_up_to": block,
+            "total_depositors": len(depositor_list),
+            "depositors": depositor_list
+        }, OUT_DEPOSITORS)
+        print(f">> Saved {len(depositor_list)} depositors to {OUT_DEPOSITORS}")
+
+    return depositor_list
+
+
+KINDS      = ('a', 'stable', 'variable')
+KIND_NAMES = {'a': 'deposit', 'stable': 'stable', 'variable': 'variable'}
+TOTAL_SUPPLY = RawFunction("totalSupply()", ("uint256",))
+
+
+def fetch_balance_matrix(ctx, depositor_list, block):
+    """
+    Reads every (user, reserve, kind) balance at `block` in batched round trips
+    into a BalanceMatrix with one column per (reserve, kind) token.
+    """
+    w3 = ctx["w3"]
+    reserve_list = ctx["reserve_list"]
+    token_contracts = ctx["token_contracts"]
+    decimals = ctx["decimals"]
+
+    columns = [(symbol, kind) for symbol, _ in reserve_list for kind in KINDS]
+    matrix = BalanceMatrix(columns, [decimals[column] for column in columns], AddressTable(depositor_list))
+    calls = [
+        (token_contracts[column].address, balance_of_calldata(user))
+        for user in depositor_list
+        for column in columns
+    ]
+    with instrument.stage("balance_fetch") as span:
+        caller = BatchCaller(w3, block, batch_size=MULTICALL_BATCH, multicall_address=MULTICALL_ADDRESS)
+        matrix.add_dense(0, caller.call(calls))
+        span.items = len(calls)
+    print(f"  ...fetched {len(calls)} balances in {caller.round_trips} round trips, {len(matrix)} non-zero")
+    return matrix
+
+
+def reconcile_supplies(ctx, matrix, block):
+    """
+    Prints each token's balance total next to its totalSupply at `block`. This
+    is a check on the snapshot, so a failed read or a mismatch is reported
+    without stopping it.
+    """
+    token_contracts = ctx["token_contracts"]
+    calldata = TOTAL_SUPPLY.encode()
+    try:
+        caller = BatchCaller(ctx["w3"], block, multicall_address=MULTICALL_ADDRESS)
+        supplies = caller.call_uint256([(token_contracts[column].address, calldata) for column in matrix.columns])
+    except Exception as e:
+        print(f"WARNING: could not read totalSupply at block {block}, skipping reconciliation: {e}")
         return
+    counts = matrix.column_counts()
 
-    # Save depositors list
-    safe_write_json({
-        "block_scanned_up_to": BALANCE_BLOCK,
-        "total_depositors": len(depositor_list),
-        "depositors": depositor_list
-    }, OUT_DEPOSITORS)
-    print(f">> Saved {len(depositor_list)} depositors to {OUT_DEPOSITORS}")
+    print("\nReconciliation against totalSupply (raw units):")
+    for (symbol, kind), (total, supply, missing) in matrix.reconcile(dict(zip(matrix.columns, supplies))).items():
+        if total or supply:
+            print(f"  {symbol:>10} {KIND_NAMES[kind]:<8} {counts[(symbol, kind)]:>7} holders  "
+                  f"sum {total}  supply {supply}  unaccounted {missing}")
+        if missing < 0:
+            print(f"WARNING: {symbol} {KIND_NAMES[kind]} balances exceed its totalSupply by {-missing}")
 
-    # 4b) Fetch deposit & debt balances for ALL reserves
-    print(f"\nFetching deposit & debt balances at block {BALANCE_BLOCK}...")
-    data_provider = w3.eth.contract(
-        address=CONTRACTS["protocolDataProvider"],
-        abi=abis.protocolDataProvider()
-    )
-    erc20_abi = abis.token()
-
-    # Get all reserves (symbol, underlying)
-    reserves = data_provider.functions.getAllReservesTokens().call()
-    reserve_list = [(symbol, Web3.to_checksum_address(addr)) for symbol, addr in reserves]
-
-    # Prepare token contracts and decimals
-    token_contracts = {}
-    decimals = {}
-    for symbol, underlying in reserve_list:
-        a_token, stable_token, variable_token = data_provider.functions.getReserveTokensAddresses(underlying).call()
-        token_contracts[(symbol, 'a')]        = w3.eth.contract(address=a_token,        abi=erc20_abi)
-        token_contracts[(symbol, 'stable')]   = w3.eth.contract(address=stable_token,   abi=erc20_abi)
-        token_contracts[(symbol, 'variable')] = w3.eth.contract(address=variable_token, abi=erc20_abi)
-        decimals[(symbol, 'a')]        = token_contracts[(symbol, 'a')].functions.decimals().call()
-        decimals[(symbol, 'stable')]   = token_contracts[(symbol, 'stable')].functions.decimals().call()
-        decimals[(symbol, 'variable')] = token_contracts[(symbol, 'variable')].functions.decimals().call()
-
-    # Collect balances per user and reserve
-    results = {}
-    for i, user in enumerate(depositor_list):
-        if (i + 1) % 50 == 0:
-            print(f"  ...processed {i+1}/{len(depositor_list)} users")
 
+def legacy_accounts(matrix):
+    """The nested {user: {"deposits": {...}, "debt": {...}}} view of a matrix, with float values."""
+    decimals = dict(zip(matrix.columns, matrix.decimals.tolist()))
+    results = {}
+    for user, cells in itertools.groupby(matrix.entries(), key=lambda entry: entry[0]):
         user_deposits = {}
         user_debt = {}
+        for _, (symbol, kind), raw in cells:
+            if kind == 'a':
+                user_deposits[symbol] = raw / 10**decimals[(symbol, kind)]
+            else:
+                user_debt.setdefault(symbol, {})[kind] = raw / 10**decimals[(symbol, kind)]
+
+        results[user] = {}
+        if user_deposits:
+            results[user]['deposits'] = user_deposits
+        if user_debt:
+            results[user]['debt'] = user_debt
+    return results
+
+
+def snapshot_balances(ctx, depositor_list, block, formats=OUTPUT_FORMATS):
+    """
+    Fetches deposit & debt balances for ALL reserves at `block` into a balance
+    matrix and exports it: one (account, reserve, kind, raw, decimals) row per
+    non-zero balance, the matrix itself (OUT_MATRIX), and the legacy nested
+    JSON with float values if "json" is requested.
+    """
+    print(f"\nFetching deposit & debt balances at block {block}...")
+    matrix = fetch_balance_matrix(ctx, depositor_list, block)
+    reconcile_supplies(ctx, matrix, block)
+
+    columns = [("account", "address"), ("reserve", "str"), ("kind", "str"), ("raw", "uint256"), ("decimals", "int")]
+    decimals = dict(zip(matrix.columns, matrix.decimals.tolist()))
+    with instrument.stage("output", cpu=True), \
+         SnapshotWriter(OUT_BALANCE_ROWS.format(block=block), columns, formats, metadata={"block": block}) as writer:
+        for user, (symbol, kind), raw in matrix.entries():
+            writer.write((user, symbol, KIND_NAMES[kind], raw, decimals[(symbol, kind)]))
+    for path in writer.paths:
+        print(f">> Wrote {writer.rows} balance rows to {path}")
 
-        for symbol, _ in reserve_list:
-            raw_deposit  = token_contracts[(symbol, 'a')].functions.balanceOf(user).call(block_identifier=BALANCE_BLOCK)
-            raw_stable   = token_contracts[(symbol, 'stable')].functions.balanceOf(user).call(block_identifier=BALANCE_BLOCK)
-            raw_variable = token_contracts[(symbol, 'variable')].functions.balanceOf(user).call(block_identifier=BALANCE_BLOCK)
-
-            # Only include if non-zero
-            if raw_deposit > 0:
-                user_deposits[symbol] = raw_deposit / 10**decimals[(symbol, 'a')]
-            if raw_stable > 0 or raw_variable > 0:
-                debt_entry = {}
-                if raw_stable > 0:
-                    debt_entry['stable'] = raw_stable / 10**decimals[(symbol, 'stable')]
-                if raw_variable > 0:
-                    debt_entry['variable'] = raw_variable / 10**decimals[(symbol, 'variable')]
-                user_debt[symbol] = debt_entry
-
-        if user_deposits or user_debt:
-            results[user] = {}
-            if user_deposits:
-                results[user]['deposits'] = user_deposits
-            if user_debt:
-                results[user]['debt'] = user_debt
-
-    # Write out balances
-    safe_write_json({
-        "block": BALANCE_BLOCK,
-        "accounts": results
-    }, OUT_BALANCES)
-    print(f">> Wrote balances for {len(results)} users to {OUT_BALANCES}")
+    if OUT_MATRIX:
+        out_matrix = OUT_MATRIX.format(block=block)
+        matrix.save(out_matrix)
+        print(f">> Saved balance matrix to {out_matrix}")
+
+    # Legacy nested view
+    if "json" in formats:
+        results = legacy_accounts(matrix)
+        out_balances = OUT_BALANCES.format(block=block)
+        with instrument.stage("output", cpu=True):
+            safe_write_json({
+                "block": block,
+                "accounts": results
+            }, out_balances)
+        print(f">> Wrote balances for {len(results)} users to {out_balances}")
+
+    return matrix
+
+
+def main(block=BALANCE_BLOCK, ctx=None, formats=OUTPUT_FORMATS):
+    owned = ctx is None
+    if owned:
+        ctx = setup()
+
+    # 4a) Scan depositors
+    depositor_list = snapshot_depositors(ctx, block)
+    if not depositor_list:
+        print("No depositors found. Exiting.")
+        return
+
+    # 4b) Fetch deposit & debt balances for ALL reserves
+    snapshot_balances(ctx, depositor_list, block, formats)
+    report(ctx["w3"])
+    if owned:
+        close_cache(ctx["w3"])
 
 if __name__ == "__main__":
     main()
+    instrument.write_report(f"json/perf_report_lending_block_{BALANCE_BLOCK}.json")
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+
+import argparse
+import importlib
+import sys
+
+import lending
+import usdm
+from utils import instrument
+from utils.block_index import BLOCK_INDEX, BlockIndex, BlockResolver, format_time, parse_times
+from utils.rpc_cache import close_cache
+from utils.snapshot_writer import DEFAULT_FORMATS, FORMATS
+
+# ─── Configuration ────────────────────────────────────────────────────────────
+
+# LP scripts, one per target token (file names contain dashes, so they are
+# loaded through importlib)
+LP_MODULES = ["taraswap-tara", "taraswap-usdm"]
+
+SOURCES = ["troves", "usdm", "lending", "lp"]
+
+# ─── Helpers ──────────────────────────────────────────────────────────────────
+
+def parse_blocks(specs):
+    """
+    Expands block arguments into a sorted, de-duplicated list. Each spec is a
+    single block (`19916232`) or an inclusive range with an optional step
+    (`19916232-19926232:3000`).
+    """
+    blocks = set()
+    for spec in specs:
+        step = 1
+        if ":" in spec:
+            spec, step = spec.split(":", 1)
+            step = int(step)
+            if step <= 0:
+                raise argparse.ArgumentTypeError(f"step must be positive, got {step}")
+        if "-" in spec:
+            start, end = (int(part) for part in spec.split("-", 1))
+            if end < start:
+                raise argparse.ArgumentTypeError(f"range {start}-{end} is empty")
+            blocks.update(range(start, end + 1, step))
+        else:
+            blocks.add(int(spec))
+    return sorted(blocks)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Run one or more snapshot sources at one or more blocks."
+    )
+    parser.add_argument(
+        "blocks", nargs="*",
+        help="block numbers or ranges START-END[:STEP]",
+    )
+    parser.add_argument(
+        "--at", nargs="+", default=[], metavar="TIME",
+        help="also snapshot the last block at or before each time: ISO dates/datetimes "
+             "(UTC unless stated; a date means 00:00) or ranges FROM..TO[:Nd|:Nh], daily by default",
+    )
+    parser.add_argument(
+        "--sources", nargs="+", choices=SOURCES, default=SOURCES,
+        help="sources to snapshot (default: all)",
+    )
+    parser.add_argument(
+        "--lp-source", choices=["subgraph", "onchain"], default="subgraph",
+        help="where LP positions are read from (default: subgraph)",
+    )
+    parser.add_argument(
+        "--lp-replay", action="store_true",
+        help="fetch LP positions at the first block only and replay events for the "
+             "later ones (needs POSITION_MANAGER_ADDRESS in the taraswap scripts)",
+    )
+    parser.add_argument(
+        "--formats", nargs="+", choices=FORMATS, default=list(DEFAULT_FORMATS),
+        help="output formats; json is the legacy in-memory layout, the others are "
+             f"streamed row by row (default: {' '.join(DEFAULT_FORMATS)})",
+    )
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="cProfile the CPU-bound stages (position math, replay, output) into a .prof "
+             "next to the performance report; for whole-process sampling run under py-spy instead",
+    )
+    args = parser.parse_args(argv)
+    if not args.blocks and not args.at:
+        parser.error("give at least one block or --at time")
+    try:
+        args.blocks = parse_blocks(args.blocks)
+    except (ValueError, argparse.ArgumentTypeError) as e:
+        parser.error(f"invalid block spec: {e}")
+    try:
+        args.at = parse_times(args.at)
+    except ValueError as e:
+        parser.error(f"invalid time spec: {e}")
+    return args
+
+
+def resolve_times(w3, timestamps):
+    """Block numbers for `timestamps`, through the persisted block index."""
+    index = BlockIndex(BLOCK_INDEX)
+    resolver = BlockResolver(w3, index)
+    try:
+        with instrument.stage("block_resolve") as span:
+            blocks = resolver.blocks_at(timestamps)
+            span.items = len(blocks)
+    finally:
+        index.close()
+    for timestamp, block in blocks.items():
+        print(f"  {format_time(timestamp)} -> block {block}", file=sys.stderr)
+    print(f"Resolved {len(blocks)} time(s) with {resolver.header_reads} header reads", file=sys.stderr)
+    return list(blocks.values())
+
+# ─── Main ─────────────────────────────────────────────────────────────────────
+
+def main(argv=None):
+    args = parse_args(argv)
+    sources = set(args.sources)
+    if args.profile:
+        instrument.enable_profiling()
+
+    # One-time setup, shared by every block and source
+    w3 = None
+    usdm_ctx = lending_ctx = session = None
+    lp_modules = []
+
+    lp_rpc = "lp" in sources and (args.lp_source == "onchain" or args.lp_replay)
+    if sources & {"troves", "usdm", "lending"} or lp_rpc or args.at:
+        w3 = lending.get_provider(lending.RPC_URLS)
+    if args.at:
+        args.blocks = sorted(set(args.blocks) | set(resolve_times(w3, args.at)))
+    print(f"Snapshotting {', '.join(args.sources)} at {len(args.blocks)} block(s)", file=sys.stderr)
+
+    if sources & {"troves", "usdm"}:
+        usdm_ctx = usdm.setup(w3)
+    if "lending" in sources:
+        lending_ctx = lending.setup(w3)
+    if "lp" in sources:
+        lp_modules = [importlib.import_module(name) for name in LP_MODULES]
+        session = lp_modules[0].make_session()
+
+    # Blocks are processed in ascending order so the depositor index only ever
+    # scans forward
+    for block in args.blocks:
+        print(f"\n══ Block {block} ══", file=sys.stderr)
+        if usdm_ctx is not None:
+            usdm.main(block, ctx=usdm_ctx, troves="troves" in sources, holders="usdm" in sources,
+                      formats=args.formats)
+        if lending_ctx is not None:
+            lending.main(block, ctx=lending_ctx, formats=args.formats)
+        if not args.lp_replay:
+            for module in lp_modules:
+                module.main(block_number=block, session=session, source=args.lp_source, w3=w3,
+                            formats=args.formats)
+
+    # The replayed LP series walks all blocks in one pass per target token
+    if args.lp_replay:
+        for module in lp_modules:
+            module.main_series(args.blocks, session=session, source=args.lp_source, w3=w3,
+                               formats=args.formats)
+
+    if w3 is not None:
+        close_cache(w3)
+    first, last = args.blocks[0], args.blocks[-1]
+    span = f"{first}" if first == last else f"{first}-{last}"
+    instrument.write_report(f"json/perf_report_block_{span}.json")
+
+
+if __name__ == "__main__":
+    main()
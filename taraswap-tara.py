@@ -4,8 +4,18 @@ import sys
 import json
 import os
 import requests
+from web3 import Web3
 from decimal import Decimal
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from utils import instrument
+from utils.json_stream import CHUNK_SIZE, ResponseErrors, iter_array
+from utils.lp_replay import LpReplay
+from utils.onchain_lp import Position, fetch_positions_onchain
+from utils.rpc_cache import RpcCache, close_cache
+from utils.rpc_pool import CachingPooledProvider
+from utils.snapshot_writer import DEFAULT_FORMATS, SnapshotWriter
+from utils.v3math import get_token_amounts_batch
 
 # ─── CONFIG ───────────────────────────────────────────────────────────────────
 
@@ -24,15 +34,43 @@ TARGET_TOKEN = "0x5d0fa4c5668e5809c83c95a7cef3a9dd7c68d4fe".lower()
 # Pagination page size
 PAGE_SIZE = 1000
 
+# Number of pools fetched concurrently
+MAX_WORKERS = 4
+
+# Where positions come from: "subgraph" or "onchain" (NonfungiblePositionManager via RPC)
+POSITION_SOURCE = "subgraph"
+
+# RPC endpoints and NonfungiblePositionManager of the Taraswap deployment, used by
+# the on-chain source. The manager address must be set before using it.
+RPC_URLS = ["https://rpc.mainnet.taraxa.io"]
+RPC_CACHE = "json/rpc_cache.sqlite3"
+POSITION_MANAGER_ADDRESS = ""
+
+# Output: the legacy JSON view and/or streamed rows (ndjson, arrow, parquet)
+OUTPUT_FORMATS = DEFAULT_FORMATS
+
 # ─── GRAPHQL QUERY ────────────────────────────────────────────────────────────
 
-# This query is expanded to get all data needed for the calculation.
+# Pool price and tokens, fetched once per pool and block
+POOL_QUERY = """
+query getPool($pool: ID!, $block: Int!) {
+  pool(id: $pool, block: { number: $block }) {
+    tick
+    sqrtPrice
+    token0 { id decimals }
+    token1 { id decimals }
+  }
+}
+"""
+
+# Only the per-position fields; the pool is the same for every position
 QUERY = """
-query getPositions($pool: ID!, $block: Int!, $skip: Int!) {
+query getPositions($pool: ID!, $block: Int!, $lastId: ID!) {
   positions(
     first: %(page_size)d,
-    skip: $skip,
-    where: { pool: $pool, liquidity_gt: 0 },
+    orderBy: id,
+    orderDirection: asc,
+    where: { pool: $pool, liquidity_gt: 0, id_gt: $lastId },
     block: { number: $block }
   ) {
     id
@@ -42,131 +80,232 @@ query getPositions($pool: ID!, $block: Int!, $skip: Int!) {
     liquidity
     tickLower { tickIdx }
     tickUpper { tickIdx }
-    pool {
-      tick
-      token0 { id decimals }
-      token1 { id decimals }
-    }
   }
 }
 """ % {"page_size": PAGE_SIZE}
 
 # ─── CORE LOGIC ───────────────────────────────────────────────────────────────
 
-def tick_to_price(tick: int) -> Decimal:
-    """Converts a tick index to a price, representing sqrt(P) as a Decimal."""
-    return Decimal("1.0001") ** (Decimal(tick) / Decimal(2))
-
-def get_token_amounts(
-    liquidity: int,
-    current_tick: int,
-    tick_lower: int,
-    tick_upper: int,
-    decimals0: int,
-    decimals1: int,
-) -> tuple[Decimal, Decimal]:
+def get_target_amounts(pool: dict, positions: list) -> tuple[list, int]:
     """
-    Calculates the underlying token amounts for a given liquidity and price range.
-    This is a Python implementation of the core Uniswap V3 logic.
+    Calculates the raw TARGET_TOKEN amount held by each Position of one pool with
+    exact Uniswap V3 TickMath / LiquidityAmounts integer math. Returns a list of
+    (owner, raw_amount) and the target token's decimals.
     """
-    liquidity = Decimal(liquidity)
-    current_price_sqrt = tick_to_price(current_tick)
-    lower_price_sqrt = tick_to_price(tick_lower)
-    upper_price_sqrt = tick_to_price(tick_upper)
-    amount0 = Decimal(0)
-    amount1 = Decimal(0)
-
-    if current_tick < tick_lower:
-        # Price is below the range, position is entirely in token0
-        amount0 = liquidity * (upper_price_sqrt - lower_price_sqrt) / (lower_price_sqrt * upper_price_sqrt)
-    elif current_tick >= tick_upper:
-        # Price is above the range, position is entirely in token1
-        amount1 = liquidity * (upper_price_sqrt - lower_price_sqrt)
+    if not positions or pool is None or pool['tick'] is None:
+        return [], 0
+
+    if pool['token0']['id'].lower() == TARGET_TOKEN:
+        target_index, decimals = 0, int(pool['token0']['decimals'])
+    elif pool['token1']['id'].lower() == TARGET_TOKEN:
+        target_index, decimals = 1, int(pool['token1']['decimals'])
     else:
-        # Price is within the range
-        amount0 = liquidity * (upper_price_sqrt - current_price_sqrt) / (current_price_sqrt * upper_price_sqrt)
-        amount1 = liquidity * (current_price_sqrt - lower_price_sqrt)
+        return [], 0
 
-    # Adjust for token decimals
-    amount0_adjusted = amount0 / (Decimal(10) ** decimals0)
-    amount1_adjusted = amount1 / (Decimal(10) ** decimals1)
+    amounts = get_token_amounts_batch(
+        liquidities=[pos.liquidity for pos in positions],
+        tick_lowers=[pos.tick_lower for pos in positions],
+        tick_uppers=[pos.tick_upper for pos in positions],
+        current_tick=int(pool['tick']),
+        sqrt_price_x96=int(pool['sqrtPrice']) if pool.get('sqrtPrice') else None,
+    )[target_index]
 
-    return amount0_adjusted, amount1_adjusted
+    return [(pos.owner, amount) for pos, amount in zip(positions, amounts)], decimals
 
-# ─── SCRIPT MAIN ──────────────────────────────────────────────────────────────
+# ─── SUBGRAPH FETCHING ────────────────────────────────────────────────────────
+
+def make_session() -> requests.Session:
+    """A keep-alive session with enough pooled connections for every worker."""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
-def main(block_number: int):
+def fetch_pool(session: requests.Session, pool_address: str, block_number: int) -> dict:
+    """The pool's tick, price and tokens at a block, or None if it did not exist yet."""
+    vars = {"pool": pool_address.lower(), "block": block_number}
+    try:
+        resp = session.post(GRAPHQL_URL, json={"query": POOL_QUERY, "variables": vars}, timeout=60)
+        resp.raise_for_status()
+        body = resp.json()
+    except requests.exceptions.RequestException as e:
+        print(f"ERROR: Could not fetch data from subgraph: {e}", file=sys.stderr)
+        sys.exit(1)
+    if body.get("errors"):
+        print(f"ERROR: Subgraph answered with errors: {body['errors']}", file=sys.stderr)
+        sys.exit(1)
+    return (body.get("data") or {}).get("pool")
+
+def _counted(chunks, span):
+    for chunk in chunks:
+        span.bytes_in += len(chunk)
+        yield chunk
+
+def fetch_pool_positions(session: requests.Session, pool_address: str, block_number: int) -> tuple[dict, list]:
     """
-    Fetches all positions at a historic block, calculates the real underlying
-    token balances, aggregates them by owner, and writes to a JSON file.
+    Returns (pool, positions) for a pool at a block. Positions are paged with
+    keyset pagination (`id_gt` the last id seen, ordered by id), so each page
+    costs the same no matter how deep into the pool it is, and each page is
+    decoded position by position as it streams in.
     """
-    owner_totals = defaultdict(Decimal)
-
-    # Loop through each pool address provided in the list
-    for pool_address in POOL_ADDRESSES:
-        skip = 0
-        print(f"\nStarting snapshot for pool {pool_address} at block {block_number}...", file=sys.stderr)
-
-        while True:
-            print(f"Fetching positions for {pool_address} (offset: {skip})...", file=sys.stderr)
-            vars = {"pool": pool_address.lower(), "block": block_number, "skip": skip}
-            try:
-                resp = requests.post(GRAPHQL_URL, json={"query": QUERY, "variables": vars}, timeout=60)
+    positions = []
+    last_id = ""
+    print(f"\nStarting snapshot for pool {pool_address} at block {block_number}...", file=sys.stderr)
+    pool = fetch_pool(session, pool_address, block_number)
+    if pool is None:
+        return None, positions
+
+    while True:
+        print(f"Fetching positions for {pool_address} (after id: {last_id or '-'})...", file=sys.stderr)
+        vars = {"pool": pool_address.lower(), "block": block_number, "lastId": last_id}
+        page = 0
+        try:
+            with instrument.stage("subgraph_page") as span, \
+                 session.post(GRAPHQL_URL, json={"query": QUERY, "variables": vars}, timeout=60, stream=True) as resp:
                 resp.raise_for_status()
-                positions = resp.json().get("data", {}).get("positions", [])
-            except requests.exceptions.RequestException as e:
-                print(f"ERROR: Could not fetch data from subgraph: {e}", file=sys.stderr)
-                sys.exit(1)
-
-            if not positions:
-                break
-
-            for pos in positions:
-                pool = pos['pool']
-                token0_id = pool['token0']['id'].lower()
-                token1_id = pool['token1']['id'].lower()
-
-                if not pool['tick']:
-                    continue
-
-                amount0, amount1 = get_token_amounts(
-                    liquidity=int(pos['liquidity']),
-                    current_tick=int(pool['tick']),
-                    tick_lower=int(pos['tickLower']['tickIdx']),
-                    tick_upper=int(pos['tickUpper']['tickIdx']),
-                    decimals0=int(pool['token0']['decimals']),
-                    decimals1=int(pool['token1']['decimals']),
-                )
-
-                owner_addr = pos["owner"]["id"]
-                if token0_id == TARGET_TOKEN:
-                    owner_totals[owner_addr] += amount0
-                elif token1_id == TARGET_TOKEN:
-                    owner_totals[owner_addr] += amount1
-
-            skip += PAGE_SIZE
-
-    # --- Create JSON Output ---
-    print("\nProcessing complete. Formatting JSON output...", file=sys.stderr)
+                for pos in iter_array(_counted(resp.iter_content(CHUNK_SIZE), span), "positions", errors_key="errors"):
+                    positions.append(Position(
+                        int(pos["id"]), pos["owner"]["id"].lower(),
+                        int(pos["tickLower"]["tickIdx"]), int(pos["tickUpper"]["tickIdx"]),
+                        int(pos["liquidity"]),
+                    ))
+                    last_id = pos["id"]
+                    page += 1
+                span.items = page
+        except ResponseErrors as e:
+            print(f"ERROR: Subgraph answered with errors: {e.errors}", file=sys.stderr)
+            sys.exit(1)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            print(f"ERROR: Could not fetch data from subgraph: {e}", file=sys.stderr)
+            sys.exit(1)
+
+        if page < PAGE_SIZE:
+            break
+
+    return pool, positions
+
+# ─── SCRIPT MAIN ──────────────────────────────────────────────────────────────
+
+def fetch_positions(block_number: int, session: requests.Session = None, source: str = POSITION_SOURCE, w3=None) -> list:
+    """(pool, positions) of every pool in POOL_ADDRESSES at a block, in that order."""
+    if source == "onchain":
+        if not POSITION_MANAGER_ADDRESS:
+            print("ERROR: POSITION_MANAGER_ADDRESS must be set for the on-chain source", file=sys.stderr)
+            sys.exit(1)
+        if w3 is not None:
+            return fetch_positions_onchain(w3, POSITION_MANAGER_ADDRESS, POOL_ADDRESSES, block_number)
+        w3 = Web3(CachingPooledProvider(RPC_URLS, RpcCache(RPC_CACHE)))
+        try:
+            return fetch_positions_onchain(w3, POSITION_MANAGER_ADDRESS, POOL_ADDRESSES, block_number)
+        finally:
+            close_cache(w3)
+
+    if session is None:
+        session = make_session()
+
+    # Fetch every pool concurrently over one pooled session
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        return list(executor.map(
+            lambda pool_address: fetch_pool_positions(session, pool_address, block_number),
+            POOL_ADDRESSES,
+        ))
+
+def write_output(block_number: int, owner_totals: dict, decimals: int, formats=OUTPUT_FORMATS):
+    """
+    Writes raw per-owner totals as (owner, raw, decimals) rows, and as the
+    legacy JSON view scaled by `decimals` if "json" is requested.
+    """
+    print("\nProcessing complete. Formatting output...", file=sys.stderr)
 
     # Define output directory and filename
     output_dir = "json"
-    output_file = f"{output_dir}/lp_balances_{TARGET_TOKEN[-6:]}_block_{block_number}.json"
+    base_path = f"{output_dir}/lp_balances_{TARGET_TOKEN[-6:]}_block_{block_number}"
     os.makedirs(output_dir, exist_ok=True)
 
-    # Convert defaultdict of Decimals to a regular dict of strings for JSON serialization
+    columns = [("owner", "address"), ("raw", "uint256"), ("decimals", "int")]
+    metadata = {"block": block_number, "token": TARGET_TOKEN}
+    with instrument.stage("output", cpu=True), \
+         SnapshotWriter(base_path, columns, formats, metadata=metadata) as writer:
+        for owner, total in owner_totals.items():
+            if total > 0:
+                writer.write((owner, total, decimals))
+    for path in writer.paths:
+        print(f"Results for {writer.rows} owners written to {path}", file=sys.stderr)
+
+    if "json" not in formats:
+        return
+
+    # Convert raw totals to decimal strings for JSON serialization
+    scale = Decimal(10) ** decimals
     output_data = {
-        owner: str(total)
+        owner: str(Decimal(total) / scale)
         for owner, total in owner_totals.items()
         if total > 0
     }
 
     # Write the data to a JSON file
-    with open(output_file, "w") as f:
+    output_file = base_path + ".json"
+    with instrument.stage("output", cpu=True), open(output_file, "w") as f:
         json.dump(output_data, f, indent=4)
 
     print(f"Results for {len(output_data)} owners written to {output_file}", file=sys.stderr)
 
+def main(block_number: int, session: requests.Session = None, source: str = POSITION_SOURCE, w3=None,
+         formats=OUTPUT_FORMATS):
+    """
+    Fetches all positions at a historic block, calculates the real underlying
+    token balances, aggregates them by owner, and writes to a JSON file.
+    A session (subgraph) or provider (on-chain) can be passed in to reuse its
+    connections across blocks.
+    """
+    owner_totals = defaultdict(int)
+    decimals = 0
+
+    pool_positions = fetch_positions(block_number, session=session, source=source, w3=w3)
+
+    # Sum raw integer amounts per owner; scaling by decimals happens once at output
+    with instrument.stage("position_math", cpu=True) as span:
+        for pool, positions in pool_positions:
+            owner_amounts, pool_decimals = get_target_amounts(pool, positions)
+            for owner_addr, amount in owner_amounts:
+                owner_totals[owner_addr] += amount
+            if owner_amounts:
+                decimals = pool_decimals
+            span.items += len(positions)
+
+    write_output(block_number, owner_totals, decimals, formats)
+
+def main_series(block_numbers: list, session: requests.Session = None, source: str = POSITION_SOURCE, w3=None,
+                formats=OUTPUT_FORMATS):
+    """
+    Writes one JSON file per block in `block_numbers`: positions are fetched
+    once at the first block, then moved forward by replaying pool Swap and
+    position manager events instead of re-crawling every block.
+    """
+    block_numbers = sorted(set(block_numbers))
+    if not POSITION_MANAGER_ADDRESS:
+        print("ERROR: POSITION_MANAGER_ADDRESS must be set to replay position events", file=sys.stderr)
+        sys.exit(1)
+    owned = w3 is None
+    if owned:
+        w3 = Web3(CachingPooledProvider(RPC_URLS, RpcCache(RPC_CACHE)))
+
+    try:
+        base = block_numbers[0]
+        pool_positions = fetch_positions(base, session=session, source=source, w3=w3)
+        replay = LpReplay(w3, POSITION_MANAGER_ADDRESS, TARGET_TOKEN, POOL_ADDRESSES, pool_positions, base)
+        write_output(base, replay.owner_totals(), replay.decimals, formats)
+
+        for block_number in block_numbers[1:]:
+            with instrument.stage("lp_replay", cpu=True):
+                replay.advance(block_number)
+            write_output(block_number, replay.owner_totals(), replay.decimals, formats)
+    finally:
+        if owned:
+            close_cache(w3)
+
 if __name__ == "__main__":
     block = 19926232
-    main(block_number=block)
\ No newline at end of file
+    main(block_number=block)
+    instrument.write_report(f"json/perf_report_lp_{TARGET_TOKEN[-6:]}_block_{block}.json")
\ No newline at end of file
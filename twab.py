@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+
+import argparse
+import importlib
+import sys
+from collections import defaultdict
+
+import lending
+import usdm
+import watch
+from utils import instrument
+from utils.addresses import ZERO_ADDRESS, address_bytes, checksum
+from utils.block_index import BLOCK_INDEX, BlockIndex, BlockResolver
+from utils.logscan import LogScanner
+from utils.lp_replay import LpReplay
+from utils.rpc_cache import close_cache
+from utils.snapshot_writer import FORMATS, SnapshotWriter
+from utils.twab import Timeline
+
+# ─── Configuration ────────────────────────────────────────────────────────────
+
+SOURCES = ["troves", "usdm", "lending", "lp"]
+LP_MODULES = ["taraswap-tara", "taraswap-usdm"]
+
+# Averages are streamed rows only; there is no legacy nested JSON view of them
+TWAB_FORMATS = [fmt for fmt in FORMATS if fmt != "json"]
+
+COLUMNS = [
+    ("series", "str"), ("account", "address"), ("from_block", "int"), ("to_block", "int"),
+    ("integral", "uint256"), ("span", "int"), ("twab", "str"),
+]
+
+# ─── Timelines ────────────────────────────────────────────────────────────────
+#
+# Each builder loads its source in full at the start block, then records every
+# change in (start, end] and returns {series name: Timeline}. Tuple-valued
+# sources get one series per field.
+
+def usdm_timelines(ctx, start, end):
+    """USDM balances from the transfer ledger: no RPC beyond syncing it."""
+    ledger = ctx["ledger"]
+    ledger.sync(ctx["w3"], end)
+    balances = defaultdict(int, ledger.balances_at(start))
+    timeline = Timeline(start, {address_bytes(holder): raw for holder, raw in balances.items()})
+    for block, sender, recipient, value in ledger.transfers(start, end):
+        for account, delta in ((sender, -value), (recipient, value)):
+            if account != ZERO_ADDRESS:
+                balances[account] += delta
+                timeline.set(block, address_bytes(account), balances[account])
+    return {"usdm": timeline}
+
+
+def watched_timelines(source, fields, start, end):
+    """
+    Timelines of a watch.py source: the accounts each event block touches are
+    re-read at that block in one batch, exactly as the head follower does.
+    """
+    width = len(fields)
+    bases = [{} for _ in fields]
+    for account, value in source.load(start).items():
+        for base, part in zip(bases, value):
+            base[account] = part
+    timelines = {field: Timeline(start, base) for field, base in zip(fields, bases)}
+
+    touched = defaultdict(set)
+
+    def on_logs(logs):
+        for log in logs:
+            touched[log["blockNumber"]].update(source.accounts(log))
+
+    if end > start:
+        LogScanner(source.w3, source.addresses, [source.topics]).scan(start + 1, end, on_logs)
+    for block in sorted(touched):
+        for account, value in source.read(sorted(touched[block]), block).items():
+            for timeline, part in zip(timelines.values(), value or (0,) * width):
+                timeline.set(block, account, part)
+    return timelines
+
+
+def lp_timelines(module, session, w3, start, end):
+    """Per-owner LP amounts of one target token, replayed one event block at a time."""
+    if not module.POSITION_MANAGER_ADDRESS:
+        print(f"ERROR: POSITION_MANAGER_ADDRESS must be set in {module.__name__} to replay position events",
+              file=sys.stderr)
+        sys.exit(1)
+    pool_positions = module.fetch_positions(start, session=session, w3=w3)
+    replay = LpReplay(w3, module.POSITION_MANAGER_ADDRESS, module.TARGET_TOKEN, module.POOL_ADDRESSES,
+                      pool_positions, start)
+    timeline = Timeline(start, {address_bytes(owner): total for owner, total in replay.owner_totals().items()})
+
+    def on_block(block, totals):
+        for owner, total in totals.items():
+            timeline.set(block, address_bytes(owner), max(total, 0))
+
+    if end > start:
+        replay.advance(end, on_block=on_block)
+    return {f"lp_{module.TARGET_TOKEN[-6:]}": timeline}
+
+# ─── Main ─────────────────────────────────────────────────────────────────────
+
+def parse_window(spec):
+    start, end = (int(part) for part in spec.split("-", 1))
+    if end <= start:
+        raise argparse.ArgumentTypeError(f"window {spec} is empty")
+    return start, end
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Time-weighted average balances between two blocks, built from one snapshot "
+                    "at FROM plus every change after it."
+    )
+    parser.add_argument("from_block", type=int, metavar="FROM")
+    parser.add_argument("to_block", type=int, metavar="TO",
+                        help="end of the range; balances count over [FROM, TO), so TO's own changes do not")
+    parser.add_argument(
+        "--windows", nargs="+", type=parse_window, default=[], metavar="START-END",
+        help="also average over these sub-ranges [START, END) of [FROM, TO), from the same timelines",
+    )
+    parser.add_argument("--sources", nargs="+", choices=SOURCES, default=SOURCES)
+    parser.add_argument(
+        "--by", choices=["blocks", "time"], default="blocks",
+        help="weigh each block's balance by 1, or by the seconds until the next block (default: blocks)",
+    )
+    parser.add_argument(
+        "--formats", nargs="+", choices=TWAB_FORMATS, default=["ndjson"],
+        help="output formats (default: ndjson)",
+    )
+    args = parser.parse_args(argv)
+    if args.to_block <= args.from_block:
+        parser.error(f"range {args.from_block}-{args.to_block} is empty")
+    for start, end in args.windows:
+        if start < args.from_block or end > args.to_block:
+            parser.error(f"window {start}-{end} is outside {args.from_block}-{args.to_block}")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    sources = set(args.sources)
+    start, end = args.from_block, args.to_block
+    # Changes at `end` fall outside every window, so they are not read
+    last = end - 1
+
+    w3 = lending.get_provider(lending.RPC_URLS)
+    timelines = {}
+    with instrument.stage("twab_build") as span:
+        if sources & {"troves", "usdm"}:
+            usdm_ctx = usdm.setup(w3)
+            if "troves" in sources:
+                troves = watched_timelines(watch.TroveWatch(usdm_ctx), ["debt", "collateral"], start, last)
+                timelines.update((f"troves_{field}", timeline) for field, timeline in troves.items())
+            if "usdm" in sources:
+                timelines.update(usdm_timelines(usdm_ctx, start, last))
+        if "lending" in sources:
+            source = watch.LendingWatch(lending.setup(w3))
+            fields = [f"{symbol}_{lending.KIND_NAMES[kind]}" for symbol, kind in source.columns]
+            timelines.update(watched_timelines(source, fields, start, last))
+        if "lp" in sources:
+            modules = [importlib.import_module(name) for name in LP_MODULES]
+            session = modules[0].make_session()
+            for module in modules:
+                timelines.update(lp_timelines(module, session, w3, start, last))
+        span.items = sum(timeline.changes for timeline in timelines.values())
+    print(f"Built {len(timelines)} series from {span.items} changes", file=sys.stderr)
+
+    index = clock = None
+    if args.by == "time":
+        index = BlockIndex(BLOCK_INDEX)
+        clock = BlockResolver(w3, index).timestamp
+    windows = [(start, end)] + [w for w in args.windows if w != (start, end)]
+    base_path = f"json/twab_{args.by}_{start}-{end}"
+    metadata = {"from_block": start, "to_block": end, "by": args.by}
+    try:
+        with instrument.stage("twab_integrate", cpu=True) as span, \
+             SnapshotWriter(base_path, COLUMNS, args.formats, metadata=metadata) as writer:
+            for name, timeline in timelines.items():
+                timeline.freeze(clock)
+                for window_start, window_end in windows:
+                    length = timeline.span(window_start, window_end)
+                    for account, integral, average in timeline.averages(window_start, window_end):
+                        writer.write((name, checksum(account), window_start, window_end, integral, length,
+                                      format(average, "f")))
+            span.items = writer.rows
+    finally:
+        if index is not None:
+            index.close()
+        close_cache(w3)
+    for path in writer.paths:
+        print(f"{writer.rows} averages written to {path}", file=sys.stderr)
+    instrument.write_report(f"json/perf_report_twab_{start}-{end}.json")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,60 +1,55 @@
 import os
 import sys
 import json
+import random
 from web3 import Web3
+from concurrent.futures import ThreadPoolExecutor
 import config.abis as abis
-
-
-# List of non-zero balance USDM address from Tara.to
-usdm_holders = list(set([
-    "0xf6Ad62cCa52a5d3c5d567303347E013c2dadec92",
-    "0x02e6ddd40b336247174F37bFA3119eF819db1ef3",
-    "0x02F92F357F96c51cc0411Cf9DA1fdb19Fc353478",
-    "0xD42eaA28C5EAfEe9a0040a7aC74dd3f4b57678bD",
-    "0xb8477F685473cb0C356eB9C56004DA1ceef6cB9D",
-    "0x2A354F7de4F0283880A63F5a8a9d39f48d4564c8",
-    "0xb4F12Da415e9A06f5869e37a9aeF198EA54Bcb81",
-    "0x9aC436368Ab41b295DC3109C6f27e8C1D0CfDA94",
-    "0x242f27EFB84bE154A8d05597B5659d0F470E06e1",
-    "0xc374d36787C1B2f7C4f3482d7e3dcAA503B4A97e",
-    "0xD49EEafa6BdbcC551f462c5A582959a9B7A2EFDb",
-    "0x18f5052f99669a687030c9b0485a7e018a4678FD",
-    "0x873415F6633A0C42b8717bC898354638F52b13f3",
-    "0x6C4803d61799377874519A206A2427AE11C7d9F6",
-    "0xa5E8301a8556baF387228c780381341A8940B734",
-    "0x885410c6d5945C10409d72976D73Fcc1d3e115bF",
-    "0x7918C828Aa465660C4DD61F2a5A1d4EBE0273619",
-    "0x668F46Af86E9c90CC067aBc7034Cf9C1803d0f75",
-    "0xa47AD24Dd03844aB85E61671340F5A5688fCBB24",
-    "0xD03c8F40691A3C4A6049E3A7E644865690af0CDa",
-    "0x0B479bcBD016E3E4317b896704679b7DBc2cb6cf",
-    "0x173220bD4af07d8659A863F98cf7B46F1C54d745",
-    "0x78f3C58cc94563e55054D310888491ee88b70E36",
-    "0xe2736485271EE622B4ACF6d38518a0F32F83C59C",
-    "0x03f985316117708e277D1cE243e957B208aeB4cd"
-]))
+from utils import instrument
+from utils.addresses import address_bytes, checksum
+from utils.multicall import BALANCE_OF, BatchCaller
+from utils.raw_call import RawFunction
+from utils.rpc_cache import RpcCache, close_cache, report
+from utils.rpc_pool import CachingPooledProvider
+from utils.snapshot_writer import DEFAULT_FORMATS, SnapshotWriter
+from utils.transfer_ledger import TransferLedger
 
 
 # ─── Configuration ────────────────────────────────────────────────────────────
 
 
-WEB3_PROVIDER_URI = "https://rpc.mainnet.taraxa.io"
+# Requests are spread over every endpoint listed here
+RPC_URLS = ["https://rpc.mainnet.taraxa.io"]
+
+# On-disk cache of pinned-block RPC results
+RPC_CACHE = "json/rpc_cache.sqlite3"
 
 # Contract Addresses
 TROVE_MANAGER_ADDRESS = "0xd2ff761A55b17a4Ff811B262403C796668Ff610D"
 USDM_TOKEN_ADDRESS = "0xC26B690773828999c2612549CC815d1F252EA15e"
 
-# ─── Setup Web3 ────────────────────────────────────────────────────────────────
+# USDM holders are rebuilt from Transfer events into this ledger
+USDM_LEDGER = "json/usdm_transfer_ledger.sqlite3"
+USDM_START_BLOCK = None  # None: the token's deployment block, found once and kept in the ledger
+SPOT_CHECKS = 10         # holders re-checked with balanceOf per snapshot, 0 to skip
 
-w3 = Web3(Web3.HTTPProvider(WEB3_PROVIDER_URI))
+# Troves are read in chunks of this many indices, several chunks in flight at once
+TROVE_CHUNK = 500
+TROVE_WORKERS = 4
 
-# ─── Load ABIs ─────────────────────────────────────────────────────────────────
+# Hot TroveManager reads, compiled once and encoded/decoded straight from bytes
+OWNER_COUNT    = RawFunction.from_abi("troveManager", "getTroveOwnersCount")
+OWNER_AT_INDEX = RawFunction.from_abi("troveManager", "getTroveFromTroveOwnersArray")
+TROVES         = RawFunction.from_abi("troveManager", "Troves")
 
-# TroveManager ABI
-trove_contract = w3.eth.contract(
-    address=w3.to_checksum_address(TROVE_MANAGER_ADDRESS),
-    abi=abis.troveManager()
-)
+# Default snapshot block when run directly
+BLOCK = 19916232
+
+# Output: the legacy combined JSON and/or streamed rows (ndjson, arrow, parquet)
+OUTPUT_FORMATS = DEFAULT_FORMATS
+OUT_TROVE_ROWS = "json/troves_block_{block}"
+OUT_HOLDER_ROWS = "json/usdm_holders_block_{block}"
+TROVE_DECIMALS = 18  # debt (USDM) and collateral (TARA) are both 18-decimal
 
 # Minimal ERC20 ABI for balanceOf + decimals
 erc20_abi = [
@@ -62,63 +57,182 @@ erc20_abi = [
     {"constant": True, "inputs": [], "name": "decimals", "outputs": [{"name": "", "type": "uint8"}], "type": "function"}
 ]
 
-token_contract = w3.eth.contract(
-    address=w3.to_checksum_address(USDM_TOKEN_ADDRESS),
-    abi=erc20_abi
-)
+# ─── Setup ─────────────────────────────────────────────────────────────────────
+
+def setup(w3=None):
+    """
+    Connects (unless a provider is passed in) and loads the contracts and token
+    decimals once, so they can be reused for any number of snapshot blocks.
+    """
+    if w3 is None:
+        w3 = Web3(CachingPooledProvider(RPC_URLS, RpcCache(RPC_CACHE)))
+
+    trove_contract = w3.eth.contract(
+        address=w3.to_checksum_address(TROVE_MANAGER_ADDRESS),
+        abi=abis.troveManager()
+    )
+    token_contract = w3.eth.contract(
+        address=w3.to_checksum_address(USDM_TOKEN_ADDRESS),
+        abi=erc20_abi
+    )
+    return {
+        "w3": w3,
+        "trove_contract": trove_contract,
+        "token_contract": token_contract,
+        "decimals": token_contract.functions.decimals().call(),
+        "ledger": TransferLedger(USDM_LEDGER, USDM_TOKEN_ADDRESS, start_block=USDM_START_BLOCK),
+    }
 
 # ─── Main Logic ────────────────────────────────────────────────────────────────
 
-def main():
-    block = 19916232
+def _read_trove_chunk(caller, trove_pool, trove_manager, start, end):
+    """
+    Reads the owners at indices [start, end) in one round trip, then queues the
+    Troves(owner) reads for them without waiting, so the next owner chunk and
+    this chunk's trove structs are in flight together.
+    """
+    # Owners stay 20-byte values here; they are checksummed when written out
+    owners = caller.call_function(OWNER_AT_INDEX, trove_manager, ((i,) for i in range(start, end)))
+    troves = trove_pool.submit(caller.call_function, TROVES, trove_manager, ((owner,) for owner in owners))
+    return owners, troves
+
+
+def iter_troves(ctx, block):
+    """Yields (20-byte owner, raw debt, raw collateral) for every trove at `block`, in index order."""
+    w3 = ctx["w3"]
+    trove_contract = ctx["trove_contract"]
 
-    # 1) Get Trove data
     print(f"Fetching trove data at block {block}...")
-    count = trove_contract.functions.getTroveOwnersCount().call(block_identifier=block)
+    count = OWNER_COUNT.call(w3, trove_contract.address, block=block)
     print(f"Found {count} trove owners.")
 
-    troves_data = []
-    for i in range(count):
-        owner = trove_contract.functions.getTroveFromTroveOwnersArray(i).call(block_identifier=block)
-        debt_raw, coll_raw, *_ = trove_contract.functions.Troves(owner).call(block_identifier=block)
-        
-        debt = w3.from_wei(debt_raw, "ether")
-        coll = w3.from_wei(coll_raw, "ether")
-        
-        troves_data.append({
-            "owner": owner,
-            "debt_usdm": str(debt),
-            "collateral_tara": str(coll)
-        })
-        if (i + 1) % 100 == 0:
-            print(f"  ...processed {i+1}/{count} troves")
+    caller = BatchCaller(w3, block, batch_size=TROVE_CHUNK, workers=1)
+    chunks = [(start, min(start + TROVE_CHUNK, count)) for start in range(0, count, TROVE_CHUNK)]
+
+    # Owner and trove reads run on separate pools so trove structs for one chunk
+    # never queue behind the owner reads of later chunks
+    with ThreadPoolExecutor(max_workers=TROVE_WORKERS) as owner_pool, \
+         ThreadPoolExecutor(max_workers=TROVE_WORKERS) as trove_pool:
+        owner_futures = [
+            owner_pool.submit(_read_trove_chunk, caller, trove_pool, trove_contract.address, start, end)
+            for start, end in chunks
+        ]
+        for (start, end), owner_future in zip(chunks, owner_futures):
+            owners, troves_future = owner_future.result()
+            for owner, (debt, coll, *_rest) in zip(owners, troves_future.result()):
+                yield owner, debt, coll
+            print(f"  ...processed {end}/{count} troves")
+
+
+def write_troves(ctx, block, formats=OUTPUT_FORMATS):
+    """Streams every trove to the row outputs; returns the legacy JSON list if "json" is requested."""
+    w3 = ctx["w3"]
+    columns = [("owner", "address"), ("debt_raw", "uint256"), ("collateral_raw", "uint256"), ("decimals", "int")]
+    troves_data = [] if "json" in formats else None
+
+    with instrument.stage("trove_fetch") as span, \
+         SnapshotWriter(OUT_TROVE_ROWS.format(block=block), columns, formats, metadata={"block": block}) as writer:
+        for owner, debt_raw, coll_raw in iter_troves(ctx, block):
+            span.items += 1
+            owner = checksum(owner)
+            writer.write((owner, debt_raw, coll_raw, TROVE_DECIMALS))
+            if troves_data is not None:
+                troves_data.append({
+                    "owner": owner,
+                    "debt_usdm": str(w3.from_wei(debt_raw, "ether")),
+                    "collateral_tara": str(w3.from_wei(coll_raw, "ether"))
+                })
+
+    for path in writer.paths:
+        print(f"  ...wrote {writer.rows} troves to {path}")
+    return troves_data
+
+
+def spot_check(ctx, block, balances):
+    """Compares a random sample of ledger balances with balanceOf at `block`."""
+    sample = random.sample(sorted(balances), min(SPOT_CHECKS, len(balances)))
+    if not sample:
+        return
+    caller = BatchCaller(ctx["w3"], block)
+    token = ctx["token_contract"].address
+    onchain = caller.call_function(BALANCE_OF, token, ((holder,) for holder in sample))
+    mismatches = [
+        (holder, balances[holder], actual)
+        for holder, actual in zip(sample, onchain)
+        if balances[holder] != actual
+    ]
+    for holder, expected, actual in mismatches:
+        print(f"WARNING: ledger balance of {holder} is {expected}, balanceOf says {actual}", file=sys.stderr)
+    print(f"  ...spot-checked {len(sample)} holders, {len(mismatches)} mismatches")
+
+
+def fetch_token_balances(ctx, block):
+    """{lowercase holder: raw balance} of every non-zero USDM holder at `block`."""
+    w3 = ctx["w3"]
+    ledger = ctx["ledger"]
+
+    # Bring the ledger up to the snapshot block; earlier blocks are answered locally
+    ledger.sync(w3, block)
+    with instrument.stage("balance_fetch") as span:
+        balances = ledger.balances_at(block)
+        span.items = len(balances)
+    print(f"\nFound {len(balances)} USDM holders with a non-zero balance at block {block}")
+
+    if SPOT_CHECKS:
+        spot_check(ctx, block, balances)
+    return balances
+
+
+def write_token_balances(ctx, block, formats=OUTPUT_FORMATS):
+    """Streams USDM holder balances to the row outputs; returns the legacy JSON dict if "json" is requested."""
+    decimals = ctx["decimals"]
+    columns = [("holder", "address"), ("raw", "uint256"), ("decimals", "int")]
+    token_balances = {} if "json" in formats else None
+
+    balances = fetch_token_balances(ctx, block)
+    with instrument.stage("output", cpu=True), \
+         SnapshotWriter(OUT_HOLDER_ROWS.format(block=block), columns, formats, metadata={"block": block}) as writer:
+        for holder, bal_raw in sorted(balances.items()):
+            holder = checksum(address_bytes(holder))
+            writer.write((holder, bal_raw, decimals))
+            if token_balances is not None:
+                token_balances[holder] = str(bal_raw / (10 ** decimals))
+
+    for path in writer.paths:
+        print(f"  ...wrote {writer.rows} holders to {path}")
+    return token_balances
+
+
+def main(block=BLOCK, ctx=None, troves=True, holders=True, formats=OUTPUT_FORMATS):
+    owned = ctx is None
+    if owned:
+        ctx = setup()
+
+    output_json = {"block_number": block}
+
+    # 1) Get Trove data
+    if troves:
+        output_json["troves"] = write_troves(ctx, block, formats)
 
     # 2) Get Token balances
-    print(f"\nFetching USDM token balances for {len(usdm_holders)} unique holders...")
-    decimals = token_contract.functions.decimals().call()
-    token_balances = {}
-    for holder in usdm_holders:
-        bal_raw = token_contract.functions.balanceOf(w3.to_checksum_address(holder)).call(block_identifier=block)
-        bal = bal_raw / (10 ** decimals)
-        if bal > 0: # Only include holders with a non-zero balance
-            token_balances[holder] = str(bal)
+    if holders:
+        output_json["token_balances"] = write_token_balances(ctx, block, formats)
 
     # ─── Output to JSON File ──────────────────────────────────────────────────
 
-    output_dir = "json"
-    os.makedirs(output_dir, exist_ok=True)
-    output_filename = f"{output_dir}/trove_snapshot_block_{block}.json"
-
-    output_json = {
-        "block_number": block,
-        "troves": troves_data,
-        "token_balances": token_balances
-    }
+    if "json" in formats:
+        output_dir = "json"
+        os.makedirs(output_dir, exist_ok=True)
+        output_filename = f"{output_dir}/trove_snapshot_block_{block}.json"
 
-    with open(output_filename, "w") as f:
-        json.dump(output_json, f, indent=4)
+        with instrument.stage("output", cpu=True), open(output_filename, "w") as f:
+            json.dump(output_json, f, indent=4)
 
-    print(f"\n✓ Success! All data written to {output_filename}")
+        print(f"\n✓ Success! All data written to {output_filename}")
+    report(ctx["w3"])
+    if owned:
+        close_cache(ctx["w3"])
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
+    instrument.write_report(f"json/perf_report_usdm_block_{BLOCK}.json")
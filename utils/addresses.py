@@ -0,0 +1,38 @@
+from functools import lru_cache
+
+from web3 import Web3
+
+# ─── Configuration ────────────────────────────────────────────────────────────
+
+CHECKSUM_CACHE = 1 << 20  # addresses whose checksum form is kept after first use
+
+ZERO_ADDRESS = "0x" + "00" * 20  # sender of mints and recipient of burns, in lowercase hex
+
+# ─── Binary Addresses ─────────────────────────────────────────────────────────
+#
+# Hot loops carry addresses as their 20 raw bytes: decoding one from a log topic
+# or return word is a slice, they hash and compare cheaply in dedupe sets, and
+# they go into calldata as they are. The EIP-55 checksum form costs a keccak,
+# so it is only computed when an address is written out, once per address.
+
+def raw_bytes(value):
+    """Bytes of a 0x-prefixed (or bare) hex string, or of any bytes-like value."""
+    if isinstance(value, str):
+        return bytes.fromhex(value[2:] if value.startswith("0x") else value)
+    return bytes(value)
+
+
+def address_bytes(value):
+    """20-byte form of a hex address, a 32-byte topic / return word, or raw bytes."""
+    return raw_bytes(value)[-20:]
+
+
+def to_hex(address):
+    """Lowercase 0x-prefixed hex of a 20-byte address."""
+    return "0x" + address.hex()
+
+
+@lru_cache(maxsize=CHECKSUM_CACHE)
+def checksum(address):
+    """EIP-55 checksum string of a 20-byte address, cached across calls."""
+    return Web3.to_checksum_address("0x" + address.hex())
@@ -0,0 +1,181 @@
+from array import array
+
+import numpy as np
+
+# ─── Configuration ────────────────────────────────────────────────────────────
+
+WORD = 32                  # bytes per uint256
+LIMBS = WORD // 4          # uint256 values are held as eight big-endian uint32 limbs
+ZERO_WORD = bytes(WORD)
+
+# ─── Address Table ────────────────────────────────────────────────────────────
+
+class AddressTable:
+    """Interned addresses: each distinct address is stored once and referred to by its row number."""
+
+    def __init__(self, addresses=()):
+        self.addresses = []
+        self.rows = {}
+        for address in addresses:
+            self.intern(address)
+
+    def intern(self, address):
+        row = self.rows.get(address)
+        if row is None:
+            row = self.rows[address] = len(self.addresses)
+            self.addresses.append(address)
+        return row
+
+    def __len__(self):
+        return len(self.addresses)
+
+# ─── Balance Matrix ───────────────────────────────────────────────────────────
+
+class BalanceMatrix:
+    """
+    Sparse accounts × columns matrix of exact raw uint256 balances, where a
+    column is one token (e.g. a reserve's aToken or debt token) with its
+    decimals. Only non-zero cells are kept, as parallel typed arrays of row,
+    column and value; values stay as the 32-byte words the node returned and
+    are viewed as uint32 limbs, so totals and rankings are computed exactly by
+    numpy without converting a single balance to a Python int.
+    """
+
+    def __init__(self, columns, decimals, addresses=None):
+        self.columns = list(columns)
+        self.column_index = {column: i for i, column in enumerate(self.columns)}
+        self.decimals = np.asarray(decimals, dtype=np.uint8)
+        self.addresses = addresses if addresses is not None else AddressTable()
+
+        self._rows = array("I")
+        self._cols = array("H")
+        self._values = bytearray()
+        self._frozen = None
+
+    # ── Building ──
+
+    def add_word(self, row, column, word):
+        """Stores a raw 32-byte big-endian uint256 word; zero words are skipped."""
+        if word == ZERO_WORD:
+            return
+        self._rows.append(row)
+        self._cols.append(column)
+        self._values += word
+        self._frozen = None
+
+    def add_dense(self, first_row, words):
+        """
+        Stores a dense row-major block of return words: `words` holds one word
+        per column for consecutive rows starting at `first_row`. Zero cells are
+        dropped in one vectorized pass instead of one check per cell.
+        """
+        if not words:
+            return
+        # A short return (e.g. from an address without code) would shift every
+        # later cell into the wrong row or column, so it is rejected outright
+        data = b"".join(bytes(word[:WORD]) for word in words)
+        if len(data) != len(words) * WORD:
+            short = next(i for i, word in enumerate(words) if len(word) < WORD)
+            raise ValueError(f"Expected a 32-byte uint256 return, got {len(words[short])} bytes for cell {short}")
+        limbs = np.frombuffer(data, dtype=">u4").reshape(-1, LIMBS)
+        cells = np.flatnonzero(limbs.any(axis=1))
+        rows, cols = np.divmod(cells, len(self.columns))
+        self._rows.frombytes((rows + first_row).astype(np.uint32).tobytes())
+        self._cols.frombytes(cols.astype(np.uint16).tobytes())
+        self._values += limbs[cells].tobytes()
+        self._frozen = None
+
+    def add(self, address, column, raw):
+        self.add_word(self.addresses.intern(address), self.column_index[column], raw.to_bytes(WORD, "big"))
+
+    def _arrays(self):
+        if self._frozen is None:
+            self._frozen = (
+                np.frombuffer(self._rows, dtype=np.uint32).copy(),
+                np.frombuffer(self._cols, dtype=np.uint16).copy(),
+                np.frombuffer(bytes(self._values), dtype=">u4").reshape(-1, LIMBS).astype(np.uint64),
+            )
+        return self._frozen
+
+    def __len__(self):
+        return len(self._rows)
+
+    # ── Exact values ──
+
+    @staticmethod
+    def _combine(limbs):
+        """Python int from summed limbs (each limb sum may exceed 32 bits)."""
+        total = 0
+        for limb in limbs:
+            total = (total << 32) + int(limb)
+        return total
+
+    def value(self, i):
+        return int.from_bytes(self._values[i * WORD:(i + 1) * WORD], "big")
+
+    def entries(self):
+        """Yields (address, column, raw) for every non-zero cell, in insertion order."""
+        addresses = self.addresses.addresses
+        for i, (row, column) in enumerate(zip(self._rows, self._cols)):
+            yield addresses[row], self.columns[column], self.value(i)
+
+    # ── Aggregates ──
+
+    def column_totals(self):
+        """{column: exact raw total over all accounts}."""
+        _, cols, limbs = self._arrays()
+        sums = np.zeros((len(self.columns), LIMBS), dtype=np.uint64)
+        # Limb sums cannot overflow for fewer than 2**32 cells per column
+        np.add.at(sums, cols, limbs)
+        return {column: self._combine(sums[i]) for i, column in enumerate(self.columns)}
+
+    def column_counts(self):
+        _, cols, _ = self._arrays()
+        counts = np.bincount(cols, minlength=len(self.columns))
+        return {column: int(counts[i]) for i, column in enumerate(self.columns)}
+
+    def top(self, column, n=10):
+        """The `n` largest holders of `column` as [(address, raw)], largest first."""
+        rows, cols, limbs = self._arrays()
+        cells = np.flatnonzero(cols == self.column_index[column])
+        # lexsort's last key is the primary one: most significant limb first
+        order = np.lexsort(limbs[cells].T[::-1])[::-1][:n]
+        return [
+            (self.addresses.addresses[rows[cell]], self.value(cell))
+            for cell in cells[order]
+        ]
+
+    def reconcile(self, total_supplies):
+        """
+        Compares column totals with each token's totalSupply. Returns
+        {column: (sum of balances, total supply, supply - sum)}.
+        """
+        totals = self.column_totals()
+        return {
+            column: (totals[column], supply, supply - totals[column])
+            for column, supply in total_supplies.items()
+        }
+
+    # ── Persistence ──
+
+    def save(self, path):
+        rows, cols, _ = self._arrays()
+        np.savez_compressed(
+            path,
+            addresses=np.asarray(self.addresses.addresses),
+            columns=np.asarray(["\t".join(map(str, column)) for column in self.columns]),
+            decimals=self.decimals,
+            rows=rows,
+            cols=cols,
+            values=np.frombuffer(bytes(self._values), dtype=np.uint8),
+        )
+
+    @classmethod
+    def load(cls, path):
+        data = np.load(path)
+        columns = [tuple(column.split("\t")) for column in data["columns"].tolist()]
+        matrix = cls(columns, data["decimals"], AddressTable(data["addresses"].tolist()))
+        matrix._rows.frombytes(data["rows"].astype(np.uint32).tobytes())
+        matrix._cols.frombytes(data["cols"].astype(np.uint16).tobytes())
+        matrix._values = bytearray(data["values"].tobytes())
+        return matrix
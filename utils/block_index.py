@@ -0,0 +1,174 @@
+import os
+import re
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+# ─── Configuration ────────────────────────────────────────────────────────────
+
+BLOCK_INDEX = "json/block_index.sqlite3"
+
+# Once the bracket is this narrow, plain bisection finishes the search: a few
+# more probes are cheaper than interpolating into a patch of uneven block times
+BISECT_BELOW = 8
+
+# ─── Block Index ──────────────────────────────────────────────────────────────
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS blocks (
+    number    INTEGER PRIMARY KEY,
+    timestamp INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS blocks_by_timestamp ON blocks (timestamp);
+"""
+
+
+class BlockIndex:
+    """
+    SQLite store of (block, timestamp) samples gathered by past lookups. Block
+    timestamps never decrease, so the samples either side of a timestamp bound
+    where its block can be, and two adjacent samples answer it outright.
+    """
+
+    def __init__(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def timestamp(self, number):
+        row = self.conn.execute("SELECT timestamp FROM blocks WHERE number = ?", (number,)).fetchone()
+        return row[0] if row else None
+
+    def add(self, number, timestamp):
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO blocks (number, timestamp) VALUES (?, ?)", (number, timestamp))
+
+    def bracket(self, timestamp):
+        """
+        The closest samples around `timestamp`: ((block, ts) of the last sample
+        at or before it, (block, ts) of the first sample after it), either None.
+        """
+        below = self.conn.execute(
+            "SELECT number, timestamp FROM blocks WHERE timestamp <= ? ORDER BY number DESC LIMIT 1",
+            (timestamp,),
+        ).fetchone()
+        above = self.conn.execute(
+            "SELECT number, timestamp FROM blocks WHERE timestamp > ? ORDER BY number LIMIT 1",
+            (timestamp,),
+        ).fetchone()
+        return below, above
+
+# ─── Resolver ─────────────────────────────────────────────────────────────────
+
+class BlockResolver:
+    """
+    Maps unix timestamps to block numbers with an interpolation search over
+    `index`, reading block headers only where the index has no sample. Each
+    header read is added to the index, so a later lookup near an earlier one
+    takes at most a probe or two and a repeated lookup takes none.
+    """
+
+    def __init__(self, w3, index):
+        self.w3 = w3
+        self.index = index
+        self.header_reads = 0
+
+    def timestamp(self, number):
+        """Timestamp of block `number`, from the index or a header read."""
+        timestamp = self.index.timestamp(number)
+        if timestamp is None:
+            timestamp = self._read(number)[1]
+        return timestamp
+
+    def _read(self, number):
+        header = self.w3.eth.get_block(number)
+        self.header_reads += 1
+        sample = (header["number"], header["timestamp"])
+        self.index.add(*sample)
+        return sample
+
+    def block_at(self, timestamp):
+        """
+        The last block whose timestamp is at or before `timestamp`, i.e. the
+        block whose post-state holds at that moment.
+        """
+        below, above = self.index.bracket(timestamp)
+        if below is None:
+            below = self._read(0)
+            if below[1] > timestamp:
+                raise ValueError(f"timestamp {timestamp} is before the genesis block")
+        if above is None:
+            head = self._read("latest")
+            if head[1] <= timestamp:
+                raise ValueError(f"timestamp {timestamp} is not before the head block {head[0]} yet")
+            above = head
+
+        # Invariant: ts(lo) <= timestamp < ts(hi)
+        (lo, lo_ts), (hi, hi_ts) = below, above
+        while hi - lo > 1:
+            if hi - lo <= BISECT_BELOW:
+                guess = (lo + hi) // 2
+            else:
+                guess = lo + (timestamp - lo_ts) * (hi - lo) // (hi_ts - lo_ts)
+                # Keep the probe strictly inside the bracket and off its very
+                # edges, so a bad estimate still narrows it
+                guess = min(max(guess, lo + 1), hi - 1)
+            guess_ts = self.timestamp(guess)
+            if guess_ts <= timestamp:
+                lo, lo_ts = guess, guess_ts
+            else:
+                hi, hi_ts = guess, guess_ts
+        return lo
+
+    def blocks_at(self, timestamps):
+        """{timestamp: block} for many timestamps; earlier lookups narrow later ones."""
+        return {timestamp: self.block_at(timestamp) for timestamp in sorted(set(timestamps))}
+
+# ─── Time Specs ───────────────────────────────────────────────────────────────
+
+STEP_UNITS = {"d": timedelta(days=1), "h": timedelta(hours=1)}
+_STEP = re.compile(r":(\d+)([dh])$")
+
+
+def parse_time(text):
+    """Unix timestamp of an ISO date or datetime (UTC unless it says otherwise) or of a plain integer."""
+    if text.isdigit():
+        return int(text)
+    moment = datetime.fromisoformat(text)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return int(moment.timestamp())
+
+
+def parse_times(specs):
+    """
+    Expands time arguments into a sorted, de-duplicated list of timestamps.
+    Each spec is one moment (`2025-06-01`, `2025-06-01T12:00`) or an inclusive
+    range with an optional step, daily by default (`2025-06-01..2025-06-30`,
+    `2025-06-01..2025-06-07:6h`); a date alone means 00:00 UTC.
+    """
+    timestamps = set()
+    for spec in specs:
+        step = STEP_UNITS["d"]
+        match = _STEP.search(spec)
+        if match and ".." in spec:
+            spec = spec[:match.start()]
+            step = int(match.group(1)) * STEP_UNITS[match.group(2)]
+            if not step:
+                raise ValueError("step must be positive")
+        if ".." in spec:
+            start, end = (parse_time(part) for part in spec.split("..", 1))
+            if end < start:
+                raise ValueError(f"range {spec} is empty")
+            timestamps.update(range(start, end + 1, int(step.total_seconds())))
+        else:
+            timestamps.add(parse_time(spec))
+    return sorted(timestamps)
+
+
+def format_time(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
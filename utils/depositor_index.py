@@ -0,0 +1,73 @@
+import os
+import sqlite3
+
+# ─── Depositor Index ──────────────────────────────────────────────────────────
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS depositors (
+    contract         TEXT    NOT NULL,
+    address          TEXT    NOT NULL,
+    first_seen_block INTEGER NOT NULL,
+    PRIMARY KEY (contract, address)
+);
+CREATE TABLE IF NOT EXISTS scans (
+    contract      TEXT    PRIMARY KEY,
+    scanned_up_to INTEGER NOT NULL
+);
+"""
+
+
+class DepositorIndex:
+    """
+    SQLite store of every depositor seen per contract, with the block of their
+    first Deposit and the highest block scanned so far. A later snapshot only
+    needs to scan the blocks after `scanned_up_to`, and a snapshot at an earlier
+    block filters on `first_seen_block`.
+    """
+
+    def __init__(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def scanned_up_to(self, contract):
+        """Highest block already scanned for `contract`, or None if never scanned."""
+        row = self.conn.execute(
+            "SELECT scanned_up_to FROM scans WHERE contract = ?", (contract,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def record(self, contract, first_seen, scanned_up_to):
+        """
+        Stores `first_seen` ({address: block}) and moves the scan position of
+        `contract` to `scanned_up_to`, in one transaction.
+        """
+        with self.conn:
+            self.conn.executemany(
+                """
+                INSERT INTO depositors (contract, address, first_seen_block) VALUES (?, ?, ?)
+                ON CONFLICT (contract, address)
+                DO UPDATE SET first_seen_block = MIN(first_seen_block, excluded.first_seen_block)
+                """,
+                [(contract, address, block) for address, block in first_seen.items()],
+            )
+            self.conn.execute(
+                """
+                INSERT INTO scans (contract, scanned_up_to) VALUES (?, ?)
+                ON CONFLICT (contract) DO UPDATE SET scanned_up_to = MAX(scanned_up_to, excluded.scanned_up_to)
+                """,
+                (contract, scanned_up_to),
+            )
+
+    def depositors(self, contract, up_to_block):
+        """Sorted addresses whose first deposit on `contract` is at or before `up_to_block`."""
+        rows = self.conn.execute(
+            "SELECT address FROM depositors WHERE contract = ? AND first_seen_block <= ? ORDER BY address",
+            (contract, up_to_block),
+        )
+        return [address for (address,) in rows]
@@ -0,0 +1,208 @@
+import sys
+import time
+from collections import deque
+
+from utils import instrument
+from utils.logscan import LogScanner
+
+# ─── Configuration ────────────────────────────────────────────────────────────
+
+DEFAULT_CONFIRMATIONS = 12   # blocks behind head that can still be reorged away
+DEFAULT_POLL_INTERVAL = 2.0  # seconds between head polls once caught up
+
+# ─── Sources ──────────────────────────────────────────────────────────────────
+#
+# A watched source describes one piece of state kept per account:
+#
+#   name                   key of the source in state, changes and summaries
+#   addresses              contracts whose logs can change the state
+#   topics                 topic0 of every such event
+#   load(block)            {account: value} for every account at `block`
+#   accounts(log)          accounts whose value a log may have changed
+#   read(accounts, block)  {account: value, or None if it no longer counts} at `block`
+#
+# Accounts are 20-byte addresses and values anything comparable with ==.
+
+def _topic0(log):
+    return "0x" + bytes(log["topics"][0]).hex()
+
+# ─── Head Follower ────────────────────────────────────────────────────────────
+
+class HeadFollower:
+    """
+    Keeps the state of every source current as new blocks arrive. Each block's
+    logs name the accounts it touched, and only those are read again, at that
+    block. Blocks more than `confirmations` behind head are caught up in one
+    ranged log scan and one read; the newer ones are applied one at a time with
+    an undo journal, so when a block's parent hash stops matching the chain the
+    reorged blocks are rolled back and replayed from the fork.
+
+    `on_change(block, source, account, value)` is called for every change,
+    including the values a rollback restores, and `on_rollback(from_block,
+    to_block)` for every rollback.
+    """
+
+    def __init__(self, w3, sources, confirmations=DEFAULT_CONFIRMATIONS, on_change=None, on_rollback=None):
+        self.w3 = w3
+        self.sources = list(sources)
+        self.confirmations = confirmations
+        self.on_change = on_change
+        self.on_rollback = on_rollback
+
+        self.state = {source.name: {} for source in self.sources}
+        self.block = None
+        self.hash = None
+        self.journal = deque()   # (block, hash, undo) of blocks not yet `confirmations` deep
+        self._base_hash = None   # hash of the block just below the journal
+        self.rollbacks = 0
+
+        self.addresses = sorted({address for source in self.sources for address in source.addresses})
+        self.topics = sorted({topic for source in self.sources for topic in source.topics})
+        self.routes = {
+            (address.lower(), topic): source
+            for source in self.sources
+            for address in source.addresses
+            for topic in source.topics
+        }
+
+    # ── Chain ──
+
+    def _header(self, block):
+        header = self.w3.eth.get_block(block)
+        return header["number"], bytes(header["hash"]), bytes(header["parentHash"])
+
+    def head(self):
+        return self.w3.eth.block_number
+
+    # ── State ──
+
+    def start(self, block):
+        """Loads every source in full at `block`; following continues from there."""
+        for source in self.sources:
+            print(f"Loading {source.name} at block {block}...")
+            self.state[source.name] = dict(source.load(block))
+            print(f"  ...{len(self.state[source.name])} accounts")
+        self.block, self.hash, _ = self._header(block)
+        self.journal.clear()
+
+    def _affected(self, logs):
+        affected = {}
+        for log in logs:
+            source = self.routes.get((log["address"].lower(), _topic0(log)))
+            if source is not None:
+                affected.setdefault(source, set()).update(source.accounts(log))
+        return affected
+
+    def _refresh(self, affected, block):
+        """Reads the affected accounts at `block` and applies them; returns the undo list."""
+        undo = []
+        for source, accounts in affected.items():
+            state = self.state[source.name]
+            for account, value in source.read(sorted(accounts), block).items():
+                old = state.get(account)
+                if old == value:
+                    continue
+                undo.append((source.name, account, old))
+                if value is None:
+                    del state[account]
+                else:
+                    state[account] = value
+                if self.on_change is not None:
+                    self.on_change(block, source.name, account, value)
+        return undo
+
+    def _undo(self, undo, block):
+        """Restores the values `undo` recorded, reported as changes at `block`."""
+        for name, account, old in reversed(undo):
+            if old is None:
+                self.state[name].pop(account, None)
+            else:
+                self.state[name][account] = old
+            if self.on_change is not None:
+                self.on_change(block, name, account, old)
+
+    # ── Following ──
+
+    def _catch_up(self, to_block):
+        """Applies the final blocks (self.block, to_block] with one ranged scan, no journal."""
+        logs = []
+        scanner = LogScanner(self.w3, self.addresses, [self.topics])
+        scanner.scan(self.block + 1, to_block, logs.extend)
+        self._refresh(self._affected(logs), to_block)
+        self.block, self.hash, _ = self._header(to_block)
+
+    def _apply(self, number, block_hash):
+        if not self.journal:
+            self._base_hash = self.hash
+        # Logs by hash, so they are this block's even if the chain moves meanwhile
+        logs = self.w3.eth.get_logs({
+            "blockHash": "0x" + block_hash.hex(),
+            "address":   self.addresses,
+            "topics":    [self.topics],
+        })
+        undo = self._refresh(self._affected(logs), number)
+        self.journal.append((number, block_hash, undo))
+        self.block, self.hash = number, block_hash
+
+    def _rollback(self):
+        """Undoes journaled blocks until the last applied block is on the chain again."""
+        from_block = self.block
+        while True:
+            _, canonical, _ = self._header(self.block)
+            if canonical == self.hash:
+                break
+            if not self.journal:
+                raise RuntimeError(
+                    f"reorg below block {self.block}, deeper than {self.confirmations} confirmations; "
+                    f"restart from a full load"
+                )
+            _, _, undo = self.journal.pop()
+            self.block -= 1
+            self._undo(undo, self.block)
+            self.hash = self.journal[-1][1] if self.journal else self._base_hash
+        self.rollbacks += 1
+        print(f"Reorg: rolled back from block {from_block} to {self.block}", file=sys.stderr)
+        if self.on_rollback is not None:
+            self.on_rollback(from_block, self.block)
+
+    def _trim(self, head):
+        # Blocks this deep are final: their undo entries are no longer needed.
+        # Only called once the last applied block is known to be canonical
+        while self.journal and self.journal[0][0] <= head - self.confirmations:
+            self._base_hash = self.journal.popleft()[1]
+
+    def poll(self):
+        """Follows the chain up to its current head; returns the number of blocks applied."""
+        head = self.head()
+        # The tip must still be canonical before anything below it is treated
+        # as final: after a long gap between polls, a reorg of the journaled
+        # blocks would otherwise be trimmed away and caught up over unnoticed
+        if self._header(self.block)[1] != self.hash:
+            self._rollback()
+        self._trim(head)
+
+        start = self.block
+        with instrument.stage("follow") as span:
+            # Anything left in the journal is above `final`, so this only runs
+            # when the journal is empty
+            final = head - self.confirmations
+            if final > self.block:
+                self._catch_up(final)
+            while self.block < head:
+                number, block_hash, parent = self._header(self.block + 1)
+                if parent != self.hash:
+                    self._rollback()
+                    continue
+                self._apply(number, block_hash)
+            span.items = self.block - start
+        return self.block - start
+
+    def run(self, interval=DEFAULT_POLL_INTERVAL, until=None, on_poll=None):
+        """Polls every `interval` seconds, forever or until block `until` has been applied."""
+        while until is None or self.block < until:
+            applied = self.poll()
+            if on_poll is not None:
+                on_poll(applied)
+            if until is not None and self.block >= until:
+                break
+            time.sleep(interval)
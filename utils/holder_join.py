@@ -0,0 +1,65 @@
+import heapq
+import itertools
+import os
+import re
+from operator import itemgetter
+
+from utils.snapshot_entries import EXACT_CONTEXT, RUN_SIZE, grouped, read_entries, sorted_entries
+
+# ─── Discovery ────────────────────────────────────────────────────────────────
+
+# Per source, the file names to look for, best first: streamed rows are exact
+# and cheaper to read than the legacy JSON views
+SOURCE_FILES = {
+    "troves":  ["troves_block_{block}.ndjson", "trove_snapshot_block_{block}.json"],
+    "usdm":    ["usdm_holders_block_{block}.ndjson", "trove_snapshot_block_{block}.json"],
+    "lending": ["lending_balances_block_{block}.ndjson", "lending_depositor_balances_block_{block}.json"],
+}
+LP_FILE = re.compile(r"^lp_balances_(\w+)_block_(\d+)\.(ndjson|json)$")
+
+
+def discover(directory, block):
+    """[(label, path, source)] of every snapshot of `block` in `directory`, one file per label."""
+    inputs = []
+    for source, candidates in SOURCE_FILES.items():
+        for name in candidates:
+            path = os.path.join(directory, name.format(block=block))
+            if os.path.exists(path):
+                inputs.append((source, path, source))
+                break
+
+    lp_files = {}
+    for name in sorted(os.listdir(directory)):
+        match = LP_FILE.match(name)
+        if match and int(match.group(2)) == block:
+            tag, extension = match.group(1), match.group(3)
+            if tag not in lp_files or extension == "ndjson":
+                lp_files[tag] = os.path.join(directory, name)
+    inputs += [(f"lp_{tag}", path, "lp") for tag, path in sorted(lp_files.items())]
+    return inputs
+
+# ─── Join ─────────────────────────────────────────────────────────────────────
+
+def _labelled(label, path, source, run_size):
+    for address, fields in grouped(sorted_entries(read_entries(path, source), run_size)):
+        if fields:
+            yield address, label, fields
+
+
+def join_sources(inputs, run_size=RUN_SIZE):
+    """
+    Sorted-merge join of every (label, path, source) input on address. Each
+    input is externally sorted on its own, then all of them are merged with a
+    k-way heap merge, so memory stays bounded by `run_size` per input however
+    large the files are. Yields (address bytes, {label: {field: Decimal}}) in
+    address order, one per address present in any input.
+    """
+    streams = [_labelled(label, path, source, run_size) for label, path, source in inputs]
+    merged = heapq.merge(*streams, key=itemgetter(0))
+    for address, items in itertools.groupby(merged, key=itemgetter(0)):
+        record = {}
+        for _, label, fields in items:
+            positions = record.setdefault(label, {})
+            for field, value in fields.items():
+                positions[field] = EXACT_CONTEXT.add(positions.get(field, 0), value)
+        yield address, record
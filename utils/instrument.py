@@ -0,0 +1,218 @@
+import bisect
+import cProfile
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# ─── Configuration ────────────────────────────────────────────────────────────
+
+# Upper bounds (ms) of the latency histogram buckets; slower samples go in "+Inf"
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000)
+
+# ─── Histogram ────────────────────────────────────────────────────────────────
+
+class Histogram:
+    """Fixed-bucket latency histogram, cheap enough to update on every request."""
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds):
+        ms = seconds * 1000
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q):
+        """Upper bound (ms) of the bucket holding the q-quantile, None past the last bucket."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(LATENCY_BUCKETS_MS, self.counts):
+            seen += n
+            if seen >= rank:
+                return bound
+        return None
+
+    def to_dict(self):
+        labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + ["+Inf"]
+        return {
+            "count": self.count,
+            "total_s": round(self.total, 6),
+            "mean_ms": round(self.total * 1000 / self.count, 3) if self.count else None,
+            "max_ms": round(self.max * 1000, 3),
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "p99_ms": self.quantile(0.99),
+            "buckets": {label: n for label, n in zip(labels, self.counts) if n},
+        }
+
+# ─── Metrics ──────────────────────────────────────────────────────────────────
+
+class _Stat:
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.items = 0
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.latency = Histogram()
+
+    def to_dict(self):
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "retries": self.retries,
+            "items": self.items,
+            "bytes_out": self.bytes_out,
+            "bytes_in": self.bytes_in,
+            "latency": self.latency.to_dict(),
+        }
+
+
+class Span:
+    """Handed out by Metrics.stage() so the stage can report what it moved."""
+
+    def __init__(self):
+        self.items = 0
+        self.bytes_out = 0
+        self.bytes_in = 0
+
+
+class Metrics:
+    """
+    Process-wide counters for every RPC method and pipeline stage: call counts,
+    errors, retries, payload bytes and latency histograms, plus cache hits.
+    Safe to update from any thread. An optional cProfile run covers the
+    CPU-bound stages only, so network waits do not drown the profile.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.rpc = {}
+        self.stages = {}
+        self.cache = {}
+        self.profiler = None
+        self._profiling_thread = None
+
+    def _stat(self, table, name):
+        stat = table.get(name)
+        if stat is None:
+            stat = table[name] = _Stat()
+        return stat
+
+    # ── Recording ──
+
+    def record_rpc(self, method, seconds, bytes_out=0, bytes_in=0, retries=0, error=False, items=1):
+        with self.lock:
+            stat = self._stat(self.rpc, method)
+            stat.calls += 1
+            stat.items += items
+            stat.errors += error
+            stat.retries += retries
+            stat.bytes_out += bytes_out
+            stat.bytes_in += bytes_in
+            stat.latency.add(seconds)
+
+    def record_cache(self, method, hit):
+        with self.lock:
+            counts = self.cache.setdefault(method, {"hits": 0, "misses": 0})
+            counts["hits" if hit else "misses"] += 1
+
+    @contextmanager
+    def stage(self, name, cpu=False):
+        """Times the enclosed block as one call of stage `name`; `cpu` marks it for profiling."""
+        span = Span()
+        profile = cpu and self._start_profile()
+        start = time.perf_counter()
+        error = False
+        try:
+            yield span
+        except BaseException:
+            error = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            if profile:
+                self._stop_profile()
+            with self.lock:
+                stat = self._stat(self.stages, name)
+                stat.calls += 1
+                stat.errors += error
+                stat.items += span.items
+                stat.bytes_out += span.bytes_out
+                stat.bytes_in += span.bytes_in
+                stat.latency.add(elapsed)
+
+    # ── Profiling ──
+
+    def enable_profiling(self):
+        self.profiler = cProfile.Profile()
+
+    def _start_profile(self):
+        # cProfile follows one thread at a time; nested or concurrent CPU stages are skipped
+        with self.lock:
+            if self.profiler is None or self._profiling_thread is not None:
+                return False
+            self._profiling_thread = threading.get_ident()
+        self.profiler.enable()
+        return True
+
+    def _stop_profile(self):
+        self.profiler.disable()
+        with self.lock:
+            self._profiling_thread = None
+
+    # ── Reporting ──
+
+    def report(self):
+        with self.lock:
+            return {
+                "started": self.started,
+                "wall_s": round(time.time() - self.started, 3),
+                "stages": {name: stat.to_dict() for name, stat in sorted(self.stages.items())},
+                "rpc": {name: stat.to_dict() for name, stat in sorted(self.rpc.items())},
+                "rpc_cache": dict(sorted(self.cache.items())),
+            }
+
+    def write_report(self, path):
+        """Writes the JSON report to `path`, and the CPU profile (if enabled) next to it as .prof."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        report = self.report()
+        if self.profiler is not None:
+            profile_path = os.path.splitext(path)[0] + ".prof"
+            self.profiler.dump_stats(profile_path)
+            report["cpu_profile"] = profile_path
+        with open(path, "w") as f:
+            json.dump(report, f, indent=4)
+
+        print(f"\nPerformance report written to {path}", file=sys.stderr)
+        for name, stage in report["stages"].items():
+            latency = stage["latency"]
+            print(f"  {name}: {stage['calls']} calls, {latency['total_s']:.2f} s", file=sys.stderr)
+        for method, stat in report["rpc"].items():
+            print(
+                f"  rpc {method}: {stat['calls']} calls, {stat['retries']} retries, "
+                f"p95 {stat['latency']['p95_ms']} ms",
+                file=sys.stderr,
+            )
+
+
+METRICS = Metrics()
+
+stage = METRICS.stage
+record_rpc = METRICS.record_rpc
+record_cache = METRICS.record_cache
+write_report = METRICS.write_report
@@ -0,0 +1,103 @@
+import codecs
+import json
+import re
+
+# ─── Configuration ────────────────────────────────────────────────────────────
+
+CHUNK_SIZE = 64 * 1024   # bytes read from the response per step
+COMPACT_AT = 256 * 1024  # characters of consumed input kept before the buffer is trimmed
+
+_DECODER = json.JSONDecoder()
+_SEPARATORS = re.compile(r"[\s,]*")
+
+# ─── Errors ───────────────────────────────────────────────────────────────────
+
+class ResponseErrors(Exception):
+    """The document carried a top-level errors member (e.g. a GraphQL `errors` list)."""
+
+    def __init__(self, errors):
+        super().__init__(f"response carried errors: {errors}")
+        self.errors = errors
+
+
+def _check_errors(text, errors_key):
+    """Raises ResponseErrors if `text` parses to an object with a non-empty `errors_key` member."""
+    try:
+        document = json.loads(text)
+    except ValueError:
+        return
+    if isinstance(document, dict) and document.get(errors_key):
+        raise ResponseErrors(document[errors_key])
+
+# ─── Streaming Array Reader ───────────────────────────────────────────────────
+
+def iter_array(chunks, key, errors_key=None):
+    """
+    Yields the elements of the array stored under `key` in a JSON document that
+    arrives as byte `chunks` (e.g. `response.iter_content()`). Each element is
+    decoded as soon as it has fully arrived, so only one chunk plus the element
+    being decoded are held at a time instead of the whole document and its
+    parsed tree. The first `"key": [` in the document is the one read; callers
+    use it on documents whose shape they know.
+
+    With `errors_key`, the rest of the document is read once the array ends
+    and ResponseErrors is raised if it has a non-empty top-level member of
+    that name, as it is when there is no array at all.
+    """
+    chunks = iter(chunks)
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    start = re.compile(r'"%s"\s*:\s*\[' % re.escape(key))
+    buffer = ""
+    done = False
+
+    def read_more():
+        nonlocal buffer, done
+        if done:
+            return False
+        chunk = next(chunks, None)
+        if chunk is None:
+            done = True
+            buffer += decoder.decode(b"", final=True)
+            return False
+        buffer += decoder.decode(chunk)
+        return True
+
+    # Everything before the array is kept, so a document without it (an error
+    # response) can be reported whole
+    while True:
+        match = start.search(buffer)
+        if match:
+            i = match.end()
+            prefix = buffer[:i]
+            break
+        if not read_more():
+            if errors_key is not None:
+                _check_errors(buffer, errors_key)
+            raise ValueError(f'no "{key}" array in response: {buffer[:500]}')
+
+    while True:
+        i = _SEPARATORS.match(buffer, i).end()
+        if i == len(buffer):
+            if not read_more():
+                raise ValueError(f'response ended inside the "{key}" array')
+            continue
+        if buffer[i] == "]":
+            if errors_key is not None:
+                # The document with the array emptied out is small; check it whole
+                while read_more():
+                    pass
+                _check_errors(prefix + buffer[i:], errors_key)
+            return
+        try:
+            value, end = _DECODER.raw_decode(buffer, i)
+        except json.JSONDecodeError:
+            # Most likely the element has not fully arrived yet
+            if not read_more():
+                raise
+            continue
+        if end == len(buffer) and buffer[i] not in '{["' and read_more():
+            continue  # a bare number may continue in the next chunk
+        yield value
+        i = end
+        if i > COMPACT_AT:
+            buffer, i = buffer[i:], 0
@@ -0,0 +1,179 @@
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import requests
+
+from utils import instrument
+
+# ─── Configuration ────────────────────────────────────────────────────────────
+
+DEFAULT_WINDOW  = 10000
+DEFAULT_WORKERS = 8
+MAX_RETRIES     = 5
+RETRY_BACKOFF   = 1.0  # seconds, doubled on every retry of the same window
+
+# Fragments of node error messages that mean "ask for a smaller block range"
+RANGE_ERRORS = (
+    "too many",
+    "limit exceeded",
+    "exceeds",
+    "response size",
+    "query returned more than",
+    "block range",
+    "timeout",
+    "timed out",
+)
+
+# ─── Helpers ──────────────────────────────────────────────────────────────────
+
+def _is_range_error(exc):
+    if isinstance(exc, requests.exceptions.Timeout):
+        return True
+    message = str(exc).lower()
+    return any(fragment in message for fragment in RANGE_ERRORS)
+
+
+def _write_json_atomic(data, filepath):
+    directory = os.path.dirname(filepath)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp = filepath + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp, filepath)
+
+# ─── Log Scanner ──────────────────────────────────────────────────────────────
+
+class LogScanner:
+    """
+    Fetches `eth_getLogs` windows for one contract concurrently.
+
+    Topics are filtered by the node. Windows that fail with a "too many results"
+    style error or a timeout are split in half and retried, and the window used
+    for new requests shrinks and regrows with the node's behaviour. Logs are
+    handed to the caller strictly in block order, and after every contiguous
+    run of finished windows the scan position is written to `checkpoint_path`
+    together with the caller's state, so an interrupted scan can resume there.
+    """
+
+    def __init__(self, w3, address, topics, window=DEFAULT_WINDOW, workers=DEFAULT_WORKERS, checkpoint_path=None):
+        self.w3 = w3
+        self.address = address
+        self.topics = topics
+        self.window = window
+        self.max_window = window
+        self.workers = workers
+        self.checkpoint_path = checkpoint_path
+
+    # ── Checkpointing ──
+
+    def _checkpoint_key(self, from_block):
+        return {"address": self.address, "topics": self.topics, "from_block": from_block}
+
+    def resume(self, from_block):
+        """
+        Returns (start_block, state). If a checkpoint for the same contract, topics
+        and starting block exists, scanning continues after its last finished window
+        and the state saved with it is returned; otherwise (from_block, None).
+        """
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return from_block, None
+        with open(self.checkpoint_path) as f:
+            checkpoint = json.load(f)
+        if checkpoint.get("key") != self._checkpoint_key(from_block):
+            print(f"Ignoring checkpoint {self.checkpoint_path}: it belongs to a different scan", file=sys.stderr)
+            return from_block, None
+        scanned_up_to = checkpoint["scanned_up_to"]
+        print(f"Resuming log scan after block {scanned_up_to} from {self.checkpoint_path}")
+        return scanned_up_to + 1, checkpoint.get("state")
+
+    def clear_checkpoint(self):
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+    def _save_checkpoint(self, from_block, scanned_up_to, state):
+        if not self.checkpoint_path:
+            return
+        _write_json_atomic({
+            "key": self._checkpoint_key(from_block),
+            "scanned_up_to": scanned_up_to,
+            "state": state,
+        }, self.checkpoint_path)
+
+    # ── Fetching ──
+
+    def _fetch(self, start, end, delay):
+        if delay:
+            time.sleep(delay)
+        return self.w3.eth.get_logs({
+            "fromBlock": start,
+            "toBlock":   end,
+            "address":   self.address,
+            "topics":    self.topics,
+        })
+
+    def scan(self, from_block, to_block, on_logs, get_state=lambda: None, checkpoint_from=None, on_progress=None):
+        """
+        Scans [from_block, to_block] and calls `on_logs(logs)` once per window in
+        block order. `get_state()` is saved with every checkpoint; `checkpoint_from`
+        is the block the whole scan originally started at (defaults to from_block).
+        `on_progress(scanned_up_to)` is called whenever the contiguous scan advances.
+        """
+        checkpoint_from = from_block if checkpoint_from is None else checkpoint_from
+        next_start = from_block
+        frontier = from_block
+        pending = {}
+        finished = {}
+
+        with instrument.stage("log_scan") as span, ThreadPoolExecutor(max_workers=self.workers) as pool:
+            def submit(start, end, attempt=0):
+                delay = RETRY_BACKOFF * (2 ** (attempt - 1)) if attempt else 0
+                pending[pool.submit(self._fetch, start, end, delay)] = (start, end, attempt)
+
+            while next_start <= to_block or pending:
+                while next_start <= to_block and len(pending) < self.workers:
+                    end = min(next_start + self.window - 1, to_block)
+                    print(f"Scanning logs from {next_start} to {end}…")
+                    submit(next_start, end)
+                    next_start = end + 1
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    start, end, attempt = pending.pop(future)
+                    try:
+                        logs = future.result()
+                    except Exception as e:
+                        if end > start and _is_range_error(e):
+                            # Split the window and use smaller windows from now on
+                            mid = (start + end) // 2
+                            self.window = max(1, min(self.window, end - start + 1) // 2)
+                            print(f"  window {start}-{end} too large ({e}); retrying as two halves", file=sys.stderr)
+                            submit(start, mid)
+                            submit(mid + 1, end)
+                        elif attempt < MAX_RETRIES:
+                            print(f"  window {start}-{end} failed ({e}); retry {attempt + 1}/{MAX_RETRIES}", file=sys.stderr)
+                            submit(start, end, attempt + 1)
+                        else:
+                            raise
+                        continue
+
+                    finished[start] = (end, logs)
+                    if self.window < self.max_window:
+                        # Regrow gently so one lucky window does not undo the backoff
+                        self.window = min(self.max_window, self.window + max(1, self.window // 4))
+
+                # Hand over every window that is now contiguous with the frontier
+                advanced = False
+                while frontier in finished:
+                    end, logs = finished.pop(frontier)
+                    span.items += len(logs)
+                    on_logs(logs)
+                    frontier = end + 1
+                    advanced = True
+                if advanced:
+                    self._save_checkpoint(checkpoint_from, frontier - 1, get_state())
+                    if on_progress is not None:
+                        on_progress(frontier - 1)
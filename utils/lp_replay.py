@@ -0,0 +1,343 @@
+import sys
+from collections import defaultdict
+from itertools import groupby
+
+from web3 import Web3
+from web3.exceptions import ContractLogicError
+
+import config.abis as abis
+from utils.addresses import ZERO_ADDRESS, address_bytes, raw_bytes, to_hex
+from utils.logscan import LogScanner
+from utils.onchain_lp import read_pool
+from utils.v3math import MAX_TICK, MIN_TICK, get_amounts_for_liquidity, get_sqrt_ratio_at_tick
+
+# ─── Event Topics ─────────────────────────────────────────────────────────────
+
+def _topic(signature):
+    return Web3.to_hex(Web3.keccak(text=signature))
+
+SWAP_TOPIC               = _topic("Swap(address,address,int256,int256,uint160,uint128,int24)")
+INCREASE_LIQUIDITY_TOPIC = _topic("IncreaseLiquidity(uint256,uint128,uint256,uint256)")
+DECREASE_LIQUIDITY_TOPIC = _topic("DecreaseLiquidity(uint256,uint128,uint256,uint256)")
+TRANSFER_TOPIC           = _topic("Transfer(address,address,uint256)")
+
+# ─── Helpers ──────────────────────────────────────────────────────────────────
+
+def _topic_int(topic):
+    return int.from_bytes(raw_bytes(topic), "big")
+
+
+def _topic_address(topic):
+    return to_hex(address_bytes(topic))
+
+
+def _data_words(log):
+    data = raw_bytes(log["data"])
+    return [int.from_bytes(data[i:i + 32], "big") for i in range(0, len(data), 32)]
+
+
+def _signed(word):
+    return word - (1 << 256) if word >> 255 else word
+
+# ─── Tick Range Index ─────────────────────────────────────────────────────────
+
+TICK_LEVELS = (MAX_TICK - MIN_TICK).bit_length()  # tree depth covering every tick
+
+
+class TickRanges:
+    """
+    Position ids of one pool indexed by tick range, so a price move finds the
+    positions it crosses without looking at the others. A segment tree over
+    tick space: each range is stored at the few nodes that tile it, and every
+    node counts the positions stored at or below it, so a query only descends
+    into subtrees that hold something and costs about the size of its answer.
+    """
+
+    def __init__(self):
+        self.nodes = defaultdict(set)   # (level, index) -> ids stored at that node
+        self.counts = defaultdict(int)  # (level, index) -> ids stored at or below it
+
+    @staticmethod
+    def _tiles(tick_lower, tick_upper):
+        """The nodes that exactly tile the ticks [tick_lower, tick_upper)."""
+        lo, hi, level = tick_lower - MIN_TICK, tick_upper - 1 - MIN_TICK, 0
+        while lo <= hi:
+            if lo & 1:
+                yield level, lo
+                lo += 1
+            if not hi & 1:
+                yield level, hi
+                hi -= 1
+            lo, hi, level = lo >> 1, hi >> 1, level + 1
+
+    def _update(self, token_id, tick_lower, tick_upper, add):
+        above = set()
+        for node in self._tiles(tick_lower, tick_upper):
+            if add:
+                self.nodes[node].add(token_id)
+            else:
+                self.nodes[node].discard(token_id)
+                if not self.nodes[node]:
+                    del self.nodes[node]
+            level, index = node
+            while level <= TICK_LEVELS and (level, index) not in above:
+                above.add((level, index))
+                level, index = level + 1, index >> 1
+        for node in above:
+            self.counts[node] += 1 if add else -1
+            if not self.counts[node]:
+                del self.counts[node]
+
+    def add(self, token_id, tick_lower, tick_upper):
+        self._update(token_id, tick_lower, tick_upper, add=True)
+
+    def remove(self, token_id, tick_lower, tick_upper):
+        self._update(token_id, tick_lower, tick_upper, add=False)
+
+    def overlapping(self, tick_low, tick_high):
+        """Ids of the positions whose range shares a tick with [tick_low, tick_high]."""
+        lo, hi = max(tick_low, MIN_TICK) - MIN_TICK, min(tick_high, MAX_TICK) - MIN_TICK
+        found = set()
+        stack = [(TICK_LEVELS, 0)]
+        while stack:
+            node = stack.pop()
+            level, index = node
+            if node not in self.counts or (index + 1) << level <= lo or index << level > hi:
+                continue
+            found.update(self.nodes.get(node, ()))
+            if level:
+                stack.append((level - 1, index * 2))
+                stack.append((level - 1, index * 2 + 1))
+        return found
+
+# ─── Replay Engine ────────────────────────────────────────────────────────────
+
+class LpReplay:
+    """
+    Moves an LP snapshot forward in time by replaying events instead of
+    re-crawling every position at every block.
+
+    Starts from the (pool, positions) of `pool_addresses` at `block` (as the
+    subgraph fetch or fetch_positions_onchain return them), then for each
+    later block applies pool `Swap` events (price) and NonfungiblePositionManager
+    `IncreaseLiquidity` / `DecreaseLiquidity` / `Transfer` events (liquidity,
+    mints, burns, owner changes). Only positions whose liquidity changed, or whose
+    range overlaps the pool's price move (looked up in a per-pool TickRanges
+    index), have their amounts recomputed.
+    """
+
+    def __init__(self, w3, position_manager, target_token, pool_addresses, pool_positions, block):
+        self.w3 = w3
+        self.target_token = target_token.lower()
+        self.block = block
+        self.manager = w3.eth.contract(
+            address=Web3.to_checksum_address(position_manager),
+            abi=abis.nonfungiblePositionManager(),
+        )
+
+        self.pools = {}
+        self.pool_by_key = {}
+        self.decimals = 0
+        for address in pool_addresses:
+            pool = read_pool(w3, address, block)
+            if pool["token0"]["id"] == self.target_token:
+                target_index, self.decimals = 0, int(pool["token0"]["decimals"])
+            elif pool["token1"]["id"] == self.target_token:
+                target_index, self.decimals = 1, int(pool["token1"]["decimals"])
+            else:
+                continue
+            self.pools[pool["id"]] = {
+                "sqrt_price": int(pool["sqrtPrice"]),
+                "tick": int(pool["tick"]),
+                "target_index": target_index,
+                "positions": TickRanges(),
+            }
+            self.pool_by_key[(pool["token0"]["id"], pool["token1"]["id"], pool["fee"])] = pool["id"]
+
+        self.positions = {}
+        self.amounts = {}
+        self.totals = defaultdict(int)
+        self.ignored = set()  # position NFTs of pools we do not track
+        self.touched = set()  # owners whose totals the last applied events changed
+
+        for pool_address, (_pool, positions) in zip(pool_addresses, pool_positions):
+            pool_id = pool_address.lower()
+            if pool_id not in self.pools:
+                continue
+            for pos in positions:
+                self._add_position(pos.id, pool_id, pos.owner, pos.tick_lower, pos.tick_upper, pos.liquidity)
+        for token_id in self.positions:
+            self._refresh(token_id)
+
+    # ── Position bookkeeping ──
+
+    def _add_position(self, token_id, pool_id, owner, tick_lower, tick_upper, liquidity):
+        self.positions[token_id] = {
+            "pool": pool_id,
+            "owner": owner,
+            "tick_lower": tick_lower,
+            "tick_upper": tick_upper,
+            "sqrt_lower": get_sqrt_ratio_at_tick(tick_lower),
+            "sqrt_upper": get_sqrt_ratio_at_tick(tick_upper),
+            "liquidity": liquidity,
+        }
+        self.pools[pool_id]["positions"].add(token_id, tick_lower, tick_upper)
+
+    def _remove_position(self, token_id):
+        pos = self.positions.pop(token_id)
+        self.totals[pos["owner"]] -= self.amounts.pop(token_id, 0)
+        self.touched.add(pos["owner"])
+        self.pools[pos["pool"]]["positions"].remove(token_id, pos["tick_lower"], pos["tick_upper"])
+
+    def _refresh(self, token_id):
+        pos = self.positions[token_id]
+        pool = self.pools[pos["pool"]]
+        amount = get_amounts_for_liquidity(
+            pool["sqrt_price"], pos["sqrt_lower"], pos["sqrt_upper"], pos["liquidity"]
+        )[pool["target_index"]] if pos["liquidity"] else 0
+        self.totals[pos["owner"]] += amount - self.amounts.get(token_id, 0)
+        self.amounts[token_id] = amount
+        self.touched.add(pos["owner"])
+
+    def _track(self, token_id, block, owner=None, minted=False):
+        """
+        Starts tracking a position that was not in the base snapshot, if it
+        belongs to one of our pools. A freshly `minted` one (`owner` given by its
+        mint Transfer) starts empty, as its IncreaseLiquidity follows; otherwise
+        its state before `block` is read, with `owner` overriding the one before
+        `block` when the token already changed hands earlier in it.
+        """
+        read_at = block if minted else block - 1
+        try:
+            fields = self.manager.functions.positions(token_id).call(block_identifier=read_at)
+        except ContractLogicError:
+            if not minted:
+                raise
+            # Minted and burned within the block (a zap or rebalance): it holds
+            # nothing at the block's end, so its events are skipped
+            self.ignored.add(token_id)
+            return False
+        token0, token1, fee, tick_lower, tick_upper, liquidity = (
+            fields[2].lower(), fields[3].lower(), fields[4], fields[5], fields[6], fields[7]
+        )
+        pool_id = self.pool_by_key.get((token0, token1, fee))
+        if pool_id is None:
+            self.ignored.add(token_id)
+            return False
+        if owner is None:
+            owner = self.manager.functions.ownerOf(token_id).call(block_identifier=read_at).lower()
+        self._add_position(token_id, pool_id, owner, tick_lower, tick_upper, 0 if minted else liquidity)
+        return True
+
+    # ── Replay ──
+
+    def _fetch_logs(self, from_block, to_block):
+        pool_scanner = LogScanner(
+            self.w3, [Web3.to_checksum_address(p) for p in self.pools], [[SWAP_TOPIC]]
+        )
+        manager_scanner = LogScanner(
+            self.w3, self.manager.address,
+            [[INCREASE_LIQUIDITY_TOPIC, DECREASE_LIQUIDITY_TOPIC, TRANSFER_TOPIC]],
+        )
+        logs = []
+        pool_scanner.scan(from_block, to_block, logs.extend)
+        manager_scanner.scan(from_block, to_block, logs.extend)
+        logs.sort(key=lambda log: (log["blockNumber"], log["logIndex"]))
+        return logs
+
+    def _apply(self, logs):
+        """Applies `logs` in order and recomputes what changed; returns the number of positions recomputed."""
+        start_prices = {pool_id: (pool["sqrt_price"], pool["tick"]) for pool_id, pool in self.pools.items()}
+        dirty = set()
+        self.touched = set()
+        moved = {}  # untracked token id -> (block, recipient) of its latest Transfer
+
+        for log in logs:
+            topic0 = Web3.to_hex(raw_bytes(log["topics"][0]))
+            address = log["address"].lower()
+
+            if topic0 == SWAP_TOPIC and address in self.pools:
+                words = _data_words(log)
+                self.pools[address]["sqrt_price"] = words[2]
+                self.pools[address]["tick"] = _signed(words[4])
+
+            elif topic0 == TRANSFER_TOPIC and len(log["topics"]) == 4:
+                sender = _topic_address(log["topics"][1])
+                recipient = _topic_address(log["topics"][2])
+                token_id = _topic_int(log["topics"][3])
+                if sender == ZERO_ADDRESS:
+                    self._track(token_id, log["blockNumber"], owner=recipient, minted=True)
+                elif token_id in self.positions:
+                    if recipient == ZERO_ADDRESS:
+                        self._remove_position(token_id)
+                        dirty.discard(token_id)
+                    else:
+                        pos = self.positions[token_id]
+                        amount = self.amounts.get(token_id, 0)
+                        self.totals[pos["owner"]] -= amount
+                        self.totals[recipient] += amount
+                        self.touched.update((pos["owner"], recipient))
+                        pos["owner"] = recipient
+                else:
+                    moved[token_id] = (log["blockNumber"], recipient)
+
+            elif topic0 in (INCREASE_LIQUIDITY_TOPIC, DECREASE_LIQUIDITY_TOPIC):
+                token_id = _topic_int(log["topics"][1])
+                if token_id in self.ignored:
+                    continue
+                if token_id not in self.positions:
+                    # ownerOf before the block misses a Transfer earlier in the same block
+                    moved_block, owner = moved.pop(token_id, (None, None))
+                    if moved_block != log["blockNumber"]:
+                        owner = None
+                    if not self._track(token_id, log["blockNumber"], owner=owner):
+                        continue
+                delta = _data_words(log)[0]
+                if topic0 == DECREASE_LIQUIDITY_TOPIC:
+                    delta = -delta
+                self.positions[token_id]["liquidity"] += delta
+                dirty.add(token_id)
+
+        # Out-of-range positions hold a fixed amount of one token, so a price move
+        # only affects positions whose range overlaps the interval it moved over.
+        # The tick index narrows them down; the exact test is on sqrt prices.
+        for pool_id, pool in self.pools.items():
+            (old, old_tick), new = start_prices[pool_id], pool["sqrt_price"]
+            if old == new:
+                continue
+            low, high = min(old, new), max(old, new)
+            for token_id in pool["positions"].overlapping(min(old_tick, pool["tick"]), max(old_tick, pool["tick"])):
+                pos = self.positions[token_id]
+                if pos["sqrt_lower"] < high and pos["sqrt_upper"] > low:
+                    dirty.add(token_id)
+
+        for token_id in dirty:
+            self._refresh(token_id)
+        return len(dirty)
+
+    def advance(self, to_block, on_block=None):
+        """
+        Applies every event in (current block, to_block] and recomputes what
+        changed. With `on_block(block, {owner: total})`, events are applied one
+        block at a time and each block with events reports the owners whose
+        totals it changed.
+        """
+        if to_block <= self.block:
+            raise ValueError(f"can only move forward from block {self.block}, not to {to_block}")
+
+        logs = self._fetch_logs(self.block + 1, to_block)
+        if on_block is None:
+            recomputed = self._apply(logs)
+        else:
+            recomputed = 0
+            for block, block_logs in groupby(logs, key=lambda log: log["blockNumber"]):
+                recomputed += self._apply(block_logs)
+                self.block = block
+                on_block(block, {owner: self.totals[owner] for owner in self.touched})
+
+        print(f"Replayed {len(logs)} events up to block {to_block}, recomputed {recomputed} positions", file=sys.stderr)
+        self.block = to_block
+
+    def owner_totals(self):
+        """{owner: raw target token amount} at the current block."""
+        return {owner: total for owner, total in self.totals.items() if total > 0}
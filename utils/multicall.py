@@ -0,0 +1,154 @@
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from web3 import Web3
+
+from utils import instrument
+from utils.raw_call import RawFunction, decode_aggregate3, encode_aggregate3
+
+# ─── Configuration ────────────────────────────────────────────────────────────
+
+# Multicall3 is deployed at the same address on every EVM chain that has it
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+DEFAULT_BATCH_SIZE = 500
+
+BALANCE_OF = RawFunction("balanceOf(address)", ("uint256",))
+BALANCE_OF_SELECTOR = BALANCE_OF.selector
+
+# ─── Helpers ──────────────────────────────────────────────────────────────────
+
+def balance_of_calldata(holder) -> bytes:
+    """
+    ABI-encodes `balanceOf(holder)` without going through a contract object.
+    `holder` is a hex address or its 20 raw bytes.
+    """
+    return BALANCE_OF.encode(holder)
+
+
+def decode_uint256(data: bytes) -> int:
+    if len(data) < 32:
+        raise ValueError(f"Expected a 32-byte uint256 return, got {len(data)} bytes")
+    return int.from_bytes(data[:32], "big")
+
+# ─── Batch Caller ─────────────────────────────────────────────────────────────
+
+class BatchCaller:
+    """
+    Runs many read-only calls pinned to one block in as few round trips as possible.
+
+    Calls are packed into Multicall3 `aggregate3` eth_calls of `batch_size` entries,
+    encoded and decoded directly from bytes rather than through a contract object.
+    If no multicall contract exists at the pinned block, the same calls are sent as
+    JSON-RPC batch requests of `batch_size` eth_calls instead. Up to `workers`
+    batches are in flight at once, which pays off on a pooled multi-node provider.
+    """
+
+    def __init__(self, w3, block, batch_size=DEFAULT_BATCH_SIZE, multicall_address=MULTICALL3_ADDRESS, workers=None):
+        self.w3 = w3
+        self.block = block
+        self.batch_size = batch_size
+        self.workers = workers or getattr(w3.provider, "max_inflight", 1)
+        self.round_trips = 0
+        self.multicall = None
+
+        if multicall_address:
+            address = Web3.to_checksum_address(multicall_address)
+            if len(w3.eth.get_code(address, block_identifier=block)) > 0:
+                self.multicall = address
+
+        if self.multicall is None:
+            print(f"No multicall contract at block {block}, falling back to JSON-RPC batches", file=sys.stderr)
+            self.session = requests.Session()
+
+    def at(self, block):
+        """
+        Re-pins the caller to a later `block`, keeping the multicall contract
+        found at its first one, so reads over a run of blocks probe only once.
+        """
+        self.block = block
+        return self
+
+    def call(self, calls):
+        """
+        Executes `calls`, a list of (target, calldata) pairs, and returns the raw
+        return data of each call in the same order. Any reverted call raises.
+        """
+        chunks = [calls[start:start + self.batch_size] for start in range(0, len(calls), self.batch_size)]
+        run = self._call_multicall if self.multicall is not None else self._call_rpc_batch
+        self.round_trips += len(chunks)
+
+        if self.workers <= 1 or len(chunks) <= 1:
+            chunk_results = map(run, chunks)
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(chunks))) as pool:
+                chunk_results = list(pool.map(run, chunks))
+
+        return [data for chunk in chunk_results for data in chunk]
+
+    def call_uint256(self, calls):
+        return [decode_uint256(data) for data in self.call(calls)]
+
+    def call_function(self, function, target, args):
+        """
+        Calls RawFunction `function` on `target` once per argument tuple in
+        `args` and returns the decoded results in the same order.
+        """
+        decode = function.decode
+        return [decode(data) for data in self.call([(target, function.encode(*a)) for a in args])]
+
+    def _call_multicall(self, chunk):
+        calldata = encode_aggregate3(chunk)
+        returned = self.w3.eth.call({"to": self.multicall, "data": "0x" + calldata.hex()}, block_identifier=self.block)
+        return [data for _success, data in decode_aggregate3(returned)]
+
+    def _call_rpc_batch(self, chunk):
+        block_hex = hex(self.block) if isinstance(self.block, int) else self.block
+        params = [
+            [{"to": target, "data": "0x" + calldata.hex()}, block_hex]
+            for target, calldata in chunk
+        ]
+
+        # Serve what we can from the provider's response cache, if it has one
+        cache = getattr(self.w3.provider, "cache", None) if isinstance(self.block, int) else None
+        if cache is not None and not self.w3.provider.is_final(self.block):
+            cache = None
+        results = [None] * len(chunk)
+        if cache is not None:
+            keys = [cache.key("eth_call", p) for p in params]
+            for i, key in enumerate(keys):
+                cached = cache.get(key)
+                instrument.record_cache("eth_call", cached is not None)
+                if cached is not None:
+                    results[i] = bytes.fromhex(cached[2:])
+
+        batch = [
+            {"jsonrpc": "2.0", "id": i, "method": "eth_call", "params": params[i]}
+            for i in range(len(chunk))
+            if results[i] is None
+        ]
+        if not batch:
+            return results
+
+        post_json = getattr(self.w3.provider, "post_json", None)
+        if post_json is not None:
+            returned = post_json(json.dumps(batch).encode(), label="eth_call (batch)", items=len(batch))
+        else:
+            resp = self.session.post(self.w3.provider.endpoint_uri, json=batch, timeout=120)
+            resp.raise_for_status()
+            returned = resp.json()
+
+        # Responses to a batch may come back in any order
+        by_id = {item["id"]: item for item in returned}
+        for request in batch:
+            i = request["id"]
+            item = by_id.get(i)
+            if item is None or "error" in item:
+                error = item.get("error") if item else "missing response"
+                raise RuntimeError(f"eth_call to {chunk[i][0]} failed in batch: {error}")
+            results[i] = bytes.fromhex(item["result"][2:])
+            if cache is not None:
+                cache.put(keys[i], item["result"])
+        return results
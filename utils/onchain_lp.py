@@ -0,0 +1,103 @@
+import sys
+from collections import namedtuple
+from web3 import Web3
+
+import config.abis as abis
+from utils.addresses import to_hex
+from utils.multicall import BatchCaller, DEFAULT_BATCH_SIZE, MULTICALL3_ADDRESS
+from utils.raw_call import RawFunction
+
+# One LP position as the snapshot scripts use it, whichever source it came from:
+# NFT id, lowercase owner, tick range and liquidity, all plain ints but the owner
+Position = namedtuple("Position", "id owner tick_lower tick_upper liquidity")
+
+# ─── Calls ────────────────────────────────────────────────────────────────────
+
+# NonfungiblePositionManager reads, compiled once and decoded straight from bytes
+TOKEN_BY_INDEX = RawFunction("tokenByIndex(uint256)", ("uint256",))
+POSITIONS      = RawFunction.from_abi("nonfungiblePositionManager", "positions")
+OWNER_OF       = RawFunction("ownerOf(uint256)", ("address",))
+
+# ─── On-chain Position Reader ─────────────────────────────────────────────────
+
+def read_pool(w3, pool_address: str, block: int) -> dict:
+    """
+    Reads token0/token1/fee, the token decimals and slot0 of a V3 pool once, in
+    the same shape as the subgraph's `pool` object.
+    """
+    pool = w3.eth.contract(address=Web3.to_checksum_address(pool_address), abi=abis.uniV3Pool())
+    token0 = pool.functions.token0().call(block_identifier=block)
+    token1 = pool.functions.token1().call(block_identifier=block)
+    fee = pool.functions.fee().call(block_identifier=block)
+    sqrt_price, tick, *_ = pool.functions.slot0().call(block_identifier=block)
+
+    def decimals(address):
+        token = w3.eth.contract(address=address, abi=abis.erc20())
+        return token.functions.decimals().call(block_identifier=block)
+
+    return {
+        "id": pool_address.lower(),
+        "fee": fee,
+        "tick": str(tick),
+        "sqrtPrice": str(sqrt_price),
+        "token0": {"id": token0.lower(), "decimals": str(decimals(token0))},
+        "token1": {"id": token1.lower(), "decimals": str(decimals(token1))},
+    }
+
+
+def fetch_positions_onchain(
+    w3,
+    position_manager: str,
+    pool_addresses: list[str],
+    block: int,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    multicall_address: str = MULTICALL3_ADDRESS,
+) -> list[tuple[dict, list[Position]]]:
+    """
+    Rebuilds the non-zero-liquidity positions of each pool at `block` straight
+    from a NonfungiblePositionManager, without the subgraph: enumerate every
+    position NFT, batch-read `positions(tokenId)`, keep those belonging to one
+    of the pools, then batch-read `ownerOf` for them.
+
+    Returns (pool, positions) per pool, in `pool_addresses` order, with the pool
+    shaped like the subgraph's `pool` and the positions as Position tuples, so
+    the same amount math and output code applies. Works against any node,
+    including a local Anvil or Hardhat chain with the contracts deployed, and
+    against the synthetic chain used by `bench.py synthetic`.
+    """
+    manager = w3.eth.contract(
+        address=Web3.to_checksum_address(position_manager),
+        abi=abis.nonfungiblePositionManager(),
+    )
+    caller = BatchCaller(w3, block, batch_size=batch_size, multicall_address=multicall_address)
+
+    pools = [read_pool(w3, address, block) for address in pool_addresses]
+    pool_keys = {
+        (pool["token0"]["id"], pool["token1"]["id"], pool["fee"]): i
+        for i, pool in enumerate(pools)
+    }
+
+    # 1) Enumerate token ids
+    total = manager.functions.totalSupply().call(block_identifier=block)
+    print(f"Enumerating {total} position NFTs at block {block}...", file=sys.stderr)
+    manager_address = manager.address
+    token_ids = caller.call_function(TOKEN_BY_INDEX, manager_address, ((i,) for i in range(total)))
+
+    # 2) Read every position and keep the ones in our pools
+    positions = caller.call_function(POSITIONS, manager_address, ((token_id,) for token_id in token_ids))
+    matched = []
+    for token_id, fields in zip(token_ids, positions):
+        _nonce, _operator, token0, token1, fee, tick_lower, tick_upper, liquidity, *_ = fields
+        pool_index = pool_keys.get((to_hex(token0), to_hex(token1), fee))
+        if pool_index is None or liquidity == 0:
+            continue
+        matched.append((pool_index, token_id, tick_lower, tick_upper, liquidity))
+
+    # 3) Owners of the matched positions only
+    owners = caller.call_function(OWNER_OF, manager_address, ((token_id,) for _, token_id, *_ in matched))
+    print(f"Read {len(matched)} matching positions in {caller.round_trips} round trips", file=sys.stderr)
+
+    result = [(pool, []) for pool in pools]
+    for (pool_index, token_id, tick_lower, tick_upper, liquidity), owner in zip(matched, owners):
+        result[pool_index][1].append(Position(token_id, to_hex(owner), tick_lower, tick_upper, liquidity))
+    return result
@@ -0,0 +1,137 @@
+import re
+
+from web3 import Web3
+
+import config.abis as abis
+
+# ─── Configuration ────────────────────────────────────────────────────────────
+
+WORD = 32
+
+# Multicall3 aggregate3((address target, bool allowFailure, bytes callData)[])
+#   -> ((bool success, bytes returnData)[])
+AGGREGATE3 = bytes(Web3.keccak(text="aggregate3((address,bool,bytes)[])")[:4])
+
+# ─── Word Codecs ──────────────────────────────────────────────────────────────
+#
+# Only static types are supported: each argument and return value is exactly
+# one 32-byte word, so a whole call is encoded by concatenation and a return
+# is decoded by slicing at fixed offsets, with no ABI walk per call.
+
+_STATIC = re.compile(r"^(address|bool|u?int\d*|bytes([1-9]|[12]\d|3[0-2]))$")
+
+
+def _encode_address(value):
+    if isinstance(value, str):
+        value = bytes.fromhex(value[2:])
+    return bytes(12) + value
+
+
+def _encoder(type_):
+    if type_ == "address":
+        return _encode_address
+    if type_ == "bool":
+        return lambda value: (1 if value else 0).to_bytes(WORD, "big")
+    if type_.startswith("uint"):
+        return lambda value: value.to_bytes(WORD, "big")
+    if type_.startswith("int"):
+        return lambda value: value.to_bytes(WORD, "big", signed=True)
+    return lambda value: bytes(value).ljust(WORD, b"\0")
+
+
+def _decoder(type_):
+    if type_ == "address":
+        return lambda word: word[12:]   # 20 raw bytes, see utils.addresses
+    if type_ == "bool":
+        return lambda word: word[-1] != 0
+    if type_.startswith("uint"):
+        return lambda word: int.from_bytes(word, "big")
+    if type_.startswith("int"):
+        # Signed values are sign-extended to the full word
+        return lambda word: int.from_bytes(word, "big", signed=True)
+    size = int(type_[len("bytes"):])
+    return lambda word: word[:size]
+
+# ─── Raw Functions ────────────────────────────────────────────────────────────
+
+class RawFunction:
+    """
+    A contract function compiled once into its selector and per-word codecs.
+    `encode(*args)` returns the calldata and `decode(data)` the return values:
+    the value itself for a single return, otherwise a tuple. Addresses are
+    accepted as hex or 20 raw bytes and returned as 20 raw bytes.
+    """
+
+    def __init__(self, signature, outputs=()):
+        name, _, inputs = signature.partition("(")
+        inputs = [t for t in inputs.rstrip(")").split(",") if t]
+        for type_ in (*inputs, *outputs):
+            if not _STATIC.match(type_):
+                raise ValueError(f"{signature}: {type_} is not a single-word static type")
+
+        self.name = name
+        self.signature = signature
+        self.selector = bytes(Web3.keccak(text=signature)[:4])
+        self.outputs = tuple(outputs)
+        self._encoders = [_encoder(t) for t in inputs]
+        self._decoders = [_decoder(t) for t in outputs]
+        self._size = WORD * len(outputs)
+
+    @classmethod
+    def from_abi(cls, abi_name, function):
+        """Compiles `function` (the first overload) from a registered ABI."""
+        for entry in abis.get(abi_name):
+            if entry.get("type") == "function" and entry["name"] == function:
+                return cls(abis.signature(entry), abis.output_types(entry))
+        raise KeyError(f"{function} not in ABI {abi_name}")
+
+    def encode(self, *args):
+        if len(args) != len(self._encoders):
+            raise TypeError(f"{self.signature} takes {len(self._encoders)} arguments, got {len(args)}")
+        return self.selector + b"".join(encode(arg) for encode, arg in zip(self._encoders, args))
+
+    def decode(self, data):
+        if len(data) < self._size:
+            raise ValueError(f"{self.signature}: expected {self._size} bytes of return data, got {len(data)}")
+        data = bytes(data)
+        values = tuple(decode(data[i * WORD:(i + 1) * WORD]) for i, decode in enumerate(self._decoders))
+        return values[0] if len(values) == 1 else values
+
+    def call(self, w3, target, *args, block="latest"):
+        """One eth_call of this function, bypassing web3's contract layer."""
+        data = w3.eth.call({"to": target, "data": "0x" + self.encode(*args).hex()}, block_identifier=block)
+        return self.decode(data)
+
+# ─── Multicall3 ───────────────────────────────────────────────────────────────
+
+def encode_aggregate3(calls, allow_failure=False):
+    """Calldata of aggregate3 over (target, calldata) pairs."""
+    flag = (1 if allow_failure else 0).to_bytes(WORD, "big")
+    heads, tails = [], []
+    offset = WORD * len(calls)
+    for target, calldata in calls:
+        padded = calldata + bytes(-len(calldata) % WORD)
+        # Each Call3 tuple: target, allowFailure, offset of callData (3 words), callData
+        element = _encode_address(target) + flag + (3 * WORD).to_bytes(WORD, "big") \
+            + len(calldata).to_bytes(WORD, "big") + padded
+        heads.append(offset.to_bytes(WORD, "big"))
+        tails.append(element)
+        offset += len(element)
+    return (AGGREGATE3 + WORD.to_bytes(WORD, "big") + len(calls).to_bytes(WORD, "big")
+            + b"".join(heads) + b"".join(tails))
+
+
+def decode_aggregate3(data):
+    """[(success, return data)] from an aggregate3 return."""
+    data = bytes(data)
+    base = int.from_bytes(data[:WORD], "big")
+    count = int.from_bytes(data[base:base + WORD], "big")
+    items = base + WORD
+    results = []
+    for i in range(count):
+        start = items + int.from_bytes(data[items + i * WORD:items + (i + 1) * WORD], "big")
+        success = data[start + WORD - 1] != 0
+        data_at = start + int.from_bytes(data[start + WORD:start + 2 * WORD], "big")
+        length = int.from_bytes(data[data_at:data_at + WORD], "big")
+        results.append((success, data[data_at + WORD:data_at + WORD + length]))
+    return results
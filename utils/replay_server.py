@@ -0,0 +1,271 @@
+import hashlib
+import json
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# ─── Configuration ────────────────────────────────────────────────────────────
+
+RPC_ROUTE     = "/rpc"
+GRAPHQL_ROUTE = "/graphql"
+
+UPSTREAM_TIMEOUT = 120
+
+# ─── Fixtures ─────────────────────────────────────────────────────────────────
+
+def request_key(route, payload):
+    """
+    Identity of one request, independent of the JSON-RPC id it was sent with:
+    (method, params) for JSON-RPC, (query, variables) for GraphQL.
+    """
+    if route == RPC_ROUTE:
+        identity = [route, payload["method"], payload.get("params", [])]
+    else:
+        identity = [route, payload.get("query"), payload.get("variables")]
+    return hashlib.sha256(json.dumps(identity, sort_keys=True).encode()).hexdigest()
+
+
+class FixtureStore:
+    """
+    Recorded responses keyed by request_key(), kept in an NDJSON file with one
+    {"key", "route", "request", "response"} line per request, plus {"meta": ...}
+    lines describing the recorded run.
+    """
+
+    def __init__(self, path, mode="r"):
+        self.path = path
+        self.responses = {}
+        self.meta = {}
+        self.lock = threading.Lock()
+        self._file = None
+
+        if mode == "r":
+            with open(path) as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    entry = json.loads(line)
+                    if "meta" in entry:
+                        self.meta.update(entry["meta"])
+                    else:
+                        self.responses[entry["key"]] = entry["response"]
+        else:
+            self._file = open(path, "w")
+
+    def get(self, key):
+        return self.responses.get(key)
+
+    def add(self, route, request, response):
+        key = request_key(route, request)
+        with self.lock:
+            if key in self.responses:
+                return
+            self.responses[key] = response
+            self._file.write(json.dumps({"key": key, "route": route, "request": request, "response": response}) + "\n")
+
+    def add_meta(self, **meta):
+        with self.lock:
+            self.meta.update(meta)
+            self._file.write(json.dumps({"meta": meta}) + "\n")
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+
+# ─── Backends ─────────────────────────────────────────────────────────────────
+#
+# A backend answers one JSON-RPC request ({"jsonrpc", "id", "method", "params"})
+# with a response dict, or one GraphQL request with (HTTP status, response).
+
+def _rpc_error(request, message, code=-32000):
+    return {"jsonrpc": "2.0", "id": request.get("id"), "error": {"code": code, "message": message}}
+
+
+class ReplayBackend:
+    """Serves a FixtureStore; requests that were never recorded get an error."""
+
+    def __init__(self, store):
+        self.store = store
+        self.misses = 0
+
+    def rpc(self, request):
+        response = self.store.get(request_key(RPC_ROUTE, request))
+        if response is None:
+            self.misses += 1
+            return _rpc_error(request, f"no recorded response for {request['method']}")
+        return dict(response, id=request.get("id"))
+
+    def graphql(self, request):
+        response = self.store.get(request_key(GRAPHQL_ROUTE, request))
+        if response is None:
+            self.misses += 1
+            return 500, {"errors": [{"message": "no recorded response"}]}
+        return 200, response
+
+
+class RecordingBackend:
+    """Forwards every request to the real endpoints and records the answers."""
+
+    def __init__(self, store, rpc_url, graphql_url):
+        self.store = store
+        self.upstreams = {RPC_ROUTE: rpc_url, GRAPHQL_ROUTE: graphql_url}
+
+    def _forward(self, route, payload):
+        request = urllib.request.Request(
+            self.upstreams[route], data=json.dumps(payload).encode(),
+            headers={"Content-Type": "application/json"},
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=UPSTREAM_TIMEOUT) as resp:
+                return resp.status, json.loads(resp.read())
+        except urllib.error.HTTPError as e:
+            return e.code, None
+
+    def rpc_batch(self, requests_):
+        # Batches are forwarded as they are; every item is recorded on its own so
+        # the replay does not depend on how calls happened to be grouped
+        status, responses = self._forward(RPC_ROUTE, requests_)
+        if status != 200 or not isinstance(responses, list):
+            return None
+        by_id = {response.get("id"): response for response in responses}
+        for request in requests_:
+            response = by_id.get(request.get("id"))
+            if response is not None and "error" not in response:
+                self.store.add(RPC_ROUTE, request, response)
+        return responses
+
+    def rpc(self, request):
+        status, response = self._forward(RPC_ROUTE, request)
+        if status != 200 or response is None:
+            return _rpc_error(request, f"upstream answered HTTP {status}")
+        if "error" not in response:
+            self.store.add(RPC_ROUTE, request, response)
+        return response
+
+    def graphql(self, request):
+        status, response = self._forward(GRAPHQL_ROUTE, request)
+        if status == 200 and response is not None and "errors" not in response:
+            self.store.add(GRAPHQL_ROUTE, request, response)
+        return status, response
+
+# ─── Server ───────────────────────────────────────────────────────────────────
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, payload, headers=()):
+        body = json.dumps(payload).encode() if payload is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        server = self.server.replay
+        payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        route = self.path.rstrip("/") or "/"
+        server.delay()
+
+        if route == RPC_ROUTE:
+            # Only JSON-RPC traffic gets injected failures: the RPC pool retries
+            # them, while the subgraph client treats any failure as fatal
+            failure = server.injected_failure()
+            if failure is not None:
+                self._send(failure, {"error": "injected failure"}, [("Retry-After", "0")])
+                return
+            self._send(200, server.answer_rpc(payload))
+        elif route == GRAPHQL_ROUTE:
+            status, response = server.backend.graphql(payload)
+            server.count(GRAPHQL_ROUTE)
+            self._send(status, response)
+        else:
+            self._send(404, {"error": f"unknown route {self.path}"})
+
+
+class ReplayServer:
+    """
+    Local stand-in for the RPC node (RPC_ROUTE) and the subgraph (GRAPHQL_ROUTE)
+    on 127.0.0.1, serving any backend on a thread per connection. Every request
+    is delayed by `latency` seconds plus up to `jitter` seconds, and a fraction
+    `error_rate` of RPC requests fails with HTTP 429 or 503.
+    """
+
+    def __init__(self, backend, latency=0.0, jitter=0.0, error_rate=0.0, seed=0, port=0):
+        self.backend = backend
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = {}
+        self.injected = 0
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.replay = self
+        self._thread = None
+
+    def url(self, route):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}{route}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="replay-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    # ── Request handling ──
+
+    def count(self, route, n=1):
+        with self.lock:
+            self.requests[route] = self.requests.get(route, 0) + n
+
+    def delay(self):
+        if self.latency or self.jitter:
+            with self.lock:
+                extra = self.random.uniform(0, self.jitter) if self.jitter else 0.0
+            time.sleep(self.latency + extra)
+
+    def injected_failure(self):
+        if not self.error_rate:
+            return None
+        with self.lock:
+            if self.random.random() >= self.error_rate:
+                return None
+            self.injected += 1
+            return self.random.choice((429, 503))
+
+    def answer_rpc(self, payload):
+        if isinstance(payload, list):
+            self.count(RPC_ROUTE, len(payload))
+            batch = getattr(self.backend, "rpc_batch", None)
+            responses = batch(payload) if batch is not None else None
+            if responses is None:
+                responses = [self.backend.rpc(request) for request in payload]
+            return responses
+        self.count(RPC_ROUTE)
+        return self.backend.rpc(payload)
+
+    def summary(self):
+        counts = ", ".join(f"{route} {n}" for route, n in sorted(self.requests.items()))
+        misses = getattr(self.backend, "misses", 0)
+        return f"Stand-in server: {counts or 'no requests'}; {self.injected} injected failures, {misses} misses"
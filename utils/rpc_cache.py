@@ -0,0 +1,252 @@
+import atexit
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+from web3 import HTTPProvider
+
+from utils import instrument
+
+# ─── Configuration ────────────────────────────────────────────────────────────
+
+DEFAULT_MAX_BYTES     = 512 * 1024 * 1024
+DEFAULT_CONFIRMATIONS = 64  # blocks behind head treated as final for eth_getLogs
+HEAD_TTL              = 5.0 # seconds a fetched head is trusted before asking the node again
+TOUCH_BATCH           = 256 # cache hits whose recency is written per transaction
+
+# decimals() never changes once a token is deployed, so it is cached even when
+# called at "latest"
+IMMUTABLE_SELECTORS = {"0x313ce567"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key       TEXT    PRIMARY KEY,
+    value     BLOB    NOT NULL,
+    size      INTEGER NOT NULL,
+    last_used REAL    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used);
+CREATE TABLE IF NOT EXISTS meta (
+    name  TEXT    PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+# ─── Helpers ──────────────────────────────────────────────────────────────────
+
+def _block_number(tag):
+    """Numeric block of a JSON-RPC block tag, or None for "latest", "pending", etc."""
+    if isinstance(tag, int):
+        return tag
+    if isinstance(tag, str) and tag.startswith("0x"):
+        return int(tag, 16)
+    return None
+
+
+def _to_jsonable(value):
+    if isinstance(value, (bytes, bytearray)):
+        return "0x" + bytes(value).hex()
+    if isinstance(value, dict):
+        return {k: _to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_jsonable(v) for v in value]
+    return value
+
+# ─── Cache ────────────────────────────────────────────────────────────────────
+
+class RpcCache:
+    """
+    Content-addressed SQLite store of JSON-RPC results. Keys are a hash of the
+    method and its canonical params (for eth_call: block, to and calldata).
+    Total size is capped at `max_bytes`, evicting least recently used entries.
+    Hits record their recency in memory and write it in batches, so a run of
+    pure hits never holds a write transaction open against other processes.
+    The highest head seen is kept too, so a rerun over blocks already known
+    final can be served without asking the node for its head again.
+    """
+
+    def __init__(self, path, max_bytes=DEFAULT_MAX_BYTES):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._touched = {}  # key -> last_used of hits not yet written
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.executescript(SCHEMA)
+        self.size = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        row = self.conn.execute("SELECT value FROM meta WHERE name = 'head'").fetchone()
+        self.head = row[0] if row else None
+        atexit.register(self._flush_at_exit)
+
+    @staticmethod
+    def key(method, params):
+        canonical = json.dumps([method, _to_jsonable(params)], sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def get(self, key):
+        with self._lock:
+            row = self.conn.execute("SELECT value FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._touched[key] = time.time()
+            if len(self._touched) >= TOUCH_BATCH:
+                with self.conn:
+                    self._write_touches()
+            return json.loads(row[0])
+
+    def put(self, key, result):
+        value = json.dumps(_to_jsonable(result), separators=(",", ":")).encode()
+        with self._lock, self.conn:
+            self._write_touches()
+            old = self.conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, last_used) VALUES (?, ?, ?, ?)",
+                (key, value, len(value), time.time()),
+            )
+            self.size += len(value) - (old[0] if old else 0)
+            self._evict()
+
+    def set_head(self, block):
+        with self._lock, self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('head', ?)", (block,))
+            self.head = block
+
+    def _write_touches(self):
+        """Writes pending hit recency; the caller commits."""
+        if self._touched:
+            self.conn.executemany(
+                "UPDATE responses SET last_used = ? WHERE key = ?",
+                [(last_used, key) for key, last_used in self._touched.items()],
+            )
+            self._touched.clear()
+
+    def flush(self):
+        with self._lock, self.conn:
+            self._write_touches()
+
+    def _flush_at_exit(self):
+        # Owners close the cache, so this only catches the ones that did not;
+        # by now the file may be gone (a temporary workdir), and recency is
+        # not worth a traceback
+        try:
+            self.flush()
+        except sqlite3.Error:
+            pass
+
+    def _evict(self):
+        while self.size > self.max_bytes:
+            rows = self.conn.execute(
+                "SELECT key, size FROM responses ORDER BY last_used LIMIT 256"
+            ).fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.size -= size
+                if self.size <= self.max_bytes:
+                    break
+
+    def summary(self):
+        total = self.hits + self.misses
+        rate = 100 * self.hits / total if total else 0
+        return f"RPC cache: {self.hits} hits, {self.misses} misses ({rate:.1f}% hit rate), {self.size / 1e6:.1f} MB stored"
+
+    def close(self):
+        self.flush()
+        atexit.unregister(self._flush_at_exit)
+        self.conn.close()
+
+# ─── Provider ─────────────────────────────────────────────────────────────────
+
+class CachingHTTPProvider(HTTPProvider):
+    """
+    HTTPProvider that serves immutable reads from an RpcCache: eth_call and
+    eth_getCode pinned to a block, and eth_getLogs whose range ends, at least
+    `confirmations` blocks behind head; decimals() at any block; eth_chainId.
+    Everything else goes to the node untouched.
+    """
+
+    def __init__(self, endpoint_uri, cache, confirmations=DEFAULT_CONFIRMATIONS, **kwargs):
+        super().__init__(endpoint_uri, **kwargs)
+        self.cache = cache
+        self.confirmations = confirmations
+        self._final_block = None if cache.head is None else cache.head - confirmations
+        self._head_fetched = 0.0
+
+    def is_final(self, block):
+        """Whether `block` is at least `confirmations` behind head, so its results cannot be reorged away."""
+        # Only ask the node for its head when a block is not already known final,
+        # and at most once per HEAD_TTL: near head every pinned read is above the
+        # final block, and one eth_blockNumber each would double the round trips
+        if self._final_block is None or (block > self._final_block and time.monotonic() - self._head_fetched >= HEAD_TTL):
+            head = int(super().make_request("eth_blockNumber", [])["result"], 16)
+            self._head_fetched = time.monotonic()
+            # A lagging endpoint may report an older head; finality only moves up
+            if self._final_block is None or head - self.confirmations > self._final_block:
+                self._final_block = head - self.confirmations
+                self.cache.set_head(head)
+        return block <= self._final_block
+
+    def _cacheable(self, method, params):
+        if method == "eth_chainId":
+            return True
+        # Pinned reads near head are left uncached: a reorg could still change them
+        if method == "eth_getCode":
+            block = _block_number(params[1]) if len(params) > 1 else None
+            return block is not None and self.is_final(block)
+        if method == "eth_call":
+            call, block = params[0], params[1] if len(params) > 1 else "latest"
+            if _block_number(block) is not None:
+                return self.is_final(_block_number(block))
+            data = call.get("data") or call.get("input") or ""
+            if isinstance(data, (bytes, bytearray)):
+                data = "0x" + bytes(data).hex()
+            return data[:10] in IMMUTABLE_SELECTORS
+        if method == "eth_getLogs":
+            log_filter = params[0]
+            if "blockHash" in log_filter:
+                return True
+            to_block = _block_number(log_filter.get("toBlock", "latest"))
+            return to_block is not None and self.is_final(to_block)
+        return False
+
+    def make_request(self, method, params):
+        if not self._cacheable(method, params):
+            return super().make_request(method, params)
+
+        key = self.cache.key(method, params)
+        result = self.cache.get(key)
+        instrument.record_cache(method, result is not None)
+        if result is not None:
+            return {"jsonrpc": "2.0", "id": 0, "result": result}
+
+        response = super().make_request(method, params)
+        if "error" not in response and response.get("result") is not None:
+            self.cache.put(key, response["result"])
+        return response
+
+
+def report(w3):
+    """Prints the cache counters (and endpoint pool statistics, if any) of `w3`'s provider."""
+    cache = getattr(w3.provider, "cache", None)
+    if cache is not None:
+        print(cache.summary(), file=sys.stderr)
+    pool = getattr(w3.provider, "pool", None)
+    if pool is not None:
+        print(pool.summary(), file=sys.stderr)
+
+
+def close_cache(w3):
+    """Writes pending cache state and closes the cache of `w3`'s provider, if it has one."""
+    cache = getattr(w3.provider, "cache", None)
+    if cache is not None:
+        cache.close()
@@ -0,0 +1,209 @@
+import asyncio
+import json
+import sys
+import threading
+import time
+
+import aiohttp
+from web3 import HTTPProvider
+
+from utils import instrument
+from utils.rpc_cache import CachingHTTPProvider
+
+# ─── Configuration ────────────────────────────────────────────────────────────
+
+DEFAULT_CONCURRENCY = 8     # in-flight requests per endpoint
+DEFAULT_RETRIES     = 4     # extra attempts, each on the next best endpoint
+DEFAULT_BACKOFF     = 0.5   # seconds, doubled per attempt
+DEFAULT_TIMEOUT     = 60
+LATENCY_SMOOTHING   = 0.2   # weight of the newest sample in the latency EWMA
+MAX_COOLDOWN        = 60    # seconds an endpoint can be benched after failures
+
+# ─── Endpoint ─────────────────────────────────────────────────────────────────
+
+class _RetryableStatus(Exception):
+    def __init__(self, status, retry_after=None):
+        super().__init__(f"HTTP {status}")
+        self.retry_after = retry_after
+
+
+class Endpoint:
+    """One RPC URL with its concurrency limit, rate limit and health statistics."""
+
+    def __init__(self, url, max_concurrency=DEFAULT_CONCURRENCY, rate_limit=None):
+        self.url = url
+        self.max_concurrency = max_concurrency
+        self.rate_limit = rate_limit  # requests per second, None for unlimited
+        self.semaphore = None         # created inside the pool's event loop
+        self.latency = None
+        self.inflight = 0
+        self.failures = 0
+        self.cooldown_until = 0.0
+        self.next_slot = 0.0
+        self.requests = 0
+        self.errors = 0
+
+    def healthy(self, now):
+        return now >= self.cooldown_until
+
+    def score(self):
+        # Expected wait: smoothed latency times the queue we would join
+        return (self.latency or 0.1) * (self.inflight + 1) / self.max_concurrency
+
+    async def throttle(self):
+        if not self.rate_limit:
+            return
+        now = time.monotonic()
+        slot = max(now, self.next_slot)
+        self.next_slot = slot + 1 / self.rate_limit
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def record_success(self, elapsed):
+        self.requests += 1
+        self.failures = 0
+        if self.latency is None:
+            self.latency = elapsed
+        else:
+            self.latency += LATENCY_SMOOTHING * (elapsed - self.latency)
+
+    def record_failure(self, retry_after=None):
+        self.requests += 1
+        self.errors += 1
+        self.failures += 1
+        cooldown = retry_after if retry_after is not None else min(MAX_COOLDOWN, DEFAULT_BACKOFF * 2 ** self.failures)
+        self.cooldown_until = time.monotonic() + cooldown
+
+# ─── Async Pool ───────────────────────────────────────────────────────────────
+
+class AsyncRpcPool:
+    """
+    Spreads JSON-RPC requests over several endpoints. Each request goes to the
+    healthy endpoint with the lowest expected wait; transport errors, HTTP 429
+    and 5xx bench that endpoint for a while (honouring Retry-After) and the
+    request is retried on the next best one with exponential backoff.
+    JSON-RPC level errors are returned to the caller unchanged.
+    """
+
+    def __init__(self, urls, max_concurrency=DEFAULT_CONCURRENCY, rate_limit=None,
+                 max_retries=DEFAULT_RETRIES, timeout=DEFAULT_TIMEOUT):
+        if not urls:
+            raise ValueError("AsyncRpcPool needs at least one endpoint")
+        self.endpoints = [Endpoint(url, max_concurrency, rate_limit) for url in urls]
+        self.max_retries = max_retries
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self._session = None
+
+    def _session_for_loop(self):
+        if self._session is None:
+            for endpoint in self.endpoints:
+                endpoint.semaphore = asyncio.Semaphore(endpoint.max_concurrency)
+            self._session = aiohttp.ClientSession(timeout=self.timeout)
+        return self._session
+
+    def _pick(self, tried):
+        now = time.monotonic()
+        candidates = [e for e in self.endpoints if e not in tried and e.healthy(now)]
+        if not candidates:
+            # Everything is benched or already tried: take whoever recovers first
+            candidates = sorted(self.endpoints, key=lambda e: e.cooldown_until)[:1]
+        return min(candidates, key=Endpoint.score)
+
+    async def post(self, body: bytes, label="rpc", items=1):
+        """
+        POSTs an encoded JSON-RPC request (or batch) and returns the decoded JSON.
+        `label` (the method name) and `items` (requests in a batch) go to the
+        instrumentation report.
+        """
+        session = self._session_for_loop()
+        tried = set()
+        last_error = None
+
+        for attempt in range(self.max_retries + 1):
+            endpoint = self._pick(tried)
+            tried.add(endpoint)
+            if len(tried) == len(self.endpoints):
+                tried.clear()
+
+            async with endpoint.semaphore:
+                await endpoint.throttle()
+                endpoint.inflight += 1
+                start = time.monotonic()
+                try:
+                    async with session.post(endpoint.url, data=body, headers={"Content-Type": "application/json"}) as resp:
+                        if resp.status == 429 or resp.status >= 500:
+                            retry_after = resp.headers.get("Retry-After")
+                            raise _RetryableStatus(resp.status, float(retry_after) if retry_after and retry_after.isdigit() else None)
+                        resp.raise_for_status()
+                        raw = await resp.read()
+                        result = json.loads(raw)
+                except (aiohttp.ClientError, asyncio.TimeoutError, _RetryableStatus) as e:
+                    endpoint.record_failure(getattr(e, "retry_after", None))
+                    last_error = e
+                    print(f"RPC {endpoint.url} failed ({e!r}); attempt {attempt + 1}/{self.max_retries + 1}", file=sys.stderr)
+                    await asyncio.sleep(DEFAULT_BACKOFF * 2 ** attempt)
+                    continue
+                finally:
+                    endpoint.inflight -= 1
+
+            elapsed = time.monotonic() - start
+            endpoint.record_success(elapsed)
+            instrument.record_rpc(label, elapsed, bytes_out=len(body), bytes_in=len(raw), retries=attempt, items=items)
+            return result
+
+        instrument.record_rpc(label, 0.0, bytes_out=len(body), retries=self.max_retries, error=True, items=items)
+        raise RuntimeError(f"All RPC attempts failed: {last_error!r}")
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def summary(self):
+        lines = []
+        for e in self.endpoints:
+            latency = f"{e.latency * 1000:.0f} ms" if e.latency is not None else "n/a"
+            lines.append(f"  {e.url}: {e.requests} requests, {e.errors} errors, latency {latency}")
+        return "RPC endpoints:\n" + "\n".join(lines)
+
+# ─── Sync Web3 Provider ───────────────────────────────────────────────────────
+
+class PooledHTTPProvider(HTTPProvider):
+    """
+    Synchronous Web3 provider backed by an AsyncRpcPool running on its own
+    event loop thread. Any number of threads can issue requests at once; they
+    are multiplexed over every endpoint in `urls`.
+    """
+
+    def __init__(self, endpoint_uri=None, urls=(), max_concurrency=DEFAULT_CONCURRENCY,
+                 rate_limit=None, **kwargs):
+        urls = list(urls) or [endpoint_uri]
+        super().__init__(urls[0], **kwargs)
+        self.pool = AsyncRpcPool(urls, max_concurrency=max_concurrency, rate_limit=rate_limit)
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, name="rpc-pool", daemon=True).start()
+
+    @property
+    def max_inflight(self):
+        return sum(e.max_concurrency for e in self.pool.endpoints)
+
+    def _run(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def post_json(self, body: bytes, label="batch", items=1):
+        """Sends an already encoded request or batch through the pool."""
+        return self._run(self.pool.post(body, label, items))
+
+    def make_request(self, method, params):
+        return self.post_json(self.encode_rpc_request(method, params), label=method)
+
+    def close(self):
+        self._run(self.pool.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+
+class CachingPooledProvider(CachingHTTPProvider, PooledHTTPProvider):
+    """PooledHTTPProvider with the on-disk response cache in front of it."""
+
+    def __init__(self, urls, cache, **kwargs):
+        super().__init__(urls[0], cache, urls=urls, **kwargs)
@@ -0,0 +1,53 @@
+from decimal import Decimal
+
+from utils.snapshot_entries import EXACT_CONTEXT, RUN_SIZE, address_hex, detect_source, grouped, read_entries, sorted_entries
+
+# ─── Diff ─────────────────────────────────────────────────────────────────────
+
+_END = object()
+
+
+def diff_accounts(old, new):
+    """
+    Sorted-merge join of two address-ordered (address, fields) streams.
+    Yields one record per account that was added, removed or changed, with
+    the before / after / delta of every field that differs.
+    """
+    old, new = iter(old), iter(new)
+    a, b = next(old, _END), next(new, _END)
+
+    while a is not _END or b is not _END:
+        if b is _END or (a is not _END and a[0] < b[0]):
+            address, before, after = a[0], a[1], {}
+            a = next(old, _END)
+        elif a is _END or b[0] < a[0]:
+            address, before, after = b[0], {}, b[1]
+            b = next(new, _END)
+        else:
+            address, before, after = a[0], a[1], b[1]
+            a, b = next(old, _END), next(new, _END)
+
+        changes = {}
+        for field in sorted(before.keys() | after.keys()):
+            x, y = before.get(field, Decimal(0)), after.get(field, Decimal(0))
+            if x != y:
+                changes[field] = {"before": f"{x:f}", "after": f"{y:f}", "delta": f"{EXACT_CONTEXT.subtract(y, x):f}"}
+        if not changes:
+            continue
+
+        status = "added" if not before else "removed" if not after else "changed"
+        yield {"address": address_hex(address), "status": status, "fields": changes}
+
+
+def diff_snapshots(old_path, new_path, source=None, run_size=RUN_SIZE):
+    """Diff records between two snapshot files of the same source, in address order."""
+    old_source = source or detect_source(old_path)
+    new_source = source or detect_source(new_path)
+    if old_source is None or new_source is None:
+        raise ValueError("trove_snapshot files hold troves and usdm balances; pass the source explicitly")
+    if old_source != new_source:
+        raise ValueError(f"cannot diff a {old_source} snapshot against a {new_source} snapshot")
+
+    old = grouped(sorted_entries(read_entries(old_path, old_source), run_size))
+    new = grouped(sorted_entries(read_entries(new_path, new_source), run_size))
+    return diff_accounts(old, new)
@@ -0,0 +1,172 @@
+import heapq
+import itertools
+import json
+import os
+import re
+import struct
+import tempfile
+from decimal import Context, Decimal
+
+# ─── Configuration ────────────────────────────────────────────────────────────
+
+RUN_SIZE = 200000  # (address, field, value) entries sorted in memory before spilling a run
+
+# The default context keeps 28 digits, fewer than an 18-decimal amount above
+# 1e10 tokens has; amounts are scaled and summed in this one so none is rounded
+EXACT_CONTEXT = Context(prec=100)
+
+SOURCES = ("troves", "usdm", "lending", "lp")
+
+# File name patterns of every snapshot output, legacy JSON and streamed rows
+FILE_PATTERNS = [
+    (re.compile(r"^trove_snapshot_block_\d+\.json$"), None),  # holds troves and usdm
+    (re.compile(r"^troves_block_\d+\.ndjson$"), "troves"),
+    (re.compile(r"^usdm_holders_block_\d+\.ndjson$"), "usdm"),
+    (re.compile(r"^lending_depositor_balances_block_\d+\.json$"), "lending"),
+    (re.compile(r"^lending_balances_block_\d+\.ndjson$"), "lending"),
+    (re.compile(r"^lp_balances_\w+_block_\d+\.(json|ndjson)$"), "lp"),
+]
+
+# ─── Readers ──────────────────────────────────────────────────────────────────
+#
+# Every reader yields (address, field, Decimal amount in token units), whatever
+# casing, nesting or number encoding the file uses. Addresses are normalized
+# once, to their 20 raw bytes, which sort exactly like lowercase hex.
+
+def detect_source(path):
+    """
+    Source type of a snapshot file from its name: None for a file that holds
+    several (trove_snapshot_block_*), ValueError for a name it does not know.
+    """
+    name = os.path.basename(path)
+    for pattern, source in FILE_PATTERNS:
+        if pattern.match(name):
+            return source
+    raise ValueError(f"cannot tell the snapshot source of {name}; pass it explicitly")
+
+
+def address_key(address):
+    return bytes.fromhex(address[2:])
+
+
+def address_hex(key):
+    return "0x" + key.hex()
+
+
+def _scaled(raw, decimals):
+    return Decimal(int(raw)).scaleb(-int(decimals), EXACT_CONTEXT)
+
+
+def _ndjson_rows(path):
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _read_ndjson(path, source):
+    for row in _ndjson_rows(path):
+        if source == "troves":
+            owner = address_key(row["owner"])
+            yield owner, "debt", _scaled(row["debt_raw"], row["decimals"])
+            yield owner, "collateral", _scaled(row["collateral_raw"], row["decimals"])
+        elif source == "usdm":
+            yield address_key(row["holder"]), "balance", _scaled(row["raw"], row["decimals"])
+        elif source == "lending":
+            yield address_key(row["account"]), f"{row['kind']}:{row['reserve']}", _scaled(row["raw"], row["decimals"])
+        else:
+            yield address_key(row["owner"]), "balance", _scaled(row["raw"], row["decimals"])
+
+
+def _read_json(path, source):
+    # The legacy layouts are single JSON documents, so they are loaded whole
+    with open(path) as f:
+        data = json.load(f)
+
+    if source == "troves":
+        for trove in data["troves"]:
+            owner = address_key(trove["owner"])
+            yield owner, "debt", Decimal(trove["debt_usdm"])
+            yield owner, "collateral", Decimal(trove["collateral_tara"])
+    elif source == "usdm":
+        for holder, balance in data["token_balances"].items():
+            yield address_key(holder), "balance", Decimal(balance)
+    elif source == "lending":
+        # Values are floats here; str() keeps their shortest round-trip form
+        for account, entry in data["accounts"].items():
+            key = address_key(account)
+            for symbol, amount in entry.get("deposits", {}).items():
+                yield key, f"deposit:{symbol}", Decimal(str(amount))
+            for symbol, debt in entry.get("debt", {}).items():
+                for kind, amount in debt.items():
+                    yield key, f"{kind}:{symbol}", Decimal(str(amount))
+    else:
+        for owner, balance in data.items():
+            yield address_key(owner), "balance", Decimal(balance)
+
+
+def read_entries(path, source):
+    if path.endswith(".ndjson"):
+        return _read_ndjson(path, source)
+    return _read_json(path, source)
+
+# ─── External Sort ────────────────────────────────────────────────────────────
+
+# Spilled entries are binary records: the 20 address bytes, then the field and
+# the value's decimal text, each prefixed by its length
+_RECORD_HEAD = struct.Struct(">20sBH")
+
+
+def _spill(run, directory):
+    run.sort()
+    f = tempfile.TemporaryFile("w+b", dir=directory)
+    for address, field, value in run:
+        field, value = field.encode(), f"{value:f}".encode()
+        f.write(_RECORD_HEAD.pack(address, len(field), len(value)) + field + value)
+    f.seek(0)
+    return f
+
+
+def _read_run(f):
+    while True:
+        head = f.read(_RECORD_HEAD.size)
+        if not head:
+            return
+        address, field_length, value_length = _RECORD_HEAD.unpack(head)
+        field = f.read(field_length).decode()
+        yield address, field, Decimal(f.read(value_length).decode())
+
+
+def sorted_entries(entries, run_size=RUN_SIZE, directory=None):
+    """
+    Yields `entries` sorted by (address, field) while holding at most
+    `run_size` of them in memory: full runs are sorted and spilled to
+    temporary files, then merged back with a k-way heap merge.
+    """
+    runs = []
+    run = []
+    try:
+        for entry in entries:
+            run.append(entry)
+            if len(run) >= run_size:
+                runs.append(_spill(run, directory))
+                run = []
+        if not runs:
+            run.sort()
+            yield from run
+            return
+        if run:
+            runs.append(_spill(run, directory))
+        yield from heapq.merge(*(_read_run(f) for f in runs))
+    finally:
+        for f in runs:
+            f.close()
+
+
+def grouped(entries):
+    """Folds sorted (address, field, value) entries into (address, {field: total})."""
+    for address, group in itertools.groupby(entries, key=lambda entry: entry[0]):
+        fields = {}
+        for _, field, value in group:
+            fields[field] = EXACT_CONTEXT.add(fields.get(field, 0), value)
+        yield address, {field: value for field, value in fields.items() if value != 0}
@@ -0,0 +1,159 @@
+import json
+import os
+
+# ─── Configuration ────────────────────────────────────────────────────────────
+
+# "json" is the legacy nested layout each script builds itself; the others are
+# streamed row by row by SnapshotWriter
+FORMATS = ("json", "ndjson", "arrow", "parquet")
+DEFAULT_FORMATS = ("json", "ndjson")
+
+BATCH_ROWS = 10000  # rows buffered per Arrow record batch / Parquet row group
+
+EXTENSIONS = {"ndjson": ".ndjson", "arrow": ".arrow", "parquet": ".parquet"}
+
+# Column kinds. uint256 values are written as exact decimal strings: JSON
+# readers commonly parse numbers as doubles and Arrow has no 256-bit integer.
+KINDS = ("address", "uint256", "int", "str")
+
+# ─── Helpers ──────────────────────────────────────────────────────────────────
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as e:
+        raise RuntimeError("Arrow and Parquet output need pyarrow (pip install pyarrow)") from e
+    return pyarrow
+
+
+def check_formats(formats):
+    unknown = [fmt for fmt in formats if fmt not in FORMATS]
+    if unknown:
+        raise ValueError(f"unknown output format(s) {unknown}, expected any of {FORMATS}")
+    return formats
+
+# ─── Writer ───────────────────────────────────────────────────────────────────
+
+class SnapshotWriter:
+    """
+    Streams snapshot rows to `base_path` + .ndjson / .arrow / .parquet as they
+    are produced, so memory stays flat however many rows there are.
+
+    `columns` is a list of (name, kind) and every row a tuple in that order.
+    Raw token amounts go in uint256 columns next to a decimals column, so no
+    precision is lost and readers scale them themselves. Files are written
+    under a temporary name and only moved into place by close(), so a failed
+    run never leaves a truncated snapshot behind.
+    """
+
+    def __init__(self, base_path, columns, formats=DEFAULT_FORMATS, metadata=None, batch_rows=BATCH_ROWS):
+        for name, kind in columns:
+            if kind not in KINDS:
+                raise ValueError(f"column {name!r} has unknown kind {kind!r}")
+        check_formats(formats)
+
+        directory = os.path.dirname(base_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.names = [name for name, _ in columns]
+        self.uint_columns = [i for i, (_, kind) in enumerate(columns) if kind == "uint256"]
+        self.batch_rows = batch_rows
+        self.rows = 0
+        self.paths = []
+        self._tmp_paths = []
+
+        self._ndjson = None
+        self._arrow = None
+        self._parquet = None
+        self._buffer = []
+
+        if "ndjson" in formats:
+            self._ndjson = open(self._claim(base_path, "ndjson"), "w")
+
+        if "arrow" in formats or "parquet" in formats:
+            pa = _pyarrow()
+            types = {"address": pa.string(), "uint256": pa.string(), "int": pa.int64(), "str": pa.string()}
+            self._schema = pa.schema(
+                [(name, types[kind]) for name, kind in columns],
+                metadata={key: str(value) for key, value in (metadata or {}).items()},
+            )
+            if "arrow" in formats:
+                self._arrow = pa.ipc.new_stream(self._claim(base_path, "arrow"), self._schema)
+            if "parquet" in formats:
+                self._parquet = pa.parquet.ParquetWriter(self._claim(base_path, "parquet"), self._schema)
+
+    def _claim(self, base_path, fmt):
+        path = base_path + EXTENSIONS[fmt]
+        self.paths.append(path)
+        self._tmp_paths.append(path + ".tmp")
+        return path + ".tmp"
+
+    # ── Writing ──
+
+    def write(self, row):
+        row = list(row)
+        for i in self.uint_columns:
+            row[i] = str(row[i])
+        self.rows += 1
+
+        if self._ndjson is not None:
+            self._ndjson.write(json.dumps(dict(zip(self.names, row)), separators=(",", ":")))
+            self._ndjson.write("\n")
+
+        if self._arrow is not None or self._parquet is not None:
+            self._buffer.append(row)
+            if len(self._buffer) >= self.batch_rows:
+                self._flush()
+
+    def write_many(self, rows):
+        for row in rows:
+            self.write(row)
+
+    def _flush(self):
+        if not self._buffer:
+            return
+        pa = _pyarrow()
+        columns = list(zip(*self._buffer))
+        batch = pa.record_batch(
+            [pa.array(column, type=field.type) for column, field in zip(columns, self._schema)],
+            schema=self._schema,
+        )
+        if self._arrow is not None:
+            self._arrow.write_batch(batch)
+        if self._parquet is not None:
+            self._parquet.write_table(pa.Table.from_batches([batch]))
+        self._buffer = []
+
+    # ── Finishing ──
+
+    def _close_files(self):
+        if self._ndjson is not None:
+            self._ndjson.close()
+        if self._arrow is not None:
+            self._arrow.close()
+        if self._parquet is not None:
+            self._parquet.close()
+
+    def close(self):
+        self._flush()
+        self._close_files()
+        for tmp, path in zip(self._tmp_paths, self.paths):
+            os.replace(tmp, path)
+
+    def abort(self):
+        self._close_files()
+        for tmp in self._tmp_paths:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
@@ -0,0 +1,474 @@
+import bisect
+import hashlib
+import re
+
+from web3 import Web3
+
+from utils.multicall import MULTICALL3_ADDRESS
+
+# ─── Configuration ────────────────────────────────────────────────────────────
+
+CHAIN_ID       = 841      # Taraxa mainnet
+BLOCK_SPAN     = 200000   # blocks between the first synthetic event and head
+MAX_LOG_RESULT = 10000    # eth_getLogs answers above this fail like a real node
+GENESIS_TIME   = 1700000000
+BLOCK_TIME     = 4        # seconds between synthetic blocks
+
+RESERVES = [("USDT", 6), ("wstTARA", 18), ("USDM", 18)]
+
+# ─── ABI Words ────────────────────────────────────────────────────────────────
+
+def _selector(signature):
+    return Web3.keccak(text=signature)[:4].hex().removeprefix("0x")
+
+
+def _topic(signature):
+    return "0x" + Web3.keccak(text=signature).hex().removeprefix("0x")
+
+
+def _word(value):
+    return value.to_bytes(32, "big")
+
+
+def _address_word(address):
+    return bytes(12) + bytes.fromhex(address[2:])
+
+
+def _dynamic_bytes(data):
+    padded = data + bytes(-len(data) % 32)
+    return _word(len(data)) + padded
+
+
+def _encode_array(elements):
+    """ABI encoding of a dynamic array whose elements are themselves dynamic."""
+    head, tail = b"", b""
+    offset = 32 * len(elements)
+    for element in elements:
+        head += _word(offset + len(tail))
+        tail += element
+    return _word(len(elements)) + head + tail
+
+
+def synthetic_address(*parts):
+    """Deterministic lowercase hex address derived from `parts`."""
+    digest = hashlib.sha256("/".join(str(p) for p in parts).encode()).digest()
+    return "0x" + digest[:20].hex()
+
+
+def _synthetic_amount(*parts, scale=10**24):
+    return int.from_bytes(hashlib.sha256("/".join(str(p) for p in parts).encode()).digest()[:16], "big") % scale
+
+# ─── Synthetic Chain ──────────────────────────────────────────────────────────
+
+class SyntheticChain:
+    """
+    Deterministic stand-in for the contracts and subgraph every snapshot source
+    reads, with `holders` accounts per source: troves in the TroveManager, USDM
+    holders (one mint Transfer each), lending depositors (one Deposit each, with
+    balances on every reserve's aToken) and LP positions in each pool, served
+    both by the subgraph and by a NonfungiblePositionManager at
+    `position_manager`.
+
+    Answers eth_chainId, eth_blockNumber, eth_getBlockByNumber (headers only),
+    eth_getCode, eth_call (including Multicall3 aggregate3) and eth_getLogs (by
+    range or by block hash) like a node would, and the subgraph `pool` query
+    and `positions` query with keyset pagination. The chain can also grow and
+    reorg while it is being served: see mine(), mint_usdm() and reorg().
+    Addresses are taken from the scripts' own configuration so they run
+    unmodified against it.
+    """
+
+    def __init__(self, holders, addresses, start_block, span=BLOCK_SPAN):
+        self.holders = holders
+        self.start_block = start_block
+        self.head = start_block + span
+
+        self.trove_manager = addresses["trove_manager"].lower()
+        self.usdm = addresses["usdm"].lower()
+        self.address_provider = addresses["address_provider"].lower()
+        self.data_provider = addresses["data_provider"].lower()
+        self.pools = [pool.lower() for pool in addresses["pools"]]
+        self.pool_tokens = [token.lower() for token in addresses["pool_tokens"]]
+        self.multicall = MULTICALL3_ADDRESS.lower()
+        self.lending_pool = synthetic_address("lending-pool")
+        self.position_manager = synthetic_address("position-manager")
+
+        self.accounts = [synthetic_address("account", i) for i in range(holders)]
+        self.index_of = {account: i for i, account in enumerate(self.accounts)}
+        self._event_blocks = [start_block + 1 + i * span // max(holders, 1) for i in range(holders)]
+
+        self.reserves = {}   # underlying -> (symbol, decimals, aToken, stable, variable)
+        self.decimals = {self.usdm: 18, **{token: 18 for token in self.pool_tokens}}
+        self.reserve_tokens = {}  # debt/aToken -> (symbol, kind)
+        for symbol, decimals in RESERVES:
+            underlying = synthetic_address("reserve", symbol)
+            tokens = [synthetic_address(kind, symbol) for kind in ("a", "stable", "variable")]
+            self.reserves[underlying] = (symbol, decimals, *tokens)
+            for kind, token in zip(("a", "stable", "variable"), tokens):
+                self.decimals[token] = decimals
+                self.reserve_tokens[token] = (symbol, kind)
+
+        self.code = {
+            self.trove_manager, self.usdm, self.address_provider, self.data_provider,
+            self.multicall, self.lending_pool, self.position_manager, *self.decimals, *self.pools,
+        }
+        self.logs = self._build_logs()
+        self.log_blocks = {address: [log["blockNumber"] for log in logs] for address, logs in self.logs.items()}
+        self._position_pages = {}
+        self._usdm_changes = {}   # account -> [(block, balance)] set by mint_usdm()
+        self._forks = []          # (fork point, fork id) of every reorg, oldest first
+        self._forked_hashes = {}  # hash -> number of the replacement blocks
+        self.calls = {
+            _selector("aggregate3((address,bool,bytes)[])"): self._aggregate3,
+            _selector("decimals()"): self._decimals,
+            _selector("balanceOf(address)"): self._balance_of,
+            _selector("totalSupply()"): self._total_supply,
+            _selector("getTroveOwnersCount()"): self._trove_count,
+            _selector("getTroveFromTroveOwnersArray(uint256)"): self._trove_owner,
+            _selector("Troves(address)"): self._trove,
+            _selector("getLendingPool()"): self._lending_pool,
+            _selector("getAllReservesTokens()"): self._all_reserves,
+            _selector("getReserveTokensAddresses(address)"): self._reserve_tokens,
+            _selector("tokenByIndex(uint256)"): self._token_by_index,
+            _selector("positions(uint256)"): self._position,
+            _selector("ownerOf(uint256)"): self._owner_of,
+            _selector("slot0()"): self._slot0,
+            _selector("token0()"): self._token0,
+            _selector("token1()"): self._token1,
+            _selector("fee()"): self._fee,
+        }
+
+    # ── State ──
+
+    def _build_logs(self):
+        transfer = _topic("Transfer(address,address,uint256)")
+        deposit = _topic("Deposit(address,address,address,uint256,uint16)")
+        zero = "0x" + "00" * 32
+        logs = {self.usdm: [], self.lending_pool: []}
+        underlying = next(iter(self.reserves))
+        for i, (account, block) in enumerate(zip(self.accounts, self._event_blocks)):
+            topic_account = "0x" + _address_word(account).hex()
+            logs[self.usdm].append({
+                "address": self.usdm, "blockNumber": block, "logIndex": 0,
+                "topics": [transfer, zero, topic_account],
+                "data": "0x" + _word(self.usdm_balance(account)).hex(),
+            })
+            logs[self.lending_pool].append({
+                "address": self.lending_pool, "blockNumber": block, "logIndex": 1,
+                "topics": [deposit, "0x" + _address_word(underlying).hex(), topic_account, zero],
+                "data": "0x" + (_address_word(account) + _word(1)).hex(),
+            })
+        return logs
+
+    def usdm_balance(self, account):
+        return _synthetic_amount("usdm", account)
+
+    def _usdm_balance_at(self, account, block):
+        changes = self._usdm_changes.get(account)
+        if changes:
+            i = bisect.bisect_right([changed for changed, _ in changes], block)
+            if i:
+                return changes[i - 1][1]
+        return self.usdm_balance(account) if self.active(account, block) else 0
+
+    def active(self, account, block):
+        i = self.index_of.get(account)
+        return i is not None and self._event_blocks[i] <= block
+
+    # ── eth_call handlers: (to, args, block) -> return data ──
+
+    def _decimals(self, to, args, block):
+        return _word(self.decimals[to])
+
+    def _balance_of(self, to, args, block):
+        account = "0x" + args[12:32].hex()
+        if to == self.usdm:
+            return _word(self._usdm_balance_at(account, block))
+        if not self.active(account, block):
+            return _word(0)
+        symbol, kind = self.reserve_tokens[to]
+        if kind == "stable" or (kind == "variable" and self.index_of[account] % 3):
+            return _word(0)
+        return _word(_synthetic_amount(kind, symbol, account, scale=10 ** (self.decimals[to] + 6)))
+
+    def _active_count(self, block):
+        # Accounts become active in event-block order, so the ones active at
+        # `block` are a prefix of them
+        return bisect.bisect_right(self._event_blocks, block)
+
+    def _total_supply(self, to, args, block):
+        if to == self.position_manager:
+            return _word(self._active_count(block) * len(self.pools))
+        active = self.accounts[:self._active_count(block)]
+        return _word(sum(int.from_bytes(self._balance_of(to, _address_word(account), block), "big") for account in active))
+
+    def _trove_count(self, to, args, block):
+        return _word(self.holders)
+
+    def _trove_owner(self, to, args, block):
+        return _address_word(self.accounts[int.from_bytes(args[:32], "big")])
+
+    def _trove(self, to, args, block):
+        account = "0x" + args[12:32].hex()
+        debt = _synthetic_amount("debt", account)
+        collateral = _synthetic_amount("collateral", account) * 10
+        return _word(debt) + _word(collateral) + _word(collateral) + _word(1) + _word(self.index_of[account])
+
+    def _lending_pool(self, to, args, block):
+        return _address_word(self.lending_pool)
+
+    def _all_reserves(self, to, args, block):
+        tuples = [
+            _word(64) + _address_word(underlying) + _dynamic_bytes(symbol.encode())
+            for underlying, (symbol, *_rest) in self.reserves.items()
+        ]
+        return _word(32) + _encode_array(tuples)
+
+    def _reserve_tokens(self, to, args, block):
+        _symbol, _decimals, a_token, stable, variable = self.reserves["0x" + args[12:32].hex()]
+        return _address_word(a_token) + _address_word(stable) + _address_word(variable)
+
+    # Position NFTs: token id pool_index * holders + i + 1 is account i's
+    # position in that pool, as in the subgraph
+
+    def _pool_fee(self, pool_index):
+        return 500 * (pool_index + 1)  # distinct per pool, as the manager keys pools by (token0, token1, fee)
+
+    def _token_by_index(self, to, args, block):
+        active = self._active_count(block)
+        index = int.from_bytes(args[:32], "big")
+        if index >= active * len(self.pools):
+            raise ValueError("execution reverted: global index out of bounds")
+        return _word(index // active * self.holders + index % active + 1)
+
+    def _nft(self, args, block):
+        token_id = int.from_bytes(args[:32], "big") - 1
+        pool_index, i = divmod(token_id, self.holders)
+        if token_id < 0 or pool_index >= len(self.pools) or self._event_blocks[i] > block:
+            raise ValueError("execution reverted: invalid token ID")
+        return pool_index, i
+
+    def _position(self, to, args, block):
+        pool_index, i = self._nft(args, block)
+        token0, token1 = sorted(self.pool_tokens)
+        width = 60 * (1 + i % 50)
+        return (
+            _word(0) + _word(0) + _address_word(token0) + _address_word(token1) + _word(self._pool_fee(pool_index))
+            + _word(-width % 2 ** 256) + _word(width) + _word(_synthetic_amount("liquidity", pool_index, i))
+            + _word(0) * 4
+        )
+
+    def _owner_of(self, to, args, block):
+        _pool_index, i = self._nft(args, block)
+        return _address_word(self.accounts[i])
+
+    def _slot0(self, to, args, block):
+        pool = self._pool()
+        return _word(int(pool["sqrtPrice"])) + _word(int(pool["tick"]) % 2 ** 256) + _word(0) * 4 + _word(1)
+
+    def _token0(self, to, args, block):
+        return _address_word(sorted(self.pool_tokens)[0])
+
+    def _token1(self, to, args, block):
+        return _address_word(sorted(self.pool_tokens)[1])
+
+    def _fee(self, to, args, block):
+        return _word(self._pool_fee(self.pools.index(to)))
+
+    def _aggregate3(self, to, args, block):
+        # args: offset to (address target, bool allowFailure, bytes callData)[]
+        base = int.from_bytes(args[:32], "big")
+        count = int.from_bytes(args[base:base + 32], "big")
+        items = base + 32
+        results = []
+        for i in range(count):
+            start = items + int.from_bytes(args[items + 32 * i:items + 32 * i + 32], "big")
+            target = "0x" + args[start + 12:start + 32].hex()
+            data_at = start + int.from_bytes(args[start + 64:start + 96], "big")
+            length = int.from_bytes(args[data_at:data_at + 32], "big")
+            returned = self.call(target, args[data_at + 32:data_at + 32 + length], block)
+            results.append(_word(1) + _word(64) + _dynamic_bytes(returned))
+        return _word(32) + _encode_array(results)
+
+    def call(self, to, data, block):
+        handler = self.calls.get(data[:4].hex())
+        if handler is None:
+            raise ValueError(f"execution reverted: unknown selector 0x{data[:4].hex()} on {to}")
+        return handler(to, data[4:], block)
+
+    # ── Live chain ──
+    #
+    # Grows the chain past its initial head and reorgs it, so head-following
+    # code can be exercised offline (see `bench.py reorg`).
+
+    def mine(self, count=1):
+        """Appends `count` empty blocks."""
+        self.head += count
+
+    def mint_usdm(self, account, amount):
+        """Mints `amount` USDM to `account` in a new block; returns the block."""
+        block = self.head + 1
+        balance = self._usdm_balance_at(account, self.head) + amount
+        self._usdm_changes.setdefault(account, []).append((block, balance))
+        self.logs[self.usdm].append({
+            "address": self.usdm, "blockNumber": block, "logIndex": 0,
+            "topics": [_topic("Transfer(address,address,uint256)"), "0x" + "00" * 32,
+                       "0x" + _address_word(account).hex()],
+            "data": "0x" + _word(amount).hex(),
+        })
+        self.log_blocks[self.usdm].append(block)
+        self.head = block
+        return block
+
+    def reorg(self, depth):
+        """
+        Drops the last `depth` blocks with their logs and state changes. The
+        blocks mined after it reuse their numbers under new hashes, as the
+        replacement branch of a reorg.
+        """
+        fork_point = self.head - depth
+        for address, logs in self.logs.items():
+            kept = bisect.bisect_right(self.log_blocks[address], fork_point)
+            del logs[kept:]
+            del self.log_blocks[address][kept:]
+        for changes in self._usdm_changes.values():
+            changes[:] = [(block, balance) for block, balance in changes if block <= fork_point]
+        self._forks.append((fork_point, len(self._forks) + 1))
+        self.head = fork_point
+
+    def block_hash(self, number):
+        for fork_point, fork in reversed(self._forks):
+            if number > fork_point:
+                block_hash = hashlib.sha256(f"{number}/{fork}".encode()).digest()
+                self._forked_hashes[block_hash] = number
+                return block_hash
+        return _word(number)
+
+    def _block_by_hash(self, block_hash):
+        block_hash = bytes.fromhex(block_hash[2:])
+        number = self._forked_hashes.get(block_hash, int.from_bytes(block_hash, "big"))
+        if number > self.head or self.block_hash(number) != block_hash:
+            raise ValueError(f"unknown block 0x{block_hash.hex()}")
+        return number
+
+    # ── JSON-RPC ──
+
+    def _block(self, tag):
+        if tag in (None, "latest", "safe", "finalized", "pending"):
+            return self.head
+        if tag == "earliest":
+            return 0
+        return int(tag, 16) if isinstance(tag, str) else int(tag)
+
+    def _get_logs(self, log_filter):
+        if "blockHash" in log_filter:
+            from_block = to_block = self._block_by_hash(log_filter["blockHash"])
+        else:
+            from_block = self._block(log_filter.get("fromBlock", "latest"))
+            to_block = self._block(log_filter.get("toBlock", "latest"))
+        addresses = log_filter.get("address") or list(self.logs)
+        if isinstance(addresses, str):
+            addresses = [addresses]
+        topics = log_filter.get("topics") or []
+        topic0 = topics[0] if topics else None
+        if isinstance(topic0, str):
+            topic0 = [topic0]
+
+        found = []
+        for address in addresses:
+            logs = self.logs.get(address.lower(), [])
+            blocks = self.log_blocks.get(address.lower(), [])
+            for log in logs[bisect.bisect_left(blocks, from_block):bisect.bisect_right(blocks, to_block)]:
+                if topic0 is None or log["topics"][0] in topic0:
+                    found.append(log)
+        if len(found) > MAX_LOG_RESULT:
+            raise ValueError(f"query returned more than {MAX_LOG_RESULT} results")
+        return [
+            dict(log, blockNumber=hex(log["blockNumber"]), logIndex=hex(log["logIndex"]),
+                 blockHash="0x" + self.block_hash(log["blockNumber"]).hex(), transactionHash="0x" + "00" * 32,
+                 transactionIndex="0x0", removed=False)
+            for log in sorted(found, key=lambda log: (log["blockNumber"], log["logIndex"]))
+        ]
+
+    def _header(self, number):
+        if number > self.head:
+            return None
+        return {
+            "number": hex(number),
+            "hash": "0x" + self.block_hash(number).hex(),
+            "parentHash": "0x" + self.block_hash(max(number - 1, 0)).hex(),
+            "timestamp": hex(GENESIS_TIME + number * BLOCK_TIME),
+            "transactions": [],
+        }
+
+    def rpc(self, request):
+        method, params = request["method"], request.get("params", [])
+        try:
+            if method == "eth_chainId":
+                result = hex(CHAIN_ID)
+            elif method == "eth_blockNumber":
+                result = hex(self.head)
+            elif method == "eth_getCode":
+                result = "0x6080" if params[0].lower() in self.code else "0x"
+            elif method == "eth_call":
+                call = params[0]
+                data = bytes.fromhex((call.get("data") or call.get("input") or "0x")[2:])
+                block = self._block(params[1] if len(params) > 1 else "latest")
+                result = "0x" + self.call(call["to"].lower(), data, block).hex()
+            elif method == "eth_getLogs":
+                result = self._get_logs(params[0])
+            elif method == "eth_getBlockByNumber":
+                result = self._header(self._block(params[0]))
+            else:
+                return {"jsonrpc": "2.0", "id": request.get("id"),
+                        "error": {"code": -32601, "message": f"method {method} not supported"}}
+        except (ValueError, KeyError, IndexError) as e:
+            return {"jsonrpc": "2.0", "id": request.get("id"), "error": {"code": -32000, "message": str(e)}}
+        return {"jsonrpc": "2.0", "id": request.get("id"), "result": result}
+
+    # ── Subgraph ──
+
+    def _positions(self, pool_index, block):
+        """Every position of one pool at `block`, ordered by id as the subgraph orders IDs."""
+        key = (pool_index, block)
+        if key not in self._position_pages:
+            self._position_pages[key] = self._build_positions(pool_index, block)
+        return self._position_pages[key]
+
+    def _pool(self):
+        token0, token1 = sorted(self.pool_tokens)
+        return {
+            "tick": "0",
+            "sqrtPrice": str(2 ** 96),
+            "token0": {"id": token0, "decimals": "18"},
+            "token1": {"id": token1, "decimals": "18"},
+        }
+
+    def _build_positions(self, pool_index, block):
+        positions = []
+        for i, (account, event_block) in enumerate(zip(self.accounts, self._event_blocks)):
+            if event_block > block:
+                continue
+            width = 60 * (1 + i % 50)
+            positions.append({
+                "id": str(pool_index * self.holders + i + 1),
+                "owner": {"id": account},
+                "liquidity": str(_synthetic_amount("liquidity", pool_index, i)),
+                "tickLower": {"tickIdx": str(-width)},
+                "tickUpper": {"tickIdx": str(width)},
+            })
+        positions.sort(key=lambda position: position["id"])
+        return positions, [position["id"] for position in positions]
+
+    def graphql(self, request):
+        variables = request.get("variables") or {}
+        pool = (variables.get("pool") or "").lower()
+        if re.search(r"\bpool\s*\(", request["query"]):
+            return 200, {"data": {"pool": self._pool() if pool in self.pools else None}}
+        if pool not in self.pools:
+            return 200, {"data": {"positions": []}}
+        first = int(re.search(r"first:\s*(\d+)", request["query"]).group(1))
+        last_id = variables.get("lastId", "")
+        positions, ids = self._positions(self.pools.index(pool), variables.get("block", self.head))
+        start = bisect.bisect_right(ids, last_id)
+        return 200, {"data": {"positions": positions[start:start + first]}}
@@ -0,0 +1,217 @@
+import os
+import sqlite3
+import sys
+from collections import defaultdict
+
+from web3 import Web3
+
+from utils.addresses import ZERO_ADDRESS, address_bytes, raw_bytes, to_hex
+from utils.logscan import LogScanner, DEFAULT_WINDOW, DEFAULT_WORKERS
+
+# ─── Configuration ────────────────────────────────────────────────────────────
+
+CHECKPOINT_INTERVAL = 100000  # blocks between full balance checkpoints
+
+TRANSFER_TOPIC = Web3.to_hex(Web3.keccak(text="Transfer(address,address,uint256)"))
+
+# uint256 values do not fit SQLite's 64-bit INTEGER, so they are stored as text
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS transfers (
+    block     INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    sender    TEXT    NOT NULL,
+    recipient TEXT    NOT NULL,
+    value     TEXT    NOT NULL,
+    PRIMARY KEY (block, log_index)
+);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    block   INTEGER NOT NULL,
+    address TEXT    NOT NULL,
+    balance TEXT    NOT NULL,
+    PRIMARY KEY (block, address)
+);
+CREATE TABLE IF NOT EXISTS checkpoint_blocks (
+    block INTEGER PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# ─── Helpers ──────────────────────────────────────────────────────────────────
+
+def decode_transfer(log):
+    """(block, log_index, sender, recipient, value) of an ERC20 Transfer log."""
+    topics = log["topics"]
+    return (
+        log["blockNumber"],
+        log["logIndex"],
+        to_hex(address_bytes(topics[1])),
+        to_hex(address_bytes(topics[2])),
+        int.from_bytes(raw_bytes(log["data"])[:32], "big"),
+    )
+
+
+def find_deployment_block(w3, address, to_block):
+    """First block at which `address` has code, found by bisecting eth_getCode over [0, to_block]."""
+    if not w3.eth.get_code(address, block_identifier=to_block):
+        raise ValueError(f"no contract at {address} by block {to_block}")
+    low, high = 0, to_block
+    while low < high:
+        middle = (low + high) // 2
+        if w3.eth.get_code(address, block_identifier=middle):
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+def apply_transfer(balances, sender, recipient, value):
+    if sender != ZERO_ADDRESS:
+        balances[sender] -= value
+        if balances[sender] == 0:
+            del balances[sender]
+    if recipient != ZERO_ADDRESS:
+        balances[recipient] += value
+
+# ─── Ledger ───────────────────────────────────────────────────────────────────
+
+class TransferLedger:
+    """
+    Per-address balances of one ERC20 token rebuilt from its Transfer events and
+    kept in SQLite: every transfer, plus a full balance checkpoint every
+    CHECKPOINT_INTERVAL blocks. The balance of every holder at any scanned block
+    is the nearest checkpoint at or below it plus the transfers after it, so
+    historical snapshots need no RPC at all and new blocks only need their logs.
+
+    Without a `start_block`, the token's deployment block is found on the first
+    sync and kept in the ledger, so no run scans the empty history before it.
+    """
+
+    def __init__(self, path, token, start_block=None):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.token = Web3.to_checksum_address(token)
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+        if start_block is None:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = 'start_block'").fetchone()
+            start_block = int(row[0]) if row else None
+        self.start_block = start_block
+
+    def close(self):
+        self.conn.close()
+
+    # ── Scan position ──
+
+    def scanned_up_to(self):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'scanned_up_to'").fetchone()
+        return int(row[0]) if row else (self.start_block or 0) - 1
+
+    def _set_scanned_up_to(self, block):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('scanned_up_to', ?)", (str(block),)
+        )
+
+    # ── Reading ──
+
+    def _nearest_checkpoint(self, block):
+        row = self.conn.execute(
+            "SELECT MAX(block) FROM checkpoint_blocks WHERE block <= ?", (block,)
+        ).fetchone()
+        return row[0]
+
+    def balances_at(self, block):
+        """{lowercase address: raw balance} of every non-zero holder at `block`."""
+        if block > self.scanned_up_to():
+            raise ValueError(f"ledger only covers blocks up to {self.scanned_up_to()}, not {block}")
+
+        balances = defaultdict(int)
+        checkpoint = self._nearest_checkpoint(block)
+        if checkpoint is not None:
+            for address, balance in self.conn.execute(
+                "SELECT address, balance FROM checkpoints WHERE block = ?", (checkpoint,)
+            ):
+                balances[address] = int(balance)
+
+        for sender, recipient, value in self.conn.execute(
+            "SELECT sender, recipient, value FROM transfers WHERE block > ? AND block <= ? ORDER BY block, log_index",
+            (-1 if checkpoint is None else checkpoint, block),
+        ):
+            apply_transfer(balances, sender, recipient, int(value))
+
+        return {address: balance for address, balance in balances.items() if balance > 0}
+
+    def transfers(self, from_block, to_block):
+        """Yields (block, sender, recipient, value) of every transfer in (from_block, to_block], in chain order."""
+        if to_block > self.scanned_up_to():
+            raise ValueError(f"ledger only covers blocks up to {self.scanned_up_to()}, not {to_block}")
+        for block, sender, recipient, value in self.conn.execute(
+            "SELECT block, sender, recipient, value FROM transfers WHERE block > ? AND block <= ? ORDER BY block, log_index",
+            (from_block, to_block),
+        ):
+            yield block, sender, recipient, int(value)
+
+    # ── Syncing ──
+
+    def _write_checkpoint(self, block, balances):
+        self.conn.execute("INSERT OR REPLACE INTO checkpoint_blocks (block) VALUES (?)", (block,))
+        self.conn.execute("DELETE FROM checkpoints WHERE block = ?", (block,))
+        self.conn.executemany(
+            "INSERT INTO checkpoints (block, address, balance) VALUES (?, ?, ?)",
+            [(block, address, str(balance)) for address, balance in balances.items() if balance > 0],
+        )
+
+    def _resolve_start_block(self, w3, to_block):
+        print(f"Finding the deployment block of {self.token}...", file=sys.stderr)
+        self.start_block = find_deployment_block(w3, self.token, to_block)
+        self.conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('start_block', ?)", (str(self.start_block),)
+        )
+        self.conn.commit()
+        print(f"  ...deployed at block {self.start_block}", file=sys.stderr)
+
+    def sync(self, w3, to_block, window=DEFAULT_WINDOW, workers=DEFAULT_WORKERS):
+        """Scans the Transfer logs after `scanned_up_to()` through `to_block` into the ledger."""
+        if self.start_block is None:
+            self._resolve_start_block(w3, to_block)
+        from_block = self.scanned_up_to() + 1
+        if from_block > to_block:
+            return
+
+        print(f"Replaying {self.token} transfers from block {from_block} to {to_block}...", file=sys.stderr)
+        balances = defaultdict(int, self.balances_at(from_block - 1)) if from_block > self.start_block else defaultdict(int)
+        last = self._nearest_checkpoint(from_block - 1)
+        next_checkpoint = ((last if last is not None else self.start_block) // CHECKPOINT_INTERVAL + 1) * CHECKPOINT_INTERVAL
+
+        def on_logs(logs):
+            nonlocal next_checkpoint
+            rows = []
+            for log in logs:
+                if len(log["topics"]) < 3:
+                    continue
+                block, log_index, sender, recipient, value = decode_transfer(log)
+                # Checkpoints hold the balances at the end of their block
+                while block > next_checkpoint:
+                    self._write_checkpoint(next_checkpoint, balances)
+                    next_checkpoint += CHECKPOINT_INTERVAL
+                apply_transfer(balances, sender, recipient, value)
+                rows.append((block, log_index, sender, recipient, str(value)))
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO transfers (block, log_index, sender, recipient, value) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+
+        def on_progress(scanned_up_to):
+            nonlocal next_checkpoint
+            while scanned_up_to >= next_checkpoint:
+                self._write_checkpoint(next_checkpoint, balances)
+                next_checkpoint += CHECKPOINT_INTERVAL
+            self._set_scanned_up_to(scanned_up_to)
+            self.conn.commit()
+
+        scanner = LogScanner(w3, self.token, [TRANSFER_TOPIC], window=window, workers=workers)
+        scanner.scan(from_block, to_block, on_logs, on_progress=on_progress)
+        self.conn.commit()
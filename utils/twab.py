@@ -0,0 +1,119 @@
+from array import array
+from bisect import bisect_right
+from decimal import Context, Decimal
+
+# ─── Configuration ────────────────────────────────────────────────────────────
+
+# Significant digits of the average balances: enough to hold any uint256 exactly
+AVERAGE_CONTEXT = Context(prec=100)
+
+# ─── Balance Series ───────────────────────────────────────────────────────────
+
+class _Series:
+    """
+    One account's balance as change points: `blocks[i]` is the first block
+    whose post-state holds `values[i]`, which lasts until `blocks[i + 1]`.
+    """
+
+    __slots__ = ("blocks", "values", "prefix")
+
+    def __init__(self, block, value):
+        self.blocks = array("q", [block])
+        self.values = [value]
+        self.prefix = None
+
+    def set(self, block, value):
+        if block == self.blocks[-1]:
+            self.values[-1] = value   # several changes in one block: the last one holds
+        elif value != self.values[-1]:
+            self.blocks.append(block)
+            self.values.append(value)
+
+    def freeze(self, position):
+        """Running integral at every change point, in units of `position(block)`."""
+        self.prefix = [0]
+        for i in range(1, len(self.blocks)):
+            length = position(self.blocks[i]) - position(self.blocks[i - 1])
+            self.prefix.append(self.prefix[-1] + self.values[i - 1] * length)
+
+    def integral_to(self, block, position):
+        """Integral from the start of the series up to (not including) `block`."""
+        i = bisect_right(self.blocks, block) - 1
+        if i < 0:
+            return 0
+        return self.prefix[i] + self.values[i] * (position(block) - position(self.blocks[i]))
+
+# ─── Timeline ─────────────────────────────────────────────────────────────────
+
+class Timeline:
+    """
+    Piecewise-constant balances of many accounts from `start_block` on, built
+    from a base snapshot plus every change after it. Memory and build time grow
+    with the number of changes, not with blocks × accounts; after freeze(), the
+    integral of any account between any two blocks is two binary searches.
+
+    A balance "at block x" is the post-state of block x. With the default
+    clock every block weighs 1; with `clock(block) -> timestamp` it weighs the
+    seconds until the next block, so averages are time-weighted.
+    """
+
+    def __init__(self, start_block, base=None):
+        self.start_block = start_block
+        self.end_block = start_block
+        self.series = {}
+        self.changes = 0
+        self._position = None
+        for account, value in (base or {}).items():
+            self.series[account] = _Series(start_block, value)
+
+    def set(self, block, account, value):
+        """Records that `account` holds `value` from block `block` on. Blocks must not go backwards."""
+        if block < self.end_block:
+            raise ValueError(f"change at block {block} arrives after block {self.end_block}")
+        self.end_block = block
+        self.changes += 1
+        series = self.series.get(account)
+        if series is None:
+            # An account first seen in the range held nothing before it
+            series = self.series[account] = _Series(self.start_block, 0)
+        series.set(block, value)
+
+    def freeze(self, clock=None):
+        """Precomputes running integrals; `clock` maps a block to its timestamp for time weighting."""
+        if clock is None:
+            position = int
+        else:
+            cache = {}
+
+            def position(block):
+                if block not in cache:
+                    cache[block] = clock(block)
+                return cache[block]
+        self._position = position
+        for series in self.series.values():
+            series.freeze(position)
+        return self
+
+    def integral(self, account, from_block, to_block):
+        """Exact integral of `account`'s balance over the half-open block range [from_block, to_block)."""
+        if self._position is None:
+            raise RuntimeError("freeze() the timeline before integrating it")
+        if from_block < self.start_block or to_block < from_block:
+            raise ValueError(f"range [{from_block}, {to_block}) is not within the timeline from {self.start_block}")
+        series = self.series.get(account)
+        if series is None:
+            return 0
+        return series.integral_to(to_block, self._position) - series.integral_to(from_block, self._position)
+
+    def span(self, from_block, to_block):
+        """Total weight of [from_block, to_block): blocks, or seconds with a clock."""
+        return self._position(to_block) - self._position(from_block)
+
+    def averages(self, from_block, to_block):
+        """Yields (account, integral, average) for every account with a non-zero integral over the range."""
+        span = self.span(from_block, to_block)
+        for account in self.series:
+            integral = self.integral(account, from_block, to_block)
+            if integral:
+                average = AVERAGE_CONTEXT.divide(Decimal(integral), Decimal(span)) if span else Decimal(0)
+                yield account, integral, average
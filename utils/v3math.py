@@ -0,0 +1,115 @@
+from functools import lru_cache
+
+# ─── Constants ────────────────────────────────────────────────────────────────
+
+MIN_TICK = -887272
+MAX_TICK = 887272
+
+Q96 = 1 << 96
+MAX_UINT256 = (1 << 256) - 1
+
+# Multipliers used by TickMath.getSqrtRatioAtTick, one per bit of |tick|
+_TICK_RATIOS = [
+    (0x2,     0xfff97272373d413259a46990580e213a),
+    (0x4,     0xfff2e50f5f656932ef12357cf3c7fdcc),
+    (0x8,     0xffe5caca7e10e4e61c3624eaa0941cd0),
+    (0x10,    0xffcb9843d60f6159c9db58835c926644),
+    (0x20,    0xff973b41fa98c081472e6896dfb254c0),
+    (0x40,    0xff2ea16466c96a3843ec78b326b52861),
+    (0x80,    0xfe5dee046a99a2a811c461f1969c3053),
+    (0x100,   0xfcbe86c7900a88aedcffc83b479aa3a4),
+    (0x200,   0xf987a7253ac413176f2b074cf7815e54),
+    (0x400,   0xf3392b0822b70005940c7a398e4b70f3),
+    (0x800,   0xe7159475a2c29b7443b29c7fa6e889d9),
+    (0x1000,  0xd097f3bdfd2022b8845ad8f792aa5825),
+    (0x2000,  0xa9f746462d870fdf8a65dc1f90e061e5),
+    (0x4000,  0x70d869a156d2a1b890bb3df62baf32f7),
+    (0x8000,  0x31be135f97d08fd981231505542fcfa6),
+    (0x10000, 0x9aa508b5b7a84e1c677de54f3e99bc9),
+    (0x20000, 0x5d6af8dedb81196699c329225ee604),
+    (0x40000, 0x2216e584f5fa1ea926041bedfe98),
+    (0x80000, 0x48a170391f7dc42444e8fa2),
+]
+
+# ─── TickMath ─────────────────────────────────────────────────────────────────
+
+@lru_cache(maxsize=None)
+def get_sqrt_ratio_at_tick(tick: int) -> int:
+    """
+    Exact port of Uniswap V3 TickMath.getSqrtRatioAtTick: sqrt(1.0001^tick) as a
+    Q64.96 fixed point integer, rounded the same way as on chain. Memoized, since
+    the ticks of a pool's positions repeat heavily.
+    """
+    abs_tick = abs(tick)
+    if abs_tick > MAX_TICK:
+        raise ValueError(f"tick {tick} out of range")
+
+    ratio = 0xfffcb933bd6fad37aa2d162d1a594001 if abs_tick & 0x1 else 1 << 128
+    for bit, multiplier in _TICK_RATIOS:
+        if abs_tick & bit:
+            ratio = (ratio * multiplier) >> 128
+
+    if tick > 0:
+        ratio = MAX_UINT256 // ratio
+
+    # Q128.128 -> Q64.96, rounding up
+    return (ratio >> 32) + (0 if ratio % (1 << 32) == 0 else 1)
+
+# ─── LiquidityAmounts ─────────────────────────────────────────────────────────
+
+def get_amount0_for_liquidity(sqrt_a: int, sqrt_b: int, liquidity: int) -> int:
+    if sqrt_a > sqrt_b:
+        sqrt_a, sqrt_b = sqrt_b, sqrt_a
+    return ((liquidity << 96) * (sqrt_b - sqrt_a) // sqrt_b) // sqrt_a
+
+
+def get_amount1_for_liquidity(sqrt_a: int, sqrt_b: int, liquidity: int) -> int:
+    if sqrt_a > sqrt_b:
+        sqrt_a, sqrt_b = sqrt_b, sqrt_a
+    return liquidity * (sqrt_b - sqrt_a) // Q96
+
+
+def get_amounts_for_liquidity(sqrt_price: int, sqrt_a: int, sqrt_b: int, liquidity: int) -> tuple[int, int]:
+    """
+    Port of LiquidityAmounts.getAmountsForLiquidity: the raw token0/token1
+    amounts held by `liquidity` between sqrt_a and sqrt_b at sqrt_price.
+    """
+    if sqrt_a > sqrt_b:
+        sqrt_a, sqrt_b = sqrt_b, sqrt_a
+
+    if sqrt_price <= sqrt_a:
+        return get_amount0_for_liquidity(sqrt_a, sqrt_b, liquidity), 0
+    if sqrt_price < sqrt_b:
+        return (
+            get_amount0_for_liquidity(sqrt_price, sqrt_b, liquidity),
+            get_amount1_for_liquidity(sqrt_a, sqrt_price, liquidity),
+        )
+    return 0, get_amount1_for_liquidity(sqrt_a, sqrt_b, liquidity)
+
+
+def get_token_amounts_batch(
+    liquidities: list[int],
+    tick_lowers: list[int],
+    tick_uppers: list[int],
+    current_tick: int,
+    sqrt_price_x96: int = None,
+) -> tuple[list[int], list[int]]:
+    """
+    Raw token0/token1 amounts for many positions of one pool. The pool price is
+    `sqrt_price_x96` when known (slot0), otherwise the sqrt price at `current_tick`.
+    """
+    if sqrt_price_x96 is None:
+        sqrt_price_x96 = get_sqrt_ratio_at_tick(current_tick)
+
+    amounts0 = []
+    amounts1 = []
+    for liquidity, tick_lower, tick_upper in zip(liquidities, tick_lowers, tick_uppers):
+        amount0, amount1 = get_amounts_for_liquidity(
+            sqrt_price_x96,
+            get_sqrt_ratio_at_tick(tick_lower),
+            get_sqrt_ratio_at_tick(tick_upper),
+            liquidity,
+        )
+        amounts0.append(amount0)
+        amounts1.append(amount1)
+    return amounts0, amounts1
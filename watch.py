@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import os
+import sys
+
+import config.abis as abis
+import lending
+import usdm
+from utils import instrument
+from utils.addresses import address_bytes, checksum
+from utils.head_follower import DEFAULT_CONFIRMATIONS, DEFAULT_POLL_INTERVAL, HeadFollower
+from utils.multicall import BALANCE_OF, BatchCaller
+from utils.raw_call import RawFunction
+from utils.rpc_cache import close_cache
+from utils.transfer_ledger import TRANSFER_TOPIC
+
+# ─── Configuration ────────────────────────────────────────────────────────────
+
+SOURCES = ["troves", "usdm", "lending"]
+
+OUT_CHANGES = "json/watch_changes.ndjson"  # appended: one line per changed account or rollback
+OUT_SUMMARY = "json/watch_summary.json"    # rewritten after every poll
+
+TROVE_ACTIVE = 1  # Troves(owner).status of an open trove
+
+BORROWER_OPERATIONS = RawFunction.from_abi("troveManager", "borrowerOperationsAddress")
+
+# ─── Sources ──────────────────────────────────────────────────────────────────
+#
+# Each source refreshes a touched account with the same reads its batch script
+# makes, so watched values match a full snapshot taken at the same block.
+
+def _caller(source, block, **kwargs):
+    """
+    The source's BatchCaller pinned to `block`. It is built at the first read,
+    so the multicall probe runs once rather than once per block read.
+    """
+    if source.caller is None:
+        source.caller = BatchCaller(source.w3, block, **kwargs)
+    return source.caller.at(block)
+
+class TroveWatch:
+    """Open troves as {owner: (debt, collateral)}, refreshed on TroveUpdated."""
+
+    name = "troves"
+
+    def __init__(self, ctx):
+        self.ctx = ctx
+        self.w3 = ctx["w3"]
+        self.caller = None
+        self.trove_manager = ctx["trove_contract"].address
+        # TroveUpdated is emitted by BorrowerOperations on open/adjust/close and
+        # by the TroveManager on liquidation and redemption
+        borrower_operations = checksum(BORROWER_OPERATIONS.call(self.w3, self.trove_manager))
+        self.addresses = [self.trove_manager, borrower_operations]
+        self.topics = [abis.topic("troveManager", "TroveUpdated")]
+
+    def load(self, block):
+        return {owner: (debt, coll) for owner, debt, coll in usdm.iter_troves(self.ctx, block)}
+
+    def accounts(self, log):
+        return [address_bytes(log["topics"][1])]
+
+    def read(self, accounts, block):
+        troves = _caller(self, block).call_function(usdm.TROVES, self.trove_manager, ((owner,) for owner in accounts))
+        return {
+            owner: (debt, coll) if status == TROVE_ACTIVE else None
+            for owner, (debt, coll, _stake, status, _index) in zip(accounts, troves)
+        }
+
+
+class HolderWatch:
+    """Non-zero USDM balances as {holder: raw}, refreshed on Transfer."""
+
+    name = "usdm"
+
+    def __init__(self, ctx):
+        self.ctx = ctx
+        self.w3 = ctx["w3"]
+        self.caller = None
+        self.token = ctx["token_contract"].address
+        self.addresses = [self.token]
+        self.topics = [TRANSFER_TOPIC]
+
+    def load(self, block):
+        return {address_bytes(holder): raw for holder, raw in usdm.fetch_token_balances(self.ctx, block).items()}
+
+    def accounts(self, log):
+        touched = {address_bytes(log["topics"][1]), address_bytes(log["topics"][2])}
+        touched.discard(bytes(20))
+        return touched
+
+    def read(self, accounts, block):
+        balances = _caller(self, block).call_function(BALANCE_OF, self.token, ((a,) for a in accounts))
+        return {account: raw or None for account, raw in zip(accounts, balances)}
+
+
+class LendingWatch:
+    """
+    Lending positions as {user: (raw balance per token column)}, refreshed on
+    the LendingPool's Deposit, Withdraw, Borrow, Repay and LiquidationCall.
+    Balances of untouched users are as of their last refresh: interest accrued
+    since then shows up on their next action or in the next full snapshot.
+    """
+
+    name = "lending"
+
+    # Topic index of the affected user in each event
+    EVENTS = {"Deposit": 2, "Withdraw": 2, "Borrow": 2, "Repay": 2, "LiquidationCall": 3}
+
+    def __init__(self, ctx):
+        self.ctx = ctx
+        self.w3 = ctx["w3"]
+        self.caller = None
+        self.columns = [(symbol, kind) for symbol, _ in ctx["reserve_list"] for kind in lending.KINDS]
+        self.tokens = [ctx["token_contracts"][column].address for column in self.columns]
+        self.user_topic = {abis.topic("lendingPool", event): i for event, i in self.EVENTS.items()}
+        self.addresses = [ctx["lending_pool"]]
+        self.topics = list(self.user_topic)
+
+    def load(self, block):
+        depositors = lending.snapshot_depositors(self.ctx, block)
+        matrix = lending.fetch_balance_matrix(self.ctx, depositors, block)
+        column_index = {column: i for i, column in enumerate(self.columns)}
+        rows = {}
+        for user, column, raw in matrix.entries():
+            row = rows.setdefault(address_bytes(user), [0] * len(self.columns))
+            row[column_index[column]] = raw
+        return {user: tuple(row) for user, row in rows.items()}
+
+    def accounts(self, log):
+        topics = log["topics"]
+        return [address_bytes(topics[self.user_topic["0x" + bytes(topics[0]).hex()]])]
+
+    def read(self, accounts, block):
+        calls = [(token, BALANCE_OF.encode(user)) for user in accounts for token in self.tokens]
+        caller = _caller(self, block, batch_size=lending.MULTICALL_BATCH, multicall_address=lending.MULTICALL_ADDRESS)
+        balances = caller.call_uint256(calls)
+        width = len(self.tokens)
+        return {
+            user: row if any(row) else None
+            for user, row in ((user, tuple(balances[i * width:(i + 1) * width])) for i, user in enumerate(accounts))
+        }
+
+# ─── Output ───────────────────────────────────────────────────────────────────
+
+def _jsonable(value):
+    if value is None:
+        return None
+    if isinstance(value, tuple):
+        return [str(v) for v in value]
+    return str(value)
+
+
+class ChangeFeed:
+    """Appends every change and rollback to an NDJSON file, flushed after each poll."""
+
+    def __init__(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.file = open(path, "a")
+        self.changes = 0
+
+    def change(self, block, source, account, value):
+        self.changes += 1
+        self.file.write(json.dumps({
+            "block": block, "source": source, "account": checksum(account), "value": _jsonable(value),
+        }) + "\n")
+
+    def rollback(self, from_block, to_block):
+        self.file.write(json.dumps({"rollback": {"from": from_block, "to": to_block}}) + "\n")
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+def write_summary(follower, head, path=OUT_SUMMARY):
+    summary = {
+        "block": follower.block,
+        "hash": "0x" + follower.hash.hex(),
+        "head": head,
+        "rollbacks": follower.rollbacks,
+        "accounts": {name: len(state) for name, state in follower.state.items()},
+    }
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(summary, f, indent=4)
+    os.replace(tmp, path)
+
+# ─── Main ─────────────────────────────────────────────────────────────────────
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Follow new blocks and keep trove, USDM holder and lending state current, "
+                    "re-reading only the accounts each block's logs touch."
+    )
+    parser.add_argument("--sources", nargs="+", choices=SOURCES, default=SOURCES)
+    parser.add_argument(
+        "--start", type=int,
+        help="block to load the full state at (default: the newest block CONFIRMATIONS deep)",
+    )
+    parser.add_argument(
+        "--confirmations", type=int, default=DEFAULT_CONFIRMATIONS,
+        help=f"reorg depth that is rolled back; deeper reorgs stop the watch (default: {DEFAULT_CONFIRMATIONS})",
+    )
+    parser.add_argument(
+        "--interval", type=float, default=DEFAULT_POLL_INTERVAL,
+        help=f"seconds between head polls (default: {DEFAULT_POLL_INTERVAL})",
+    )
+    parser.add_argument("--until", type=int, help="stop once this block has been applied")
+    parser.add_argument(
+        "--rpc", nargs="+",
+        help="RPC endpoints to follow instead of the scripts' own, e.g. a local dev chain "
+             "forked from mainnet (anvil --fork-url ...)",
+    )
+    parser.add_argument("--changes", default=OUT_CHANGES, help=f"change feed file (default: {OUT_CHANGES})")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    w3 = lending.get_provider(args.rpc or lending.RPC_URLS)
+
+    sources = []
+    if {"troves", "usdm"} & set(args.sources):
+        usdm_ctx = usdm.setup(w3)
+        if "troves" in args.sources:
+            sources.append(TroveWatch(usdm_ctx))
+        if "usdm" in args.sources:
+            sources.append(HolderWatch(usdm_ctx))
+    if "lending" in args.sources:
+        sources.append(LendingWatch(lending.setup(w3)))
+
+    feed = ChangeFeed(args.changes)
+    follower = HeadFollower(w3, sources, args.confirmations, on_change=feed.change, on_rollback=feed.rollback)
+    start = args.start if args.start is not None else w3.eth.block_number - args.confirmations
+    follower.start(start)
+
+    def on_poll(applied):
+        feed.flush()
+        write_summary(follower, w3.eth.block_number)
+        if applied:
+            print(f"Block {follower.block}: {applied} new, {feed.changes} changes so far")
+
+    print(f"Following from block {start} with {args.confirmations} confirmations; changes go to {args.changes}")
+    try:
+        follower.run(args.interval, until=args.until, on_poll=on_poll)
+    except KeyboardInterrupt:
+        print("\nStopped", file=sys.stderr)
+    finally:
+        feed.close()
+        close_cache(w3)
+        instrument.write_report("json/perf_report_watch.json")
+
+
+if __name__ == "__main__":
+    main()